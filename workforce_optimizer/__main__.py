@@ -0,0 +1,11 @@
+# __main__.py
+"""``python -m workforce_optimizer <command>``: the headless front end in lib/cli.py."""
+import os
+import sys
+
+# lib/ is imported as a top-level package, the same as when main.py is run
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from lib.cli import main  # noqa: E402
+
+sys.exit(main())
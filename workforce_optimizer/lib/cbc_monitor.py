@@ -0,0 +1,227 @@
+# cbc_monitor.py
+import functools
+import logging
+import os
+import re
+import signal
+import subprocess
+import threading
+
+try:
+    import pty
+except ImportError:  # Windows
+    pty = None
+
+import pulp
+from pulp import PULP_CBC_CMD, PulpSolverError, constants
+
+from .log_utils import TRACE
+
+
+class SolveCancelled(Exception):
+    """Raised when a running CBC solve is cancelled from another thread."""
+
+
+_NUMBER = r"(-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)"
+_INTEGER_SOLUTION = re.compile(r"Integer solution of " + _NUMBER)
+_NODE_PROGRESS = re.compile(_NUMBER + r" best solution, best possible " + _NUMBER)
+_CONTINUOUS_OBJECTIVE = re.compile(r"Continuous objective value is " + _NUMBER)
+
+# solve_CBC below follows COIN_CMD.solve_CBC of this PuLP release and calls
+# its private helpers (create_tmp_files, writesol, getOptions, readsol_MPS);
+# any other version solves through the stock PULP_CBC_CMD instead.
+PULP_VERSION = "3.3.2"
+
+# Windows cannot interrupt CBC so that it writes out its incumbent (it only
+# traps Ctrl+C, which cannot be sent to a single child process), so there a
+# stop request kills the solve like a cancel.
+CAN_STOP_EARLY = os.name != "nt"
+
+
+@functools.lru_cache(maxsize=None)
+def _pulp_supported():
+    if pulp.__version__ == PULP_VERSION:
+        return True
+    logging.warning("PuLP %s is installed but the CBC monitor follows PuLP %s; "
+                    "solving without progress, stop or cancel", pulp.__version__, PULP_VERSION)
+    return False
+
+
+class MonitoredCBC(PULP_CBC_CMD):
+    """
+    ``PULP_CBC_CMD`` that keeps a handle on the CBC process, reads its log as it
+    is written and can be cancelled or stopped early from another thread.
+
+    ``on_progress(kind, data)`` is called from the solving thread with
+    ``kind`` ``"incumbent"`` (a new integer solution) or ``"bound"`` (node log
+    line). ``data`` holds ``objective``, ``bound`` and ``gap`` in the problem's
+    own sense (CBC prints a maximisation negated); any of them may be ``None``.
+
+    Setting ``cancel_event`` kills CBC and ``solve`` raises
+    :class:`SolveCancelled`. Setting ``stop_event`` asks CBC to finish with its
+    current incumbent (SIGINT, which CBC handles like hitting the time limit);
+    where :data:`CAN_STOP_EARLY` is false (Windows) it behaves like a cancel.
+
+    With a PuLP other than :data:`PULP_VERSION` the solve falls back to
+    ``PULP_CBC_CMD.solve_CBC``: no progress, and the events are only checked
+    before and after CBC runs.
+    """
+
+    def __init__(self, *args, on_progress=None, cancel_event=None, stop_event=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_progress = on_progress
+        self.cancel_event = cancel_event if cancel_event is not None else threading.Event()
+        self.stop_event = stop_event if stop_event is not None else threading.Event()
+        self.process = None
+        self.objective = None
+        self.bound = None
+        self._sense = 1
+
+    def cancel(self):
+        """Kill the running solve; ``solve`` then raises :class:`SolveCancelled`."""
+        self.cancel_event.set()
+
+    def stop(self):
+        """Finish the running solve with the best integer solution found so far."""
+        self.stop_event.set()
+
+    def _watch(self, proc):
+        interrupted = False
+        while proc.poll() is None:
+            if self.cancel_event.wait(0.2) or (self.stop_event.is_set() and not CAN_STOP_EARLY):
+                if proc.poll() is None:
+                    logging.info("Killing CBC (pid %d)", proc.pid)
+                    proc.kill()
+                self.cancel_event.set()
+                return
+            if self.stop_event.is_set() and not interrupted and proc.poll() is None:
+                logging.info("Interrupting CBC (pid %d) to use the current incumbent", proc.pid)
+                proc.send_signal(signal.SIGINT)
+                interrupted = True
+
+    # ------------------------------------------------------------------
+    # Log parsing
+    # ------------------------------------------------------------------
+    def _emit(self, kind):
+        if self.on_progress is None:
+            return
+        gap = None
+        if self.objective is not None and self.bound is not None:
+            gap = abs(self.bound - self.objective) / max(abs(self.objective), 1e-9)
+        self.on_progress(kind, {"objective": self.objective, "bound": self.bound, "gap": gap})
+
+    def _parse_line(self, line):
+        m = _INTEGER_SOLUTION.search(line)
+        if m:
+            self.objective = self._sense * float(m.group(1))
+            self._emit("incumbent")
+            return
+        m = _NODE_PROGRESS.search(line)
+        if m:
+            self.objective = self._sense * float(m.group(1))
+            self.bound = self._sense * float(m.group(2))
+            self._emit("bound")
+            return
+        m = _CONTINUOUS_OBJECTIVE.search(line)
+        if m:
+            # LP relaxation value: the first bound on the MIP objective
+            self.bound = float(m.group(1))
+            self._emit("bound")
+
+    # ------------------------------------------------------------------
+    # Solve (mirrors COIN_CMD.solve_CBC for the MPS path)
+    # ------------------------------------------------------------------
+    def solve_CBC(self, lp, use_mps=True):
+        if not self.executable(self.path):
+            raise PulpSolverError(f"Pulp: cannot execute {self.path} cwd: {os.getcwd()}")
+        if self.cancel_event.is_set():
+            raise SolveCancelled()
+        if not _pulp_supported():
+            status = super().solve_CBC(lp, use_mps)
+            if self.cancel_event.is_set():
+                raise SolveCancelled()
+            return status
+        tmpLp, tmpMps, tmpSol, tmpMst = self.create_tmp_files(lp.name, "lp", "mps", "sol", "mst")
+        vs, variablesNames, constraintsNames, _ = lp.writeMPS(tmpMps, rename=1)
+        args = [self.path, tmpMps]
+        self._sense = 1
+        if lp.sense == constants.LpMaximize:
+            args.append("-max")
+            self._sense = -1
+        self.objective = self.bound = None
+        if self.optionsDict.get("warmStart", False):
+            self.writesol(tmpMst, lp, vs, variablesNames, constraintsNames)
+            args += ["-mips", tmpMst]
+        if self.timeLimit is not None:
+            args += ["-sec", str(self.timeLimit)]
+        if self.optionsDict.get("presolve") is not None:
+            args += ["-presolve", "on" if self.optionsDict["presolve"] else "off"]
+        if self.optionsDict.get("cuts") is not None:
+            args += (["-gomory", "on", "knapsack", "on", "probing", "on"]
+                     if self.optionsDict["cuts"] else ["-cuts", "off"])
+        for option in self.options + self.getOptions():
+            args += ("-" + option).split()
+        args += ["-solve", "-printingOptions", "all", "-solution", tmpSol]
+        logging.debug("CBC command: %s", " ".join(args))
+
+        returncode = self._run(args)
+        if self.cancel_event.is_set():
+            self.delete_tmp_files(tmpMps, tmpLp, tmpSol, tmpMst)
+            raise SolveCancelled()
+        if returncode != 0:
+            raise PulpSolverError("Pulp: Error while trying to execute " + self.path)
+        if not os.path.exists(tmpSol):
+            raise PulpSolverError("Pulp: Error while executing " + self.path)
+        status, values, reducedCosts, shadowPrices, slacks, sol_status = self.readsol_MPS(
+            tmpSol, lp, vs, variablesNames, constraintsNames
+        )
+        lp.assignVarsVals(values)
+        lp.assignVarsDj(reducedCosts)
+        lp.assignConsPi(shadowPrices)
+        lp.assignConsSlack(slacks, activity=True)
+        lp.assignStatus(status, sol_status)
+        self.delete_tmp_files(tmpMps, tmpLp, tmpSol, tmpMst)
+        return status
+
+    def _run(self, args):
+        """Run CBC, feeding every log line to the parser; returns the exit code."""
+        if pty is not None:
+            # A pseudo-terminal keeps CBC's stdout line-buffered; through a
+            # plain pipe the log only arrives when the buffer fills or CBC exits
+            master, slave = pty.openpty()
+            try:
+                proc = subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=slave, stderr=slave)
+            except Exception:
+                os.close(master)
+                raise
+            finally:
+                os.close(slave)
+            log = os.fdopen(master, "r", errors="replace")
+        else:
+            popen_kwargs = {}
+            if os.name == "nt":
+                # No console window flashing up from the GUI
+                startupinfo = subprocess.STARTUPINFO()
+                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+                popen_kwargs["startupinfo"] = startupinfo
+            proc = subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT, text=True, errors="replace",
+                                    **popen_kwargs)
+            log = proc.stdout
+        self.process = proc
+        threading.Thread(target=self._watch, args=(proc,), daemon=True).start()
+        try:
+            for line in log:
+                logging.log(TRACE, "CBC: %s", line.rstrip())
+                self._parse_line(line)
+        except OSError:
+            pass  # EIO on the pty master once CBC has exited
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            log.close()
+            returncode = proc.wait()
+            # the watcher notices the exit on its next poll; no need to wait for it
+            self.process = None
+        return returncode
@@ -0,0 +1,134 @@
+# charts.py
+import tkinter as tk
+
+import numpy as np
+
+EMPLOYEES_PER_PAGE = 40
+COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
+
+
+class ScheduleCharts(tk.Frame):
+    """
+    The four Visualizations charts on one matplotlib figure, created on first
+    use and reused for every later schedule.
+
+    matplotlib is imported here, when the panel is first built, not at start-up.
+    New data is written into the existing bars (height and stack offset) when
+    the number of bars and series is unchanged; otherwise the axes are cleared
+    and redrawn. The per-employee charts show ``EMPLOYEES_PER_PAGE`` employees
+    at a time with Previous / Next buttons, so the figure does not grow with
+    the roster.
+    """
+
+    def __init__(self, parent, per_page=EMPLOYEES_PER_PAGE, **kwargs):
+        super().__init__(parent, **kwargs)
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        self.per_page = per_page
+        self.page = 0
+        self._employees = []
+        self._week_counts = self._area_counts = None
+        self._week_labels = self._areas = []
+        self._bars = {}   # axes -> (labels, series names, [BarContainer])
+
+        nav = tk.Frame(self)
+        nav.pack(fill="x")
+        self.prev_button = tk.Button(nav, text="◀ Previous", command=lambda: self.show_page(self.page - 1))
+        self.prev_button.pack(side="left", padx=5)
+        self.page_label = tk.Label(nav)
+        self.page_label.pack(side="left", padx=5)
+        self.next_button = tk.Button(nav, text="Next ▶", command=lambda: self.show_page(self.page + 1))
+        self.next_button.pack(side="left", padx=5)
+
+        self.figure = Figure(figsize=(15, 10))
+        grid = self.figure.add_gridspec(2, 2, width_ratios=[3, 1], height_ratios=[1, 1])
+        self.axs = np.array([[self.figure.add_subplot(grid[r, c]) for c in range(2)] for r in range(2)])
+        self.canvas = FigureCanvasTkAgg(self.figure, self)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+
+    @property
+    def num_pages(self):
+        return max(1, -(-len(self._employees) // self.per_page))
+
+    def show(self, summary):
+        """Chart a :class:`~lib.reports.ScheduleSummary`; employees without shifts are left out."""
+        active = summary.active
+        self._employees = [e for e, a in zip(summary.employees, active) if a]
+        self._week_counts = summary.employee_week[active]
+        self._area_counts = summary.employee_area[active]
+        self._week_labels = summary.week_labels
+        self._areas = list(summary.areas)
+        # Totals cover every employee, not just the page shown
+        self._draw_bars(self.axs[0, 1], self._week_labels, summary.per_week[None, :], None,
+                        'Total Shifts per Week', colors=[COLORS[:len(self._week_labels)]])
+        self._draw_bars(self.axs[1, 1], self._areas, summary.per_area[None, :], None,
+                        'Total Shifts per Area', colors=[COLORS[:len(self._areas)]])
+        self.show_page(0)
+
+    def show_page(self, page):
+        page = min(max(page, 0), self.num_pages - 1)
+        self.page = page
+        rows = slice(page * self.per_page, (page + 1) * self.per_page)
+        names = self._employees[rows]
+        self._draw_bars(self.axs[0, 0], names, self._week_counts[rows].T, self._week_labels,
+                        'Shifts per Employee (by Week)', rotate=True)
+        self._draw_bars(self.axs[1, 0], names, self._area_counts[rows].T, self._areas,
+                        'Shifts per Employee (by Area)', rotate=True)
+        first = page * self.per_page + 1 if names else 0
+        self.page_label.configure(text=f"Employees {first}–{first + len(names) - 1 if names else 0}"
+                                       f" of {len(self._employees)}")
+        self.prev_button.configure(state="normal" if page > 0 else "disabled")
+        self.next_button.configure(state="normal" if page < self.num_pages - 1 else "disabled")
+        self.canvas.draw_idle()
+
+    def _draw_bars(self, ax, labels, series, series_names, title, colors=None, rotate=False):
+        """Stacked bars, one stack per label and one layer per row of ``series``."""
+        labels = [str(label) for label in labels]
+        series = np.asarray(series, dtype=float).reshape(len(series_names or [None]), len(labels))
+        if colors is None:
+            colors = [COLORS[i % len(COLORS)] for i in range(len(series))]
+        cached = self._bars.get(ax)
+        if cached is not None and len(cached[0]) == len(labels) and cached[1] == series_names:
+            # Same shape: move the existing rectangles
+            bottom = np.zeros(len(labels))
+            for container, data in zip(cached[2], series):
+                for rect, height, y in zip(container, data, bottom):
+                    rect.set_height(height)
+                    rect.set_y(y)
+                bottom += data
+            if cached[0] != labels:
+                ax.set_xticks(range(len(labels)), labels)
+            self._bars[ax] = (labels, series_names, cached[2])
+            ax.relim()
+            ax.autoscale_view()
+            return
+        ax.clear()
+        containers = []
+        bottom = np.zeros(len(labels))
+        x = np.arange(len(labels))
+        for i, data in enumerate(series):
+            label = series_names[i] if series_names else None
+            containers.append(ax.bar(x, data, bottom=bottom, color=colors[i], label=label))
+            bottom += data
+        ax.set_xticks(x, labels)
+        ax.set_title(title)
+        if series_names:
+            ax.legend()
+        if rotate:
+            ax.tick_params(axis='x', rotation=45, labelsize=8)
+        self._bars[ax] = (labels, series_names, containers)
+        self._resize()
+
+    def _resize(self):
+        """Fit the figure to the page width (as many inches as the old per-roster figure)."""
+        width = max(10, len(self._employees[:self.per_page]) * 0.5) + 5
+        self.figure.set_size_inches(width, 10)
+        w, h = self.figure.bbox.size
+        self.canvas.get_tk_widget().configure(width=int(w), height=int(h))
+        self.figure.tight_layout()
+
+    def close(self):
+        """Drop the figure's artists and the widget."""
+        self.figure.clear()
+        self._bars.clear()
+        self.destroy()
@@ -0,0 +1,134 @@
+# cli.py
+"""
+Command line front end: ``python -m workforce_optimizer solve|summarize|compare|serve ...``.
+
+``solve`` runs the loader, the solver and the schedule CSV writers without
+importing tkinter, and prints one JSON object (status, sizes, files, timings)
+on stdout. The exit code is 0 when a schedule was produced and 1 otherwise.
+``summarize`` reads saved schedule files back and prints the same counts
+without solving. ``compare`` reports the assignments added and removed
+between two saved schedules. ``serve`` starts the local job service in lib/service.py.
+"""
+import argparse
+import datetime
+import json
+import logging
+import sys
+
+from .log_utils import parse_log_level
+
+FORMATS = ("csv", "xlsx", "parquet", "rosters")   # lib.exporter.FORMATS, without importing pandas here
+
+
+def _date(value):
+    for fmt in ("%Y-%m-%d", "%m/%d/%Y"):
+        try:
+            return datetime.datetime.strptime(value, fmt).date()
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError(f"invalid date '{value}' (use YYYY-MM-DD or MM/DD/YYYY)")
+
+
+def _positive_int(value):
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return n
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m workforce_optimizer",
+                                     description="Workforce Optimizer without the window.")
+    parser.add_argument("--log-level", default="WARNING",
+                        help="TRACE, DEBUG, INFO, WARNING or ERROR (logged to stderr; default WARNING)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solve = commands.add_parser("solve", help="solve a schedule from the three input CSV files")
+    solve.add_argument("--emp", required=True, help="Employee_Data CSV")
+    solve.add_argument("--req", required=True, help="Personnel_Required CSV")
+    solve.add_argument("--limits", required=True, help="Hard_Limits CSV")
+    solve.add_argument("--start", required=True, type=_date, help="first day (YYYY-MM-DD or MM/DD/YYYY)")
+    solve.add_argument("--weeks", type=_positive_int, default=2, help="number of weeks (default 2)")
+    solve.add_argument("--out", help="folder for the area schedule CSVs (default: the app's output folder)")
+    solve.add_argument("--format", dest="formats", action="append", choices=FORMATS,
+                       help="output format, may be repeated: csv (one file per area), xlsx (one "
+                            "workbook), parquet (assignment table) or rosters (zip of per-employee "
+                            "ICS and CSV files); default csv")
+    solve.add_argument("--no-write", action="store_true", help="solve only, write no files")
+    solve.add_argument("--warm-start", nargs="+", metavar="FILE",
+                       help="saved schedule file(s) (area CSVs, workbook or assignment table) "
+                            "to start the solver from, e.g. the previous period")
+    solve.add_argument("--progress", action="store_true",
+                       help="print solver events as JSON lines on stderr")
+    solve.set_defaults(func=run_solve)
+
+    summarize = commands.add_parser("summarize", help="report on saved schedule files without solving")
+    summarize.add_argument("files", nargs="+", help="area schedule CSVs, a workbook or an assignment table")
+    summarize.set_defaults(func=run_summarize)
+
+    compare = commands.add_parser("compare", help="report the changes between two saved schedules")
+    compare.add_argument("--before", nargs="+", required=True, metavar="FILE",
+                         help="the earlier schedule (area CSVs, a workbook or an assignment table)")
+    compare.add_argument("--after", nargs="+", required=True, metavar="FILE", help="the later schedule")
+    compare.add_argument("--align", choices=("date", "weekday"),
+                         help="match days by date or by weekday (default: by date when the "
+                              "schedules overlap, else by weekday, e.g. against the previous period)")
+    compare.add_argument("--changes", metavar="FILE", help="also write one CSV row per changed assignment")
+    compare.set_defaults(func=run_compare)
+
+    serve = commands.add_parser("serve", help="run the local HTTP/JSON scheduling service")
+    serve.add_argument("--host", default="127.0.0.1", help="address to listen on (default 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765, help="port (default 8765)")
+    serve.add_argument("--workers", type=_positive_int, default=2,
+                       help="solves run at the same time (default 2)")
+    serve.add_argument("--max-queue", type=_positive_int, default=32,
+                       help="queued jobs before new ones are refused with 503 (default 32)")
+    serve.add_argument("--store", help="job folder (default: 'jobs' in the app's output folder)")
+    serve.set_defaults(func=run_serve)
+    return parser
+
+
+def _emit(report):
+    json.dump(report, sys.stdout, indent=2, default=str)
+    sys.stdout.write("\n")
+
+
+def run_solve(args):
+    from .pipeline import solve_files, SUCCESS_STATUSES
+
+    def progress(event):
+        print(json.dumps(event.to_dict(), default=str), file=sys.stderr, flush=True)
+
+    report = solve_files(args.emp, args.req, args.limits, args.start, args.weeks, out_dir=args.out,
+                         write=not args.no_write, formats=tuple(args.formats or ("csv",)),
+                         progress=progress if args.progress else None, warm_start=args.warm_start)
+    _emit({"command": "solve", **report})
+    return 0 if report["status"] in SUCCESS_STATUSES else 1
+
+
+def run_summarize(args):
+    from .pipeline import summarize_files
+    report = summarize_files(args.files)
+    _emit({"command": "summarize", **report})
+    return 0 if report["status"] == "loaded" else 1
+
+
+def run_compare(args):
+    from .pipeline import compare_files
+    report = compare_files(args.before, args.after, args.align, args.changes)
+    _emit({"command": "compare", **report})
+    return 0 if report["status"] == "compared" else 1
+
+
+def run_serve(args):
+    from .service import JobService, serve
+    service = JobService(args.store, workers=args.workers, max_queue=args.max_queue)
+    serve(service, args.host, args.port)
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=parse_log_level(args.log_level, logging.WARNING), stream=sys.stderr,
+                        format="%(asctime)s %(levelname)s %(message)s")
+    return args.func(args)
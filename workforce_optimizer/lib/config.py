@@ -2,9 +2,7 @@
 import json
 import os
 import logging
-import tkinter as tk
-from tkinter import messagebox
-import matplotlib.pyplot as plt
+import sys
 import threading
 
 def load_config(root, emp_file_var, req_file_var, limits_file_var):
@@ -49,7 +47,9 @@ def on_closing(emp_file_var, req_file_var, limits_file_var, root):
     logging.debug("Starting application shutdown")
     try:
         save_config(emp_file_var, req_file_var, limits_file_var, root)
-        plt.close('all')
+        plt = sys.modules.get("matplotlib.pyplot")  # only if something imported it
+        if plt is not None:
+            plt.close('all')
         active_threads = [t for t in threading.enumerate() if t is not threading.main_thread()]
         if active_threads:
             logging.warning(f"Active threads detected during shutdown: {[t.name for t in active_threads]}")
@@ -57,6 +57,7 @@ def on_closing(emp_file_var, req_file_var, limits_file_var, root):
         logging.info("Application closed successfully")
     except Exception as e:
         logging.error(f"Error during shutdown: {e}")
+        from tkinter import messagebox
         messagebox.showerror("Error", f"Failed to close application cleanly: {e}")
         root.destroy()  
     finally:
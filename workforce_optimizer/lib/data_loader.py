@@ -1,16 +1,48 @@
 import pandas as pd
-from datetime import datetime
 import logging
-from tkinter import messagebox
-
-def load_csv(emp_file, req_file, limits_file, start_date, num_weeks_var):
-    logging.debug("Entering load_csv with emp_file=%s, req_file=%s, limits_file=%s", emp_file, req_file, limits_file)
-    invalid_dates = []
+from .log_utils import log_frame, log_mapping
+from .validation import validate_frames, errors_only, format_issues
+
+
+class InputError(ValueError):
+    """
+    The input files cannot be used. ``issues`` holds the
+    :class:`~lib.validation.ValidationIssue` errors behind it (empty when the
+    problem is not tied to a cell, e.g. an unreadable file).
+    """
+
+    def __init__(self, message, issues=()):
+        super().__init__(message)
+        self.issues = list(issues)
+
+
+def load_inputs(emp_file, req_file, limits_file, start_date, num_weeks_var, warnings=None):
+    """
+    Read and check the three input CSVs; returns the tuple the solver takes.
+    Raises :class:`InputError` on bad input. Non-fatal problems are logged and,
+    if ``warnings`` is a list, appended to it as ``ValidationIssue`` objects.
+    No GUI here: the window goes through :func:`load_csv`.
+    """
+    logging.debug("Entering load_inputs with emp_file=%s, req_file=%s, limits_file=%s", emp_file, req_file, limits_file)
     try:
-        # === Load Employee Data ===
+        # === Read and validate all three files in one pass ===
         emp_df = pd.read_csv(emp_file, index_col=0)
+        limits_df = pd.read_csv(limits_file)
+        req_df = pd.read_csv(req_file, index_col=0)
+        issues = validate_frames(emp_df, req_df, limits_df)
+        for issue in issues:
+            if issue.severity != "error":
+                logging.warning("%s", issue)
+                if warnings is not None:
+                    warnings.append(issue)
+        errors = errors_only(issues)
+        if errors:
+            raise InputError(f"{len(errors)} problem(s) found in the input files:\n"
+                             + format_issues(errors, limit=25), errors)
+
+        # === Load Employee Data ===
         emp_df.index = emp_df.index.astype(str).str.strip().str.lower()
-        logging.debug("Employee Data CSV loaded: %s", emp_df.to_string())
+        log_frame("Employee Data CSV loaded", emp_df)
 
         if emp_df.index.isna().any() or "" in emp_df.index:
             raise ValueError("Employee_Data.csv has invalid or missing index values")
@@ -19,11 +51,10 @@ def load_csv(emp_file, req_file, limits_file, start_date, num_weeks_var):
         employees = sorted(raw_cols, key=lambda x: str(x).strip().lower())
         if not employees:
             raise ValueError("No valid employee columns found in Employee_Data.csv")
-        logging.debug("Employees: %s", employees)
+        log_mapping("Employees", employees)
 
         # === Load Hard Limits (to get Shifts & Work Areas) ===
-        limits_df = pd.read_csv(limits_file)
-        logging.debug("Hard Limits CSV loaded: %s", limits_df.to_string())
+        log_frame("Hard Limits CSV loaded", limits_df)
         if limits_df.empty:
             raise ValueError("Hard_Limits.csv is empty")
 
@@ -60,7 +91,7 @@ def load_csv(emp_file, req_file, limits_file, start_date, num_weeks_var):
                 work_areas[emp] = [area]
             else:
                 raise ValueError(f"Invalid or missing work area for {emp}: '{area}' (valid: {areas})")
-        logging.debug("Work areas: %s", work_areas)
+        log_mapping("Work areas", work_areas)
 
         # === Shift Preferences ===
         shift_prefs = {}
@@ -76,7 +107,7 @@ def load_csv(emp_file, req_file, limits_file, start_date, num_weeks_var):
                     shift_prefs[emp][matched] = 10
                 else:
                     logging.warning("Invalid shift preference '%s' for %s", shift, emp)
-        logging.debug("Shift preferences: %s", shift_prefs)
+        log_mapping("Shift preferences", shift_prefs)
 
         # === Day Preferences ===
         days = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
@@ -103,17 +134,11 @@ def load_csv(emp_file, req_file, limits_file, start_date, num_weeks_var):
                 off_str = emp_df.loc[must_off_row, emp]
                 if pd.notna(off_str):
                     try:
+                        # unparseable dates were reported by validate_frames
                         off_dates = [(emp, d.strip()) for d in str(off_str).split(", ")]
-                        for _, d in off_dates:
-                            try:
-                                datetime.strptime(d, "%m/%d/%Y")
-                            except ValueError:
-                                invalid_dates.append(f"{emp}: {d}")
                         must_off[emp] = off_dates
                     except Exception as e:
                         logging.warning("Failed to parse must-off for %s: %s", emp, str(e))
-        if invalid_dates:
-            messagebox.showwarning("Invalid Dates", "Invalid must-off dates:\n" + "\n".join(invalid_dates))
 
         # === Min/Max Shifts per Week ===
         def safe_int(val, default, name, emp):
@@ -145,8 +170,7 @@ def load_csv(emp_file, req_file, limits_file, start_date, num_weeks_var):
             max_weekend_days[emp] = safe_int(emp_df.loc[weekend_row, emp], 2, "max weekend days", emp)
 
         # === Personnel Required (must have row per area) ===
-        req_df = pd.read_csv(req_file, index_col=0)
-        logging.debug("Personnel Required CSV loaded: %s", req_df.to_string())
+        log_frame("Personnel Required CSV loaded", req_df)
 
         if req_df.index.isna().any() or "" in req_df.index:
             raise ValueError("Personnel_Required.csv has invalid or missing index")
@@ -186,7 +210,27 @@ def load_csv(emp_file, req_file, limits_file, start_date, num_weeks_var):
             required, work_areas, constraints, min_shifts, max_shifts, max_weekend_days
         )
 
+    except InputError as e:
+        logging.error("Failed to load CSV files: %s", str(e))
+        raise
     except Exception as e:
         logging.error("Failed to load CSV files: %s", str(e))
+        raise InputError(str(e)) from e
+
+
+def load_csv(emp_file, req_file, limits_file, start_date, num_weeks_var):
+    """
+    Tk adapter over :func:`load_inputs`: invalid must-off dates are shown in a
+    warning box, failures in an error box, and ``None`` is returned on failure.
+    """
+    from tkinter import messagebox
+    warnings = []
+    try:
+        inputs = load_inputs(emp_file, req_file, limits_file, start_date, num_weeks_var, warnings=warnings)
+    except InputError as e:
         messagebox.showerror("Error", f"Failed to load CSV files: {str(e)}")
-        return None
\ No newline at end of file
+        return None
+    invalid_dates = [f"{w.column}: {w.value}" for w in warnings if w.rule == "must_off_date"]
+    if invalid_dates:
+        messagebox.showwarning("Invalid Dates", "Invalid must-off dates:\n" + "\n".join(invalid_dates))
+    return inputs
\ No newline at end of file
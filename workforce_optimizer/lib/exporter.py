@@ -0,0 +1,204 @@
+# exporter.py
+"""
+Schedule file writers that work from a ScheduleResult rather than the
+schedule widgets.
+
+Each file is built in memory and written with a single ``write`` to a
+temporary name, then moved into place, so a reader never sees a partly
+written schedule. Text files are UTF-8 whatever the platform, so
+lib/schedule_import.py can read them back. :func:`export_schedule` does the same writes on one
+background thread (exports run one after another, in submission order) and
+returns a ``Future``; the GUI polls it from ``root.after``.
+
+Besides the per-area CSVs, ``formats`` can ask for one Excel workbook (a
+sheet per area plus Summary, Employee Totals, Violations and Assignments;
+needs openpyxl) and a long-format Parquet assignment table (needs pyarrow or
+fastparquet). Both are imported only when that format is written.
+``rosters`` adds a zip of per-employee ICS and CSV rosters (lib/rosters.py).
+"""
+import contextlib
+import importlib.util
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from .reports import area_schedule_csv, area_frame, assignment_frame, summarize
+from .rosters import write_rosters_zip
+from .utils import user_output_dir
+
+FORMATS = ("csv", "xlsx", "parquet", "rosters")
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="schedule-export")
+
+
+@dataclass
+class ExportReport:
+    """Files written by one export (``(label, path)`` pairs) and ``(label, exception)`` failures."""
+    files: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+
+    @property
+    def messages(self):
+        return [f"Saved {label} to {path}" for label, path in self.files]
+
+
+def schedule_filename(out_dir, area, start_date):
+    return os.path.join(out_dir, f"{area}_schedule_{start_date:%Y-%m-%d}.csv")
+
+
+def summary_filename(out_dir, start_date, ext="txt"):
+    return os.path.join(out_dir, f"Summary_report_{start_date:%Y-%m-%d}.{ext}")
+
+
+def workbook_filename(out_dir, start_date):
+    return os.path.join(out_dir, f"Schedule_{start_date:%Y-%m-%d}.xlsx")
+
+
+def assignments_filename(out_dir, start_date):
+    return os.path.join(out_dir, f"Assignments_{start_date:%Y-%m-%d}.parquet")
+
+
+def rosters_filename(out_dir, start_date):
+    return os.path.join(out_dir, f"Rosters_{start_date:%Y-%m-%d}.zip")
+
+
+@contextlib.contextmanager
+def _replacing(filename):
+    """Yield a temporary path next to ``filename``; move it into place if the block succeeds."""
+    base, ext = os.path.splitext(filename)
+    tmp = f"{base}.{os.getpid()}.tmp{ext}"   # writers such as pandas' ExcelWriter go by the extension
+    try:
+        yield tmp
+        os.replace(tmp, filename)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def write_text(filename, text):
+    """Write ``text`` to ``filename`` (UTF-8) in one buffered write, replacing the file atomically."""
+    with _replacing(filename) as tmp:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+def _sheet_names(names):
+    """Excel-safe, unique sheet names (at most 31 characters, no ``[]:*?/\\``)."""
+    used, out = set(), []
+    for name in names:
+        base = re.sub(r"[\[\]:*?/\\]", "_", str(name))[:31] or "Sheet"
+        candidate, n = base, 1
+        while candidate.lower() in used:
+            n += 1
+            candidate = f"{base[:31 - len(str(n)) - 1]}~{n}"
+        used.add(candidate.lower())
+        out.append(candidate)
+    return out
+
+
+def write_workbook(result, filename, areas=None, violations=()):
+    """
+    One ``.xlsx`` with a sheet per area (a row per day, a column per shift),
+    then Summary (areas × shifts), Employee Totals (per week and per area),
+    Violations and Assignments (one row per assignment).
+    """
+    if importlib.util.find_spec("openpyxl") is None:
+        raise RuntimeError("Excel export needs the openpyxl package (pip install openpyxl)")
+    import pandas as pd
+    areas = list(result.areas if areas is None else areas)
+    summary = summarize(result)
+    fixed = ["Summary", "Employee Totals", "Violations", "Assignments"]
+    names = _sheet_names(fixed + areas)
+    sheets = [(name, area_frame(result, area), False) for name, area in zip(names[len(fixed):], areas)]
+    sheets += [
+        (names[0], summary.area_shift_frame(), True),
+        (names[1], summary.employee_totals_frame(), False),
+        (names[2], pd.DataFrame({"Violation": list(violations)}), False),
+        (names[3], assignment_frame(result), False),
+    ]
+    with _replacing(filename) as tmp:
+        with pd.ExcelWriter(tmp, engine="openpyxl", date_format="YYYY-MM-DD",
+                            datetime_format="YYYY-MM-DD") as writer:
+            for name, df, index in sheets:
+                df.to_excel(writer, sheet_name=name, index=index)
+
+
+def write_assignments_parquet(result, filename):
+    """The :func:`~lib.reports.assignment_frame` table as Parquet."""
+    try:
+        with _replacing(filename) as tmp:
+            assignment_frame(result).to_parquet(tmp, index=False)
+    except ImportError:
+        raise RuntimeError("Parquet export needs the pyarrow or fastparquet package (pip install pyarrow)")
+
+
+def write_rosters(result, filename):
+    """:func:`~lib.rosters.write_rosters_zip`, replacing ``filename`` atomically."""
+    with _replacing(filename) as tmp:
+        return write_rosters_zip(result, tmp)
+
+
+def write_area_schedules(result, targets):
+    """Write each ``(area, filename)`` of ``targets`` as an area schedule CSV."""
+    report = ExportReport()
+    for area, filename in targets:
+        try:
+            write_text(filename, area_schedule_csv(result, area))
+            report.files.append((f"{area} schedule", filename))
+        except Exception as e:
+            report.errors.append((f"{area} schedule", e))
+    return report
+
+
+def write_schedule_files(result, areas, out_dir=None, summary=None, formats=("csv",), violations=()):
+    """
+    Write the schedule to ``out_dir`` (default: the output folder from
+    Settings) in each of ``formats`` (see ``FORMATS``), plus the summary
+    ``.txt`` when ``summary`` (report text) is given. ``violations`` go to
+    the workbook's Violations sheet. A failing file is recorded in the
+    report and the rest are still written.
+    """
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown export format(s): {', '.join(sorted(unknown))}")
+    out_dir = out_dir or user_output_dir()
+    os.makedirs(out_dir, exist_ok=True)
+    start_date = result.calendar.start_date
+    report = ExportReport()
+    jobs = []
+    if "csv" in formats:
+        jobs += [(f"{area} schedule", schedule_filename(out_dir, area, start_date),
+                  lambda path, area=area: write_text(path, area_schedule_csv(result, area))) for area in areas]
+    if summary is not None:
+        jobs.append(("summary", summary_filename(out_dir, start_date), lambda path: write_text(path, summary)))
+    if "xlsx" in formats:
+        jobs.append(("workbook", workbook_filename(out_dir, start_date),
+                     lambda path: write_workbook(result, path, areas, violations)))
+    if "parquet" in formats:
+        jobs.append(("assignments", assignments_filename(out_dir, start_date),
+                     lambda path: write_assignments_parquet(result, path)))
+    if "rosters" in formats:
+        jobs.append(("employee rosters", rosters_filename(out_dir, start_date),
+                     lambda path: write_rosters(result, path)))
+    for label, filename, write in jobs:
+        try:
+            write(filename)
+            report.files.append((label, filename))
+        except Exception as e:
+            report.errors.append((label, e))
+    return report
+
+
+def export_schedule(result, areas, out_dir=None, summary=None, formats=("csv",), violations=()):
+    """
+    :func:`write_schedule_files` on the export thread, from a snapshot of
+    ``result`` so later edits do not race the writer. Returns a ``Future``
+    resolving to the :class:`ExportReport`.
+    """
+    return _executor.submit(write_schedule_files, result.copy(), list(areas), out_dir, summary,
+                            tuple(formats), list(violations))
+
+
+def export_area_files(result, targets):
+    """:func:`write_area_schedules` on the export thread, from a snapshot of ``result``."""
+    return _executor.submit(write_area_schedules, result.copy(), list(targets))
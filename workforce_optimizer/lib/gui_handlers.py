@@ -2,101 +2,132 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import pandas as pd
-import datetime
+import queue
+import weakref
 from tkcalendar import Calendar
-from .solver import solve_schedule
+from .solve_worker import SolveWorker
+from .cbc_monitor import CAN_STOP_EARLY
+from .solve_events import RUNG_STARTED, MODEL_BUILT, INCUMBENT, BOUND, RESULT, ERROR
+from .horizon import HorizonCalendar
+from .schedule_result import to_schedule_result
+from .exporter import export_schedule, export_area_files, summary_filename, write_text
+from .reports import summarize, summary_report, employee_summary_text
+from .schedule_grid import ScheduleTabs
+from .schedule_import import load_schedule
+from .charts import ScheduleCharts
+from .table_model import TableModel
+from .validation import validate_frames
 from .data_loader import load_csv
 from .utils import user_output_dir, user_data_dir
 import pulp
 import math
 import logging
-import matplotlib.pyplot as plt
 import numpy as np
 import os
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from .utils import min_employees_to_avoid_weekend_violations, adjust_column_widths, user_output_dir
+from .utils import min_employees_to_avoid_weekend_violations, user_output_dir, export_formats
+from .gui_utils import adjust_column_widths, measure_column_widths, apply_column_widths, column_width_changed
 logging.getLogger('matplotlib').setLevel(logging.WARNING)
 logging.getLogger('PIL').setLevel(logging.WARNING)
 
 all_input_trees = []
 all_listboxes = []
+schedule_tabs = None
+opened_schedule = None   # ScheduleResult shown by File > Open Schedule, until the next solve
+
+_table_models = weakref.WeakKeyDictionary()   # input Treeview -> TableModel
+_populating = weakref.WeakKeyDictionary()     # input Treeview -> actions waiting for its last row
+
+
+def table_model(tree):
+    """The :class:`TableModel` behind an input Treeview (built from its cells if missing)."""
+    model = _table_models.get(tree)
+    if model is None:
+        df = tree_to_df(tree, has_index=False)
+        model = _table_models[tree] = TableModel(df.columns, df.to_numpy(), tree.get_children())
+    return model
+
+
+def refresh_tree(tree, model=None):
+    """Show the model's columns and cells in ``tree`` after a column sort / insert / delete."""
+    if model is None:
+        model = table_model(tree)
+    tree["columns"] = model.columns
+    for col in model.columns:
+        tree.heading(col, text=col)
+        tree.column(col, anchor="center")
+    item = tree.item
+    for iid, values in zip(model.iids, model.rows()):
+        item(iid, values=values)
+
 
 def sort_employee_columns_by_row(tree, row_label, ascending=True):
-    """Correctly sort employee columns — respects that first row contains column names"""
-    target_iid = None
-    target_values = None
-    for iid in tree.get_children():
-        vals = tree.item(iid, "values")
-        if vals and len(vals) > 0 and str(vals[0]).strip() == row_label.strip():
-            target_iid = iid
-            target_values = vals
-            break
-
-    if not target_values or len(target_values) < 2:
+    """Sort employee columns by one row — the first column holds the row labels"""
+    if when_populated(tree, lambda: sort_employee_columns_by_row(tree, row_label, ascending)):
+        return
+    model = table_model(tree)
+    if not model.sort_columns_by_row(row_label, ascending):
         messagebox.showwarning("Sort Error", f"Row '{row_label}' not found.")
         return
+    refresh_tree(tree, model)
+    # each column kept its cells, so the cached widths still fit
+    apply_column_widths(tree)
 
-    columns = list(tree["columns"])
-    first_col = columns[0]
-    employee_columns = columns[1:]
-    n = len(employee_columns)
-
-    sort_items = []
-    for i, col in enumerate(employee_columns):
-        cell_idx = i + 1  # +1 because values[0] is the row label
-        raw = target_values[cell_idx] if cell_idx < len(target_values) else ""
-        raw_str = str(raw).strip()
-
-        if not raw_str or raw_str.lower() in {"", "nan", "none"}:
-            key = (3, "")
-        elif row_label.lower() == "must have off":
-            count = len([d.strip() for d in raw_str.split(",") if d.strip()])
-            key = (0, -count if not ascending else count)
-        else:
-            try:
-                key = (0, float(raw_str))
-            except:
-                try:
-                    from datetime import datetime
-                    dt = datetime.strptime(raw_str.split(",")[0].strip(), "%m/%d/%Y")
-                    key = (1, dt if ascending else datetime(9999,12,31) - dt)
-                except:
-                    key = (2, raw_str.lower())
+    direction = "Ascending" if ascending else "Descending"
+    messagebox.showinfo("Sorted", f"Employees sorted by: {row_label}\n({direction})")
 
-        sort_items.append((key, i, col))
+INSERT_CHUNK_CELLS = 20000
 
-    # Sort
-    sort_items.sort(reverse=not ascending)
-    new_employee_order = [item[2] for item in sort_items]
-    old_to_new_index = {old_idx: new_idx for new_idx, (_, old_idx, _) in enumerate(sort_items)}
 
-    tree["columns"] = [first_col] + new_employee_order
+def populate_tree(tree, iids, rows, chunk_cells=INSERT_CHUNK_CELLS, on_done=None):
+    """
+    Insert ``rows`` into ``tree`` under ``iids``: the first chunk (about
+    ``chunk_cells`` cells) right away, the rest in ``after_idle`` batches so a
+    large sheet does not freeze the window. ``on_done`` runs after the last row,
+    then the actions :func:`when_populated` held back in the meantime.
+    """
+    width = max((len(r) for r in rows[:1]), default=1)
+    chunk_rows = max(1, chunk_cells // max(width, 1))
+    _populating[tree] = []
 
-    for iid in tree.get_children():
-        old_vals = list(tree.item(iid, "values"))
-        if len(old_vals) < 2:
-            continue
+    def insert_from(start):
+        if not tree.winfo_exists():
+            _populating.pop(tree, None)
+            return
+        end = min(start + chunk_rows, len(rows))
+        insert = tree.insert
+        for i in range(start, end):
+            insert("", "end", iid=iids[i], values=rows[i])
+        if end < len(rows):
+            tree.after_idle(insert_from, end)
+            return
+        waiting = _populating.pop(tree, [])
+        if on_done is not None:
+            on_done()
+        for action in waiting:
+            action()
 
-        row_label_cell = old_vals[0]
-        old_employee_data = old_vals[1:1+n]  
+    insert_from(0)
 
-        # Rebuild in new order
-        new_employee_data = [""] * n
-        for old_idx, cell_value in enumerate(old_employee_data):
-            if old_idx < n:
-                new_idx = old_to_new_index[old_idx]
-                new_employee_data[new_idx] = cell_value
 
-        tree.item(iid, values=[row_label_cell] + new_employee_data)
+def is_populating(tree):
+    """True while :func:`populate_tree` is still inserting rows into ``tree``."""
+    return tree in _populating
 
-    tree.heading(first_col, text=first_col)
-    tree.column(first_col, anchor="center", width=tree.column(first_col, "width"))
-    for col in new_employee_order:
-        tree.heading(col, text=col)
-        tree.column(col, anchor="center", width=100)
 
-    direction = "Ascending" if ascending else "Descending"
-    messagebox.showinfo("Sorted", f"Employees sorted by: {row_label}\n({direction})")
+def when_populated(tree, action):
+    """
+    Hold ``action`` back until ``tree`` has all its rows. Returns True if it
+    was deferred (the caller returns), False if the tree is complete.
+
+    Sorts, inserts and deletes refresh every row of the model, and the rows
+    of a large sheet are not all in the Treeview yet while it is populating.
+    """
+    waiting = _populating.get(tree)
+    if waiting is None:
+        return False
+    waiting.append(action)
+    return True
+
 
 def display_input_data(emp_path, req_path, limits_path, emp_frame, req_frame, limits_frame, root, notebook, summary_text):
     """
@@ -129,7 +160,6 @@ def display_input_data(emp_path, req_path, limits_path, emp_frame, req_frame, li
         hsb.grid(row=1, column=0, sticky="ew")
         tree_frame.rowconfigure(0, weight=1)
         tree_frame.columnconfigure(0, weight=1)
-        all_input_trees.append(tree)
         def _on_mousewheel(event):
             if event.delta:
                 tree.yview_scroll(int(-1 * (event.delta / 120)), "units")
@@ -140,19 +170,17 @@ def display_input_data(emp_path, req_path, limits_path, emp_frame, req_frame, li
         tree.bind("<MouseWheel>", _on_mousewheel)
         tree.bind("<Button-4>", _on_mousewheel)
         tree.bind("<Button-5>", _on_mousewheel)
-        columns = list(df.columns)
-        if has_index:
-            index_name = df.index.name or "Index"
-            columns = [index_name] + columns
-        tree["columns"] = columns
-        for col in columns:
+        model = _table_models[tree] = TableModel.from_frame(df, has_index)
+        tree["columns"] = model.columns
+        for col in model.columns:
             tree.heading(col, text=col)
             tree.column(col, anchor="center", width=100)
-        for idx, row in df.iterrows():
-            values = ['' if pd.isna(val) else str(val) for val in row]
-            if has_index:
-                values = [str(idx)] + values
-            tree.insert("", "end", iid=str(idx) if has_index else f"row_{idx}", values=values)
+        def on_done():
+            # widths are measured once every row is in; until then resizes skip this tree
+            all_input_trees.append(tree)
+            measure_column_widths(tree, model.max_lengths())
+            adjust_column_widths(root, all_listboxes, [tree], notebook, summary_text)
+        populate_tree(tree, model.iids, model.rows(), on_done=on_done)
         tree.bind("<Double-1>", lambda event: on_tree_double_click(tree, event, has_index))
         return tree
     emp_tree = create_treeview(emp_frame, emp_path, has_index=False)
@@ -199,7 +227,95 @@ def display_input_data(emp_path, req_path, limits_path, emp_frame, req_frame, li
         emp_tree.bind("<Control-Button-1>", handle_emp_right_click)
     create_treeview(req_frame, req_path, has_index=False)
     create_treeview(limits_frame, limits_path, has_index=True)
-    adjust_column_widths(root, all_listboxes, all_input_trees, notebook, summary_text)
+
+def tree_to_df(tree, has_index=True):
+    columns = tree["columns"]
+    data = []
+    index = []
+    for item in tree.get_children():
+        values = [tree.set(item, col) for col in columns]
+        if has_index:
+            index.append(values[0])
+            data.append(values[1:])
+        else:
+            data.append(values)
+    if has_index:
+        return pd.DataFrame(data, index=index, columns=columns[1:])
+    return pd.DataFrame(data, columns=columns)
+
+def input_tree(frame):
+    """The Treeview shown in an input tab, or None before View Input Data."""
+    children = frame.winfo_children()
+    if not children:
+        return None
+    return next((w for w in children[0].winfo_children() if isinstance(w, ttk.Treeview)), None)
+
+def check_input_data(emp_frame, req_frame, limits_frame):
+    """
+    Validate what is currently shown in the three input tabs (including unsaved
+    edits). Returns a list of ValidationIssue, or None if the tabs are not loaded.
+    """
+    trees = [input_tree(f) for f in (emp_frame, req_frame, limits_frame)]
+    if not all(trees):
+        return None
+    frames = []
+    for tree, indexed in zip(trees, (True, True, False)):
+        df = table_model(tree).to_frame().replace("", np.nan)
+        frames.append(df.set_index(df.columns[0]) if indexed else df)
+    return validate_frames(*frames)
+
+def update_validation_status(status_label, emp_frame, req_frame, limits_frame):
+    """Refresh the one-line input status shown under the input tabs."""
+    try:
+        issues = check_input_data(emp_frame, req_frame, limits_frame)
+    except Exception as e:
+        logging.error(f"Input validation failed: {e}", exc_info=True)
+        return
+    if issues is None:
+        status_label.config(text="", fg="gray")
+        return
+    errors = sum(i.severity == "error" for i in issues)
+    warnings = len(issues) - errors
+    if not issues:
+        status_label.config(text="Input data: no problems found", fg="dark green")
+    else:
+        first = next(i for i in sorted(issues, key=lambda i: i.severity != "error"))
+        status_label.config(
+            text=f"Input data: {errors} error(s), {warnings} warning(s) • {first} • Validate Input Data for the full list",
+            fg="red" if errors else "dark orange"
+        )
+
+def show_validation_report(root, emp_frame, req_frame, limits_frame):
+    """List every problem in the input tabs in one window."""
+    issues = check_input_data(emp_frame, req_frame, limits_frame)
+    if issues is None:
+        messagebox.showwarning("Validate Input Data", "Click View Input Data first.")
+        return
+    if not issues:
+        messagebox.showinfo("Validate Input Data", "No problems found in the input data.")
+        return
+    win = tk.Toplevel(root)
+    win.title(f"Input Problems ({len(issues)})")
+    win.geometry("1000x400")
+    win.transient(root)
+    frame = ttk.Frame(win)
+    frame.pack(fill="both", expand=True, padx=10, pady=10)
+    columns = ["Severity", "Sheet", "Row", "Column", "Value", "Problem"]
+    tree = ttk.Treeview(frame, columns=columns, show="headings", selectmode="browse")
+    vsb = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=vsb.set)
+    tree.grid(row=0, column=0, sticky="nsew")
+    vsb.grid(row=0, column=1, sticky="ns")
+    frame.rowconfigure(0, weight=1)
+    frame.columnconfigure(0, weight=1)
+    for col, width in zip(columns, (70, 120, 150, 120, 120, 420)):
+        tree.heading(col, text=col)
+        tree.column(col, width=width, anchor="w", stretch=(col == "Problem"))
+    tree.tag_configure("error", foreground="red")
+    for i in sorted(issues, key=lambda i: i.severity != "error"):
+        tree.insert("", "end", values=[i.severity, i.source, i.row, i.column, i.value, i.message],
+                    tags=(i.severity,))
+    tk.Button(win, text="Close", command=win.destroy).pack(pady=(0, 10))
 
 def save_input_data(emp_var, req_var, limits_var, emp_frame, req_frame, limits_frame, root):
     """
@@ -207,21 +323,6 @@ def save_input_data(emp_var, req_var, limits_var, emp_frame, req_frame, limits_f
     Update the variables if saved to a new filename.
     """
     data_dir = user_data_dir()
-
-    def tree_to_df(tree, has_index=True):
-        columns = tree["columns"]
-        data = []
-        index = []
-        for item in tree.get_children():
-            values = [tree.set(item, col) for col in columns]
-            if has_index:
-                index.append(values[0])
-                data.append(values[1:])
-            else:
-                data.append(values)
-        if has_index:
-            return pd.DataFrame(data, index=index, columns=columns[1:])
-        return pd.DataFrame(data, columns=columns)
    
     def get_save_filename(default_path, file_type):
         """Get filename with overwrite/skip/save-as options."""
@@ -253,7 +354,7 @@ def save_input_data(emp_var, req_var, limits_var, emp_frame, req_frame, limits_f
     save_messages = []
     try:
         # Employee Data
-        emp_tree = next((w for w in emp_frame.winfo_children()[0].winfo_children() if isinstance(w, ttk.Treeview)), None)
+        emp_tree = input_tree(emp_frame)
         if emp_tree:
             orig_emp_path = emp_var.get()
             if orig_emp_path:
@@ -261,7 +362,7 @@ def save_input_data(emp_var, req_var, limits_var, emp_frame, req_frame, limits_f
                 emp_path = os.path.join(data_dir, emp_basename)
                 filename = get_save_filename(emp_path, "Employee Data")
                 if filename and filename is not False:
-                    emp_df = tree_to_df(emp_tree, has_index=False)
+                    emp_df = table_model(emp_tree).to_frame()
                     emp_df.to_csv(filename, index=False)
                     save_messages.append(f"Saved Employee Data to {filename}")
                     logging.info(f"Saved Employee Data to {filename}")
@@ -269,7 +370,7 @@ def save_input_data(emp_var, req_var, limits_var, emp_frame, req_frame, limits_f
                         emp_var.set(filename)
        
         # Personnel Required
-        req_tree = next((w for w in req_frame.winfo_children()[0].winfo_children() if isinstance(w, ttk.Treeview)), None)
+        req_tree = input_tree(req_frame)
         if req_tree:
             orig_req_path = req_var.get()
             if orig_req_path:
@@ -277,7 +378,7 @@ def save_input_data(emp_var, req_var, limits_var, emp_frame, req_frame, limits_f
                 req_path = os.path.join(data_dir, req_basename)
                 filename = get_save_filename(req_path, "Personnel Required")
                 if filename and filename is not False:
-                    req_df = tree_to_df(req_tree, has_index=False)
+                    req_df = table_model(req_tree).to_frame()
                     req_df.to_csv(filename, index=False)
                     save_messages.append(f"Saved Personnel Required to {filename}")
                     logging.info(f"Saved Personnel Required to {filename}")
@@ -285,7 +386,7 @@ def save_input_data(emp_var, req_var, limits_var, emp_frame, req_frame, limits_f
                         req_var.set(filename)
        
         # Hard Limits
-        limits_tree = next((w for w in limits_frame.winfo_children()[0].winfo_children() if isinstance(w, ttk.Treeview)), None)
+        limits_tree = input_tree(limits_frame)
         if limits_tree:
             orig_limits_path = limits_var.get()
             if orig_limits_path:
@@ -293,7 +394,7 @@ def save_input_data(emp_var, req_var, limits_var, emp_frame, req_frame, limits_f
                 limits_path = os.path.join(data_dir, limits_basename)
                 filename = get_save_filename(limits_path, "Hard Limits")
                 if filename and filename is not False:
-                    limits_df = tree_to_df(limits_tree, has_index=False)
+                    limits_df = table_model(limits_tree).to_frame()
                     limits_df.to_csv(filename, index=False)
                     save_messages.append(f"Saved Hard Limits to {filename}")
                     logging.info(f"Saved Hard Limits to {filename}")
@@ -381,8 +482,12 @@ def employee_context_menu(tree, event, emp_frame, root):
 
 def delete_employee(tree, item, name, root):
     if messagebox.askyesno("Delete Employee", f"Permanently delete employee:\n\n{name}\n\nThis cannot be undone."):
-        tree.delete(item)
-        messagebox.showinfo("Success", f"Employee '{name}' deleted.")
+        def delete():
+            table_model(tree).delete_row(item)
+            tree.delete(item)
+            messagebox.showinfo("Success", f"Employee '{name}' deleted.")
+        if not when_populated(tree, delete):
+            delete()
 
 
 def add_employee(tree, item, before=True, root=None):
@@ -405,7 +510,7 @@ def add_employee(tree, item, before=True, root=None):
         if not new_name:
             messagebox.showerror("Error", "Name cannot be empty.")
             return
-        if new_name in [tree.item(i, "values")[0] for i in tree.get_children()]:
+        if new_name in table_model(tree).cells[:, 0]:
             messagebox.showerror("Error", f"Employee '{new_name}' already exists.")
             return
         name_win.destroy()
@@ -427,9 +532,8 @@ def choose_template(tree, ref_item, new_name, before, root):
     """
     Choose which employee's settings to copy (or blank)
     """
-    all_employees = [tree.item(i, "values")[0] for i in tree.get_children()]
-    if not all_employees:
-        all_employees = []
+    model = table_model(tree)
+    all_employees = [str(v) for v in model.cells[:, 0]] if model.columns else []
 
     win = tk.Toplevel(root)
     win.title("Copy Settings From")
@@ -446,23 +550,18 @@ def choose_template(tree, ref_item, new_name, before, root):
 
     def confirm():
         template_name = combo.get()
-        if template_name == "(Blank)":
-            template_values = [""] * (len(tree["columns"]) - 1)
-        else:
-            for i in tree.get_children():
-                vals = tree.item(i, "values")
-                if vals[0] == template_name:
-                    template_values = list(vals[1:])
-                    break
-
-        new_values = [new_name] + template_values
-        if before:
-            tree.insert("", tree.index(ref_item), values=new_values)
-        else:
-            tree.insert("", tree.index(ref_item) + 1, values=new_values)
-
         win.destroy()
-        messagebox.showinfo("Success", f"Employee '{new_name}' added.")
+
+        def insert():
+            template_iid = None if template_name == "(Blank)" else model.find_row(template_name)
+            template_values = model.row(template_iid)[1:] if template_iid else []
+            at = model.index(ref_item) if before else model.index(ref_item) + 1
+            iid = model.insert_row(at, [new_name] + template_values)
+            tree.insert("", at, iid=iid, values=model.row(iid))
+            measure_column_widths(tree, model.max_lengths())
+            messagebox.showinfo("Success", f"Employee '{new_name}' added.")
+        if not when_populated(tree, insert):
+            insert()
 
     def cancel():
         win.destroy()
@@ -482,34 +581,18 @@ def delete_employee_header(tree, column_id, name, root, highlight_canvas=None):
             highlight_canvas.destroy()
         return
 
-    current_cols = list(tree["columns"])
-    if column_id not in current_cols:
-        if highlight_canvas:
-            highlight_canvas.destroy()
-        return
-
-    col_index = current_cols.index(column_id)
-    current_cols.pop(col_index)
-    
-    heading_texts = {col: tree.heading(col)["text"] for col in tree["columns"]}
-
-    tree["columns"] = current_cols
-
-    for col in current_cols:
-        if col in heading_texts:
-            tree.heading(col, text=heading_texts[col])
-            tree.column(col, anchor="center", width=100)
-
-    for item in tree.get_children():
-        values = list(tree.item(item, "values"))
-        if len(values) > col_index:
-            values.pop(col_index)
-            tree.item(item, values=values)
-
     if highlight_canvas:
         highlight_canvas.destroy()
-    
-    messagebox.showinfo("Success", f"Employee '{name}' deleted.")
+
+    def delete():
+        model = table_model(tree)
+        if not model.delete_column(column_id):
+            return
+        refresh_tree(tree, model)
+        apply_column_widths(tree)
+        messagebox.showinfo("Success", f"Employee '{name}' deleted.")
+    if not when_populated(tree, delete):
+        delete()
 
 
 def add_employee_header(tree, ref_column_id, before=True, root=None, highlight_canvas=None):
@@ -584,39 +667,20 @@ def add_employee_header(tree, ref_column_id, before=True, root=None, highlight_c
 
 def insert_employee_column(tree, ref_column_id, new_name, before, root, template_col=None):
     """Insert new column with optional data copy from template employee"""
-    current_cols = list(tree["columns"])
-    
-    heading_texts = {}
-    for col in current_cols:
-        heading_texts[col] = tree.heading(col)["text"]
-
+    if when_populated(tree, lambda: insert_employee_column(tree, ref_column_id, new_name, before, root,
+                                                           template_col)):
+        return
+    model = table_model(tree)
+    current_cols = model.columns
     ref_idx = current_cols.index(ref_column_id) if ref_column_id in current_cols else len(current_cols)
     insert_idx = ref_idx if before else ref_idx + 1
+    if insert_idx > len(current_cols):
+        insert_idx = len(current_cols)
 
-    current_cols.insert(insert_idx, new_name)
-    tree["columns"] = current_cols
-
-    for col in current_cols:
-        if col == new_name:
-            tree.heading(col, text=new_name)
-            tree.column(col, anchor="center", width=100)
-        elif col in heading_texts:
-            tree.heading(col, text=heading_texts[col])
-            tree.column(col, anchor="center", width=100)
-
-    for item in tree.get_children():
-        values = list(tree.item(item, "values"))
-        if template_col and template_col in tree["columns"]:
-            # Copy data from template column
-            template_idx = tree["columns"].index(template_col)
-            if template_idx < len(values):
-                new_value = values[template_idx]
-            else:
-                new_value = ""
-        else:
-            new_value = ""
-        values.insert(insert_idx, new_value)
-        tree.item(item, values=values)
+    # Copies the template employee's cells, or blank
+    model.insert_column(new_name, insert_idx, template_col)
+    refresh_tree(tree, model)
+    measure_column_widths(tree, model.max_lengths())
 
     messagebox.showinfo("Success", f"Employee '{new_name}' added successfully!")
     
@@ -625,6 +689,8 @@ def on_tree_double_click(tree, event, has_index):
     """
     Handle double-click on Treeview to edit cell content.
     """
+    if is_populating(tree):
+        return   # ignored until every row is in the tree (see when_populated)
     item = tree.identify_row(event.y)
     column = tree.identify_column(event.x)
     if not item or not column:
@@ -642,42 +708,27 @@ def on_tree_double_click(tree, event, has_index):
     entry.bind("<FocusOut>", lambda _: update_cell())
     def update_cell():
         new_value = entry.get()
+        table_model(tree).set(item, col_name, new_value)
         tree.set(item, col_name, new_value)
+        column_width_changed(tree, col_name, new_value)
         entry.destroy()
+        tree.event_generate("<<InputCellEdited>>")
     x, y, width, height = tree.bbox(item, column)
     entry.place(x=x, y=y, width=width, height=height)
     entry.focus_set()
 
-def edit_schedule_cell(tree, event, area, emp_file_path):
+def edit_schedule_cell(grid, area, day_index, shift, names, x_root, y_root, emp_file_path):
     """
-    Double-click schedule cell → show white Entry box (like input) → open dialog.
+    Double-click on a schedule grid cell → dialog to add / remove employees.
+    Every change is written straight to the grid's ScheduleResult.
     """
-    item = tree.identify_row(event.y)
-    col = tree.identify_column(event.x)
-    if not item or not col:
-        return
-    col_idx = int(col.replace('#', '')) - 1
-    if col_idx == 0:  
-        return
-
-    cell_value = tree.set(item, col)
-    entry = tk.Entry(tree, background='white', foreground='black', relief='solid', bd=1)
-    entry.insert(0, cell_value if cell_value else "Click to edit...")
-    entry.config(state='readonly')  
-
-    x, y, width, height = tree.bbox(item, col)
-    entry.place(x=x, y=y, width=width, height=height)
-    entry.focus_set()
+    names = list(names)
+    cal = grid.result.calendar
+    week, k = divmod(day_index, 7)
 
     def open_edit_dialog():
-        entry.config(state='normal')
-        entry.delete(0, tk.END)
-        entry.insert(0, cell_value)
-        entry.config(state='readonly')
-
-        col_name = tree.heading(col)['text']
-        shift_name = tree.set(item, tree["columns"][0])
-        names = [n.strip() for n in cell_value.split(',') if n.strip()]
+        col_name = cal.day_headings(week)[k]
+        shift_name = shift
 
         try:
             emp_df = pd.read_csv(emp_file_path, index_col="Employee/Input")
@@ -685,21 +736,21 @@ def edit_schedule_cell(tree, event, area, emp_file_path):
             available = emp_df[emp_df['Work Area'] == area].index.tolist()
             if not available:
                 messagebox.showerror("Error", f"No employees for {area}")
-                entry.destroy()
+                grid.clear_selection()
                 return
         except Exception as e:
             messagebox.showerror("Error", f"Load failed: {e}")
-            entry.destroy()
+            grid.clear_selection()
             return
 
         dialog = tk.Toplevel()
         dialog.title(f"Edit - {area}")
         dialog.geometry("350x450")
-        dialog.transient(tree.winfo_toplevel())
+        dialog.transient(grid.winfo_toplevel())
         dialog.grab_set()
 
-        root_x = tree.winfo_rootx() + x
-        root_y = tree.winfo_rooty() + y
+        root_x = x_root
+        root_y = y_root
         screen_w = dialog.winfo_screenwidth()
         screen_h = dialog.winfo_screenheight()
         dlg_w, dlg_h = 350, 450
@@ -724,12 +775,7 @@ def edit_schedule_cell(tree, event, area, emp_file_path):
         lb.pack(pady=5, fill="both", expand=True)
 
         def update_cell():
-            new_val = ", ".join(names)
-            tree.set(item, col, new_val)
-            entry.config(state='normal')
-            entry.delete(0, tk.END)
-            entry.insert(0, new_val if new_val else "")
-            entry.config(state='readonly')
+            grid.set_cell(area, day_index, shift, names)
 
         def add_employee():
             win = tk.Toplevel(dialog)
@@ -810,17 +856,18 @@ def edit_schedule_cell(tree, event, area, emp_file_path):
 
         def close():
             update_cell()
-            entry.destroy()
+            grid.clear_selection()
             dialog.destroy()
 
         tk.Button(btns, text="Close", command=close).pack(side=tk.LEFT, padx=5)
         dialog.protocol("WM_DELETE_WINDOW", close)
 
-    tree.after(50, open_edit_dialog)
+    grid.after(50, open_edit_dialog)
 
 def save_schedule_changes(start_date, root, schedule_container, areas):
     """
     Save schedule changes to CSV files with overwrite prompt and option to save as a different filename.
+    Only areas with unsaved edits (``ScheduleResult.edits``) are written, on the export thread.
     """
     def get_save_filename(default_path, file_type):
         """Get filename with overwrite/skip/save-as options."""
@@ -874,124 +921,198 @@ def save_schedule_changes(start_date, root, schedule_container, areas):
                 return choice[0]
         return default_path
 
-    save_messages = []
-    start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date() if isinstance(start_date, str) else start_date
-    day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    start_weekday = start_date.weekday()
-    actual_days = [day_names[(start_weekday + k) % 7] for k in range(7)]
-    
-    try:
-        for area in areas:
-            area_trees = []
-            found_area_label = False
-            for widget in schedule_container.winfo_children():
-               if isinstance(widget, tk.Label) and widget.cget("text") == f"{area} Schedule":
-                    found_area_label = True
-                    continue
-               if found_area_label and isinstance(widget, tk.Frame):
-                    for child in widget.winfo_children():
-                        if isinstance(child, tk.Frame):
-                            for grandchild in child.winfo_children():
-                                if isinstance(grandchild, ttk.Frame):
-                                    for ggchild in grandchild.winfo_children():
-                                        if isinstance(ggchild, ttk.Treeview):
-                                            area_trees.append(ggchild)
-                    found_area_label = False
-                    break
-            
-            if area_trees:
-                num_weeks = len(area_trees)
-                
-                default_filename = os.path.join(user_output_dir(), f"{area}_schedule_{start_date:%Y-%m-%d}.csv")
-                
-                filename = get_save_filename(default_filename, f"{area} Schedule")
-                
-                if filename and filename is not False:  
-                    try:
-                        with open(filename, "w") as f:
-                            for week in range(1, num_weeks + 1):
-                                tree = area_trees[week-1]
-                                week_start = start_date + datetime.timedelta(days=(week-1)*7)
-                                week_end = week_start + datetime.timedelta(days=6)
-                                f.write(f'"{area} Schedule ({week_start:%b %d, %Y} - {week_end:%b %d, %Y})"\n')
-                                f.write("Day/Shift," + ",".join(f'"{actual_days[k]}, {week_start + datetime.timedelta(days=k):%b %d, %y}"' for k in range(7)) + "\n")
-                                for item in tree.get_children():
-                                    values = [tree.set(item, "Day/Shift")] + [tree.set(item, actual_days[k]) for k in range(7)]
-                                    f.write(",".join(f'"{v}"' for v in values) + "\n")
-                                f.write("\n")
-                        
-                        save_messages.append(f"Saved {area} schedule to {filename}")
-                        logging.info(f"Saved {area} schedule to {filename}")
-                    except Exception as e:
-                        messagebox.showerror("Error", f"Failed to save {area} schedule: {e}")
-                        logging.error(f"Failed to save {area} schedule: {str(e)}")
-        
-        if save_messages:
-            messagebox.showinfo("Success", "\n".join(save_messages))
-        else:
-            messagebox.showwarning("Warning", "No schedules were saved.")
-            
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to save schedule changes: {str(e)}")
-        logging.error(f"Failed to save schedule changes: {str(e)}")
+    if schedule_tabs is None or not schedule_tabs.winfo_exists():
+        messagebox.showwarning("Warning", "No schedules were saved.")
+        return
+    result = schedule_tabs.result
+    unsaved = [a for a in result.unsaved_areas() if not areas or a in areas]
+    if not unsaved:
+        messagebox.showinfo("No Changes", "There are no unsaved schedule changes.")
+        return
+    start_date = result.calendar.start_date
+    targets = []
+    for area in unsaved:
+        default_filename = os.path.join(user_output_dir(), f"{area}_schedule_{start_date:%Y-%m-%d}.csv")
+        filename = get_save_filename(default_filename, f"{area} Schedule")
+        if filename:
+            targets.append((area, filename))
+    if not targets:
+        messagebox.showwarning("Warning", "No schedules were saved.")
+        return
+    # Written on the export thread from a snapshot; edits made meanwhile stay unsaved
+    version = result.version
+
+    def on_saved(report):
+        saved = {label for label, _ in report.files}
+        for area, _ in targets:
+            if f"{area} schedule" in saved:
+                result.mark_saved(area, version)
+        if schedule_tabs is not None and schedule_tabs.winfo_exists():
+            schedule_tabs.refresh_labels()
+        if report.messages:
+            messagebox.showinfo("Success", "\n".join(report.messages))
+
+    _when_exported(root, export_area_files(result, targets), on_saved)
+
+def _when_exported(root, future, on_done, poll_ms=50):
+    """
+    Poll an export ``future`` from ``root.after``; when it is done, show its
+    failures and call ``on_done(report)`` on the Tk thread.
+    """
+    def poll():
+        if not future.done():
+            root.after(poll_ms, poll)
+            return
+        try:
+            report = future.result()
+        except Exception as e:
+            logging.error(f"Schedule export failed: {e}", exc_info=True)
+            messagebox.showerror("Error", f"Failed to save schedules: {e}")
+            return
+        for label, e in report.errors:
+            logging.error(f"Failed to save {label}: {e}")
+            messagebox.showerror("Error", f"Failed to save {label}: {e}")
+        for message in report.messages:
+            logging.info(message)
+        on_done(report)
 
-def create_schedule_treeview(parent, week, start_date, shifts, actual_days):
+    root.after(poll_ms, poll)
+
+
+def export_area_schedules(root, result, areas, summary=None, violations=(), on_done=None, poll_ms=50):
     """
-    Create a Treeview for a specific week in a schedule frame.
+    Write every area's schedule CSV (and the summary report text, if given)
+    to the output folder on the export thread (see lib/exporter.py), plus
+    the workbook / Parquet files enabled in Settings.
+    Failures are reported on the Tk thread, then ``on_done(messages)`` runs
+    there with the "Saved ..." lines.
     """
-    week_frame = tk.Frame(parent, name=f"week{week}")
-    week_frame.pack(pady=5, fill="both", expand=False)
-    week_start = start_date + datetime.timedelta(days=(week-1)*7)
-    week_end = week_start + datetime.timedelta(days=6)
-    tk.Label(week_frame, text=f"Week {week} ({week_start:%b %d, %Y} - {week_end:%b %d, %Y})").pack()
-
-    tree_frame = ttk.Frame(week_frame)
-    tree_frame.pack(fill="both", expand=False)
-    tree = ttk.Treeview(tree_frame, show="headings", height=len(shifts), selectmode='none')
-    vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
-    hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=tree.xview)
-    tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-    tree.grid(row=0, column=0, sticky="nsew")
-    vsb.grid(row=0, column=1, sticky="ns")
-    hsb.grid(row=1, column=0, sticky="ew")
-    tree_frame.rowconfigure(0, weight=1)
-    tree_frame.columnconfigure(0, weight=1)
-
-    columns = ["Day/Shift"] + actual_days
-    tree["columns"] = columns
-    tree.heading("Day/Shift", text="Day/Shift")
-    for k, day in enumerate(actual_days):
-        date = week_start + datetime.timedelta(days=k)
-        tree.heading(day, text=f"{day}, {date:%b %d, %y}")
-        tree.column(day, anchor="center", width=100)
-    tree.column("Day/Shift", anchor="w", width=100)
-
-    for shift in shifts:
-        tree.insert("", "end", iid=shift, values=[shift] + [""] * len(actual_days))
-
-    return tree
-
-def save_area_schedule(treeviews, filename, start_date, num_weeks, actual_days, area):
-    with open(filename, "w") as f:
-        for week in range(1, num_weeks + 1):
-            tree = treeviews[week-1]
-            week_start = start_date + datetime.timedelta(days=(week-1)*7)
-            week_end = week_start + datetime.timedelta(days=6)
-            f.write(f'"{area} Schedule ({week_start:%b %d, %Y} - {week_end:%b %d, %Y})"\n')
-            f.write("Day/Shift," + ",".join(f'"{actual_days[k]}, {week_start + datetime.timedelta(days=k):%b %d, %y}"' for k in range(7)) + "\n")
-            for item in tree.get_children():
-                values = [tree.set(item, "Day/Shift")] + [tree.set(item, actual_days[k]) for k in range(7)]
-                f.write(",".join(f'"{v}"' for v in values) + "\n")
-            f.write("\n")
+    future = export_schedule(result, areas, summary=summary, formats=export_formats(), violations=violations)
+
+    def done(report):
+        if on_done is not None:
+            on_done(report.messages)
+
+    _when_exported(root, future, done, poll_ms)
+
+
+def _describe_rung(event):
+    relaxed = event.get("relaxed") or []
+    text = f"Attempt {event.attempt} of {event['total']}"
+    return text + (f" – relaxing {', '.join(relaxed)}" if relaxed else " – all rules enforced")
+
+
+def run_solve_with_progress(root, worker, on_finished, poll_ms=100):
+    """
+    Start ``worker`` (a :class:`SolveWorker`) behind a modal progress dialog.
+
+    The worker's event queue is drained every ``poll_ms`` with ``root.after``;
+    the dialog shows the current relaxation attempt, elapsed time, the best
+    schedule score found so far and the optimality gap. "Use Best So Far"
+    stops CBC at the current incumbent (not offered on Windows, where CBC
+    cannot be interrupted that way); Cancel (or closing the dialog) kills
+    it. ``on_finished(event)`` is called on the main thread with the worker's
+    final ``result`` / ``error`` event once the dialog is closed.
+    """
+    dlg = tk.Toplevel(root)
+    dlg.title("Generating Schedule")
+    dlg.transient(root)
+    dlg.resizable(False, False)
+    frm = ttk.Frame(dlg, padding=15)
+    frm.pack(fill="both", expand=True)
+    rung_var = tk.StringVar(value="Building model…")
+    elapsed_var = tk.StringVar(value="Elapsed: 0:00")
+    model_var = tk.StringVar(value="Model: –")
+    objective_var = tk.StringVar(value="Best schedule score: –")
+    gap_var = tk.StringVar(value="Gap to optimum: –")
+    ttk.Label(frm, textvariable=rung_var, font=("Arial", 10, "bold"), width=60).pack(anchor="w")
+    bar = ttk.Progressbar(frm, mode="indeterminate", length=400)
+    bar.pack(fill="x", pady=10)
+    bar.start(15)
+    for var in (elapsed_var, model_var, objective_var, gap_var):
+        ttk.Label(frm, textvariable=var).pack(anchor="w")
+
+    def cancel():
+        if worker.cancelled:
+            return
+        cancel_btn.config(state="disabled")
+        stop_btn.config(state="disabled")
+        rung_var.set("Cancelling…")
+        worker.cancel()
+
+    def stop_early():
+        stop_btn.config(state="disabled")
+        rung_var.set("Finishing with the best schedule found so far…")
+        worker.stop()
+
+    if not CAN_STOP_EARLY:
+        ttk.Label(frm, text="Stopping early with the best schedule so far is not available on "
+                            "Windows; Cancel ends the solve without a schedule.",
+                  foreground="gray", wraplength=400).pack(anchor="w", pady=(10, 0))
+    btn_frm = ttk.Frame(frm)
+    btn_frm.pack(pady=(10, 0))
+    stop_btn = ttk.Button(btn_frm, text="Use Best So Far", command=stop_early, state="disabled")
+    if CAN_STOP_EARLY:
+        stop_btn.pack(side="left", padx=5)
+    cancel_btn = ttk.Button(btn_frm, text="Cancel", command=cancel)
+    cancel_btn.pack(side="left", padx=5)
+    dlg.protocol("WM_DELETE_WINDOW", cancel)
+    dlg.update_idletasks()
+    x = root.winfo_x() + (root.winfo_width() // 2) - (dlg.winfo_width() // 2)
+    y = root.winfo_y() + (root.winfo_height() // 2) - (dlg.winfo_height() // 2)
+    dlg.geometry(f"+{x}+{y}")
+    dlg.grab_set()
+
+    def poll():
+        final = None
+        try:
+            for _ in range(500):
+                event = worker.events.get_nowait()
+                if event.kind == RUNG_STARTED:
+                    if not (worker.cancelled or worker.stopping):
+                        rung_var.set(_describe_rung(event))
+                    objective_var.set("Best schedule score: –")
+                    gap_var.set("Gap to optimum: –")
+                    stop_btn.config(state="disabled")
+                elif event.kind == MODEL_BUILT:
+                    model_var.set(f"Model: {event['variables']:,} variables, "
+                                  f"{event['constraints']:,} constraints")
+                elif event.kind in (INCUMBENT, BOUND):
+                    if event.get("objective") is not None:
+                        objective_var.set(f"Best schedule score: {event['objective']:,.0f}")
+                    if event.get("gap") is not None:
+                        gap_var.set(f"Gap to optimum: {event['gap']:.1%}")
+                    if event.kind == INCUMBENT and CAN_STOP_EARLY and not (worker.cancelled or worker.stopping):
+                        stop_btn.config(state="normal")
+                elif event.kind in (RESULT, ERROR):
+                    final = event
+                    break
+        except queue.Empty:
+            pass
+        minutes, seconds = divmod(int(worker.elapsed()), 60)
+        elapsed_var.set(f"Elapsed: {minutes}:{seconds:02d}")
+        if final is None:
+            root.after(poll_ms, poll)
+            return
+        bar.stop()
+        dlg.grab_release()
+        dlg.destroy()
+        on_finished(final)
+
+    worker.start()
+    root.after(poll_ms, poll)
+    return dlg
 
 def generate_schedule(emp_var, req_var, limits_var, start_date_entry, num_weeks_var,
                       summary_text, viz_frame, root, notebook, schedule_container,
-                      emp_frame, req_frame, limits_frame):
+                      emp_frame, req_frame, limits_frame, on_complete=None):
     """
     Generate and display schedules for dynamic work areas, with visualizations.
+
+    The input files are loaded here; the solve runs on a background thread
+    behind a progress dialog and the results are rendered when it finishes.
+    ``on_complete(areas)`` is called after a schedule has been displayed.
     """
-    global all_listboxes, schedule_trees
-    
     # Prompt user to save input data before generating schedule
     response = messagebox.askyesnocancel(
         "Save Input Data",
@@ -1013,8 +1134,6 @@ def generate_schedule(emp_var, req_var, limits_var, start_date_entry, num_weeks_
     emp_path = emp_var.get()
     req_path = req_var.get()
     limits_path = limits_var.get()
-    all_listboxes = []
-    schedule_trees = {} 
     try:
         start_date = start_date_entry.get_date()
     except tk.TclError:
@@ -1025,20 +1144,76 @@ def generate_schedule(emp_var, req_var, limits_var, start_date_entry, num_weeks_
         messagebox.showerror("Error", "Number of weeks must be at least 1")
         return
     try:
-        for widget in schedule_container.winfo_children():
-            widget.destroy()
-        day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        start_weekday = start_date.weekday()
-        actual_days = [day_names[(start_weekday + k) % 7] for k in range(7)]
+        calendar = HorizonCalendar(start_date, num_weeks)
         result = load_csv(emp_path, req_path, limits_path, start_date, num_weeks)
         if result is None:
             return
-        employees, _, shifts, areas, shift_prefs, day_prefs, must_off, required, work_areas, constraints, min_shifts, max_shifts, max_weekend_days = result
-        # === SOLVE ===
-        prob, x, result_dict = solve_schedule(
-            employees, range(7), shifts, areas, shift_prefs, day_prefs, must_off, required, work_areas, constraints,
-            min_shifts, max_shifts, max_weekend_days, start_date, num_weeks=num_weeks
-        )
+    except Exception as e:
+        messagebox.showerror("Error", f"Unexpected error: {str(e)}")
+        logging.error(f"generate_schedule error: {e}", exc_info=True)
+        return
+    employees, _, shifts, areas, shift_prefs, day_prefs, must_off, required, work_areas, constraints, min_shifts, max_shifts, max_weekend_days = result
+    warm_start = _ask_warm_start(root, calendar, areas)
+    # === SOLVE (background thread) ===
+    worker = SolveWorker(
+        (employees, range(7), shifts, areas, shift_prefs, day_prefs, must_off, required, work_areas, constraints,
+         min_shifts, max_shifts, max_weekend_days, start_date),
+        {"num_weeks": num_weeks, "calendar": calendar, "warm_start": warm_start}
+    )
+
+    def on_finished(event):
+        if event.kind == ERROR:
+            messagebox.showerror("Error", f"Unexpected error: {str(event['error'])}")
+            return
+        prob, x, result_dict = event["result"]
+        if result_dict.get("cancelled"):
+            messagebox.showinfo("Cancelled", "Schedule generation was cancelled.\nThe previous schedule was kept.")
+            return
+        show_schedule_results(prob, result_dict, result, calendar, emp_path,
+                              summary_text, viz_frame, root, notebook, schedule_container)
+        if on_complete is not None:
+            on_complete(areas)
+
+    run_solve_with_progress(root, worker, on_finished)
+
+
+def _ask_warm_start(root, calendar, areas):
+    """
+    A copy of the schedule opened with File > Open Schedule as the MIP start,
+    if it covers the same horizon and areas as this solve and the user
+    chooses to start from it; ``None`` otherwise.
+    """
+    if opened_schedule is None or schedule_tabs is None or not schedule_tabs.winfo_exists() \
+            or schedule_tabs.result is not opened_schedule:
+        return None
+    opened = opened_schedule.calendar
+    if (opened.start_date, opened.num_weeks) != (calendar.start_date, calendar.num_weeks) \
+            or set(opened_schedule.areas) != set(areas):
+        return None
+    if not messagebox.askyesno(
+            "Start From Opened Schedule",
+            "Start the solver from the opened schedule?\n\n"
+            "Yes: keep as much of it as the inputs allow\n"
+            "No: solve from scratch", parent=root):
+        return None
+    return opened_schedule.copy()
+
+
+def show_schedule_results(prob, result_dict, inputs, calendar, emp_path,
+                          summary_text, viz_frame, root, notebook, schedule_container):
+    """
+    Render a finished solve: schedule tables, summary report, CSV files and charts.
+    ``inputs`` is the tuple returned by ``load_csv``.
+    """
+    global all_listboxes, schedule_tabs, opened_schedule
+    employees, _, shifts, areas, shift_prefs, day_prefs, must_off, required, work_areas, constraints, min_shifts, max_shifts, max_weekend_days = inputs
+    start_date, num_weeks = calendar.start_date, calendar.num_weeks
+    all_listboxes = []
+    schedule_tabs = None
+    opened_schedule = None
+    try:
+        for widget in schedule_container.winfo_children():
+            widget.destroy()
         # -------------------------------------------------
         # 1. CAPACITY REPORT – ALWAYS available in result_dict
         # -------------------------------------------------
@@ -1069,11 +1244,11 @@ def generate_schedule(emp_var, req_var, limits_var, start_date_entry, num_weeks_
                     line.strip() for line in fixes_part.splitlines() if line.strip()
                 )
             report_lines.extend(["", min_str.strip()])
-            summary_text.insert(tk.END, "\n".join(report_lines) + "\n")
-            summary_file = os.path.join(user_output_dir(), f"Summary_report_{start_date:%Y-%m-%d}.csv")
+            report = "\n".join(report_lines) + "\n"
+            summary_text.insert(tk.END, report)
+            summary_file = summary_filename(user_output_dir(), start_date, "csv")
             try:
-                with open(summary_file, "w", encoding="utf-8") as f:
-                    f.write("\n".join(report_lines))
+                write_text(summary_file, report)
                 logging.info(f"Saved failure summary to {summary_file}")
             except Exception as e:
                 logging.error(f"Failed to save failure summary: {e}")
@@ -1088,138 +1263,104 @@ def generate_schedule(emp_var, req_var, limits_var, start_date_entry, num_weeks_
         # === SUCCESS PATH  ===
         violations = result_dict.get("violations", [])
         violations_str = "Weekend constraint violations:\n" + ("\n".join(violations) if violations else "None")
-        save_messages = []
-        schedule_trees = {area: [] for area in areas}
-        for area in areas:
-            area_label = tk.Label(schedule_container, text=f"{area} Schedule", font=("Arial", 12, "bold"))
-            area_label.pack(pady=(15 if area == areas[0] else 20, 5), anchor="center")
-            area_frame = tk.Frame(schedule_container)
-            area_frame.pack(pady=5, fill="both", expand=True)
-            for week in range(1, num_weeks + 1):
-                tree = create_schedule_treeview(area_frame, week, start_date, shifts, actual_days)
-                schedule_trees[area].append(tree)
-                all_listboxes.append(tree)
-                area_schedule = result_dict.get(f"{area.lower()}_schedule", [])
-                for e, date_str, day, s, a in area_schedule:
-                    if a != area: continue
-                    date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                    week_idx = (date_obj - start_date).days // 7 + 1
-                    if week_idx != week: continue
-                    k = (date_obj - (start_date + datetime.timedelta(days=(week-1)*7))).days
-                    if 0 <= k < 7:
-                        current = tree.set(s, actual_days[k])
-                        tree.set(s, actual_days[k], f"{current}, {e}" if current else e)
-                tree.bind("<Double-1>", lambda e, t=tree, a=area, emp=emp_path: edit_schedule_cell(t, e, a, emp))
-            filename = os.path.join(user_output_dir(), f"{area}_schedule_{start_date:%Y-%m-%d}.csv")
-            try:
-                save_area_schedule(schedule_trees[area], filename, start_date, num_weeks, actual_days, area)
-                save_messages.append(f"Saved {area} schedule to {filename}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save {area} schedule: {e}")
+        assignments = to_schedule_result(result_dict, employees, shifts, areas, calendar)
+        # One tab per area, each drawn when first opened; the area CSVs are
+        # written in the background (see the end of this function)
+        schedule_tabs = ScheduleTabs(
+            schedule_container, assignments,
+            on_edit=lambda *cell: edit_schedule_cell(*cell, emp_file_path=emp_path)
+        )
+        schedule_tabs.pack(pady=5, fill="both", expand=True)
         # === Summary Report (UI) ===
         min_emps, min_str, violations = min_employees_to_avoid_weekend_violations(
             max_weekend_days, areas, violations, work_areas, employees,
-            start_date=start_date, num_weeks=num_weeks, result_dict=result_dict
+            start_date=start_date, num_weeks=num_weeks, result_dict=result_dict, calendar=calendar
         )
         violations_str = "Weekend constraint violations:\n" + ("\n".join(violations) if violations else "None")
+        # Employee shift counts, shared with the charts below; the report text
+        # is built once, for the Summary tab and the file written with the schedules
+        summary = summarize(assignments)
+        report = summary_report(summary, employees, capacity_report, violations, min_str)
         summary_text.delete(1.0, tk.END)
-        if capacity_report:
-            summary_text.insert(tk.END, capacity_report + "\n\n")
-        summary_text.insert(tk.END, violations_str + "\n\n")
-        summary_text.insert(tk.END, min_str + "\n\n")
-        # Employee shift summary
-        summary_text.insert(tk.END, "Employee Shift Summary:\n")
-        summary_text.insert(tk.END, f"{'Employee':<20} {'Total':<8} {'Weeks':<20}\n")
-        summary_text.insert(tk.END, "-" * 48 + "\n")
-        # Build employee shift counts
-        summary_df = pd.DataFrame(index=employees, columns=["Employee", "Total Shifts"] + [f"Week {i+1}" for i in range(num_weeks)])
-        summary_df["Employee"] = employees
-        shift_counts = {e: {w: 0 for w in range(num_weeks)} for e in employees}
-        for area in areas:
-            for e, date_str, _, _, a in result_dict.get(f"{area.lower()}_schedule", []):
-                if a != area: continue
-                date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                week_idx = (date_obj - start_date).days // 7
-                if 0 <= week_idx < num_weeks:
-                    shift_counts[e][week_idx] += 1
-        total_shifts = 0
-        for e in employees:
-            weekly = [shift_counts[e][w] for w in range(num_weeks)]
-            summary_df.loc[e, [f"Week {i+1}" for i in range(num_weeks)]] = weekly
-            total = sum(weekly)
-            summary_df.loc[e, "Total Shifts"] = total
-            total_shifts += total
-            weeks = ", ".join(str(int(summary_df.loc[e, f"Week {i+1}"])) for i in range(num_weeks))
-            summary_text.insert(tk.END, f"{e:<20} {int(total):<8} {weeks}\n")
-        summary_text.insert(tk.END, f"\n{'Overall Total Shifts':<20} {total_shifts}\n")
-        # === Save Summary Report to file ===
-        summary_file = os.path.join(user_output_dir(), f"Summary_report_{start_date:%Y-%m-%d}.txt")
-        try:
-            file_lines = []
-            if capacity_report:
-                file_lines.append(capacity_report)
-                file_lines.append("")
-            file_lines.append(violations_str)
-            file_lines.append("")
-            file_lines.append(min_str.strip())
-            file_lines.append("")
-            file_lines.append("Employee Shift Summary:")
-            file_lines.append(f"{'Employee':<20} {'Total':<8} {'Weeks':<20}")
-            file_lines.append("-" * 48)
-            for e in employees:
-                weeks = ", ".join(str(int(summary_df.loc[e, f"Week {i+1}"])) for i in range(num_weeks))
-                file_lines.append(f"{e:<20} {int(summary_df.loc[e, 'Total Shifts']):<8} {weeks}")
-            file_lines.append(f"\n{'Overall Total Shifts':<20} {total_shifts}")
-            with open(summary_file, "w", encoding="utf-8") as f:
-                f.write("\n".join(file_lines))
-            save_messages.append(f"Saved summary to {summary_file}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save summary: {e}")
+        summary_text.insert(tk.END, report)
         # === Visualizations ===
-        try:
-            for child in viz_frame.winfo_children():
-                child.destroy()
-            active = [e for e in employees if summary_df.loc[e, "Total Shifts"] > 0]
-            fig, axs = plt.subplots(2, 2, figsize=(max(10, len(active)*0.5)+5, 10),
-                                  gridspec_kw={'width_ratios': [3, 1], 'height_ratios': [1, 1]})
-            colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
-            # Plot 1
-            week_data = {f'Week {i+1}': [int(summary_df.loc[e, f'Week {i+1}']) for e in active] for i in range(num_weeks)}
-            bottom = np.zeros(len(active))
-            for i, (week, data) in enumerate(week_data.items()):
-                axs[0,0].bar(active, data, label=week, bottom=bottom, color=colors[i % len(colors)])
-                bottom += data
-            axs[0,0].set_title('Shifts per Employee (by Week)')
-            axs[0,0].legend()
-            axs[0,0].tick_params(axis='x', rotation=45, labelsize=8)
-            # Plot 2
-            axs[0,1].bar(week_data.keys(), [sum(d) for d in week_data.values()], color=colors[:num_weeks])
-            axs[0,1].set_title('Total Shifts per Week')
-            # Plot 3
-            area_counts = {a: [0]*len(active) for a in areas}
-            for i, e in enumerate(active):
-                for area in areas:
-                    area_counts[area][i] = sum(1 for entry in result_dict.get(f"{area.lower()}_schedule", []) if entry[0] == e)
-            bottom = np.zeros(len(active))
-            for i, (area, data) in enumerate(area_counts.items()):
-                axs[1,0].bar(active, data, label=area, bottom=bottom, color=colors[i % len(colors)])
-                bottom += data
-            axs[1,0].set_title('Shifts per Employee (by Area)')
-            axs[1,0].legend()
-            axs[1,0].tick_params(axis='x', rotation=45, labelsize=8)
-            # Plot 4
-            axs[1,1].bar(areas, [sum(d) for d in area_counts.values()], color=colors[:len(areas)])
-            axs[1,1].set_title('Total Shifts per Area')
-            plt.tight_layout()
-            canvas = FigureCanvasTkAgg(fig, viz_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill='both', expand=True)
-            viz_frame.figure = fig
-        except Exception as e:
-            messagebox.showerror("Error", f"Visualization failed: {e}")
-            tk.Label(viz_frame, text="Visualization failed.").pack()
+        _show_charts(viz_frame, summary)
         adjust_column_widths(root, all_listboxes, all_input_trees, notebook, summary_text)
-        messagebox.showinfo("Success", "\n".join(save_messages) + "\n\n" + violations_str + "\n\n" + min_str)
+        export_area_schedules(
+            root, assignments, areas, summary=report, violations=violations,
+            on_done=lambda messages: messagebox.showinfo(
+                "Success", "\n".join(messages) + "\n\n" + violations_str + "\n\n" + min_str)
+        )
     except Exception as e:
         messagebox.showerror("Error", f"Unexpected error: {str(e)}")
-        logging.error(f"generate_schedule error: {e}", exc_info=True)
\ No newline at end of file
+        logging.error(f"generate_schedule error: {e}", exc_info=True)
+
+
+def _show_charts(viz_frame, summary):
+    """Draw ``summary`` in the Visualizations panel, creating the chart widget on first use."""
+    try:
+        charts = getattr(viz_frame, "charts", None)
+        if charts is None or not charts.winfo_exists():
+            for child in viz_frame.winfo_children():
+                child.destroy()
+            charts = viz_frame.charts = ScheduleCharts(viz_frame)
+            charts.pack(fill='both', expand=True)
+        charts.show(summary)
+    except Exception as e:
+        messagebox.showerror("Error", f"Visualization failed: {e}")
+        close_charts(viz_frame)
+        tk.Label(viz_frame, text="Visualization failed.").pack()
+
+
+def open_saved_schedule(emp_var, summary_text, viz_frame, root, notebook, schedule_container, on_complete=None):
+    """
+    File > Open Schedule: read saved schedule files (the area CSVs of one
+    run, a workbook or an assignment table) and show them without solving.
+    Generate Schedule offers it as the solver's MIP start while the start
+    date, weeks and areas match. ``on_complete(areas)`` is called once it is
+    displayed.
+    """
+    global all_listboxes, schedule_tabs, opened_schedule
+    paths = filedialog.askopenfilenames(
+        parent=root, title="Open Schedule", initialdir=user_output_dir(),
+        filetypes=[("Saved schedules", "*.csv *.xlsx *.parquet"), ("All files", "*.*")]
+    )
+    if not paths:
+        return
+    try:
+        result = load_schedule(paths)
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to open schedule: {e}")
+        logging.error(f"Failed to open schedule {paths}: {e}")
+        return
+    logging.info(f"Opened schedule with {len(result)} assignments from {len(paths)} file(s)")
+    all_listboxes = []
+    for widget in schedule_container.winfo_children():
+        widget.destroy()
+    schedule_tabs = ScheduleTabs(
+        schedule_container, result,
+        on_edit=lambda *cell: edit_schedule_cell(*cell, emp_file_path=emp_var.get())
+    )
+    schedule_tabs.pack(pady=5, fill="both", expand=True)
+    opened_schedule = result
+    summary = summarize(result)
+    calendar = result.calendar
+    header = [f"Opened schedule: {calendar.start_date:%Y-%m-%d}, {calendar.num_weeks} week(s)"]
+    header += [f"  {os.path.basename(p)}" for p in paths]
+    summary_text.delete(1.0, tk.END)
+    summary_text.insert(tk.END, "\n".join(header) + "\n\n" + employee_summary_text(summary) + "\n")
+    _show_charts(viz_frame, summary)
+    adjust_column_widths(root, all_listboxes, all_input_trees, notebook, summary_text)
+    if on_complete is not None:
+        on_complete(result.areas)
+
+
+def close_charts(viz_frame):
+    """Remove the Visualizations panel and free its matplotlib figure."""
+    charts = getattr(viz_frame, "charts", None)
+    if charts is not None:
+        if charts.winfo_exists():
+            charts.close()
+        viz_frame.charts = None
+    for child in viz_frame.winfo_children():
+        child.destroy()
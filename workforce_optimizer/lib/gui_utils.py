@@ -0,0 +1,236 @@
+# gui_utils.py
+"""Tk helpers for the window: settings dialog, Treeview lookup and column sizing, resize / scroll handlers."""
+import weakref
+import tkinter as tk
+from tkinter import ttk
+from tkinter import filedialog, messagebox
+from pathlib import Path
+from .utils import _load_settings, _save_settings, export_formats, user_data_dir, user_output_dir
+
+
+# ------------------------------------------------------------------
+# UI – Settings dialog (called from main.py)
+# ------------------------------------------------------------------
+def show_settings_dialog(parent: tk.Tk):
+    """
+    Modal dialog that lets the user pick a new data / output root folder.
+    The selected folder will contain the sub-folders ``data`` and ``output``.
+    """
+    dlg = tk.Toplevel(parent)
+    dlg.title("Settings – Folder Locations")
+    dlg.geometry("800x260")
+    dlg.transient(parent)
+    dlg.grab_set()
+    dlg.resizable(False, False)
+    try:
+        from main import resource_path 
+        dlg.iconbitmap(resource_path(r'icons\teamwork.ico'))
+    except Exception as e:
+        pass
+    cur_data_root = Path(user_data_dir())
+    cur_output_root = Path(user_output_dir())
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+    pad = dict(padx=10, pady=5)
+    frm = ttk.Frame(dlg, padding=10)
+    frm.pack(fill="both", expand=True)
+    # Data folder
+    ttk.Label(frm, text="Data folder (CSV files will be stored here):").grid(row=0, column=0, sticky="w", **pad)
+    data_var = tk.StringVar(value=str(cur_data_root))
+    ttk.Entry(frm, textvariable=data_var, width=50).grid(row=0, column=1, **pad)
+    
+    def browse_data_folder():
+        folder = filedialog.askdirectory(
+            initialdir=data_var.get(),
+            title="Select Data folder (CSV files will be stored here)",
+            parent=dlg
+        )
+        if folder:
+            data_var.set(folder)
+    
+    ttk.Button(frm, text="Browse…", command=browse_data_folder).grid(row=0, column=2, **pad)
+    # Output folder
+    ttk.Label(frm, text="Output folder (schedules, reports will be saved here):").grid(row=1, column=0, sticky="w", **pad)
+    out_var = tk.StringVar(value=str(cur_output_root))
+    ttk.Entry(frm, textvariable=out_var, width=50).grid(row=1, column=1, **pad)
+    
+    def browse_output_folder():
+        folder = filedialog.askdirectory(
+            initialdir=out_var.get(),
+            title="Select Output folder (schedules and reports will be saved here)",
+            parent=dlg
+        )
+        if folder:
+            out_var.set(folder)
+    
+    ttk.Button(frm, text="Browse…", command=browse_output_folder).grid(row=1, column=2, **pad)
+    # Extra export formats
+    formats = export_formats()
+    xlsx_var = tk.BooleanVar(value="xlsx" in formats)
+    parquet_var = tk.BooleanVar(value="parquet" in formats)
+    rosters_var = tk.BooleanVar(value="rosters" in formats)
+    fmt_frm = ttk.Frame(frm)
+    fmt_frm.grid(row=2, column=0, columnspan=3, sticky="w", **pad)
+    ttk.Checkbutton(fmt_frm, text="Also save an Excel workbook (all areas and summaries)",
+                    variable=xlsx_var).pack(anchor="w")
+    ttk.Checkbutton(fmt_frm, text="Also save a Parquet assignment table",
+                    variable=parquet_var).pack(anchor="w")
+    ttk.Checkbutton(fmt_frm, text="Also save per-employee rosters (calendar and CSV files, zipped)",
+                    variable=rosters_var).pack(anchor="w")
+    # Buttons
+    btn_frm = ttk.Frame(frm)
+    btn_frm.grid(row=3, column=0, columnspan=3, pady=15)
+    def apply():
+        new_data = Path(data_var.get().strip())
+        new_output = Path(out_var.get().strip())
+        if not new_data.is_dir():
+            messagebox.showerror("Invalid folder", "Data folder does not exist.", parent=dlg)
+            return
+        if not new_output.is_dir():
+            messagebox.showerror("Invalid folder", "Output folder does not exist.", parent=dlg)
+            return
+        settings = _load_settings()
+        settings.update(data_dir=str(new_data), output_dir=str(new_output),
+                        export_formats=[f for f, var in (("xlsx", xlsx_var), ("parquet", parquet_var),
+                                                          ("rosters", rosters_var)) if var.get()])
+        _save_settings(settings)
+        messagebox.showinfo("Settings saved",
+                            "Folder locations updated.\n"
+                            "The application will use the new paths from now on.",
+                            parent=dlg)
+        dlg.destroy()
+    ttk.Button(btn_frm, text="Apply", command=apply).pack(side="left", padx=5)
+    ttk.Button(btn_frm, text="Cancel", command=dlg.destroy).pack(side="left", padx=5)
+    dlg.update_idletasks()
+    x = parent.winfo_x() + (parent.winfo_width() // 2) - (dlg.winfo_width() // 2)
+    y = parent.winfo_y() + (parent.winfo_height() // 2) - (dlg.winfo_height() // 2)
+    dlg.geometry(f"+{x}+{y}")
+    parent.wait_window(dlg)
+
+
+def find_treeviews(widget):
+    """
+    Recursively find all ttk.Treeview widgets in the widget and its descendants.
+    """
+    treeviews = []
+    for child in widget.winfo_children():
+        if isinstance(child, ttk.Treeview):
+            treeviews.append(child)
+        else:
+            treeviews.extend(find_treeviews(child))
+    return treeviews
+
+
+# ------------------------------------------------------------------
+# Treeview column widths – measured once per tree, cached per column
+# ------------------------------------------------------------------
+RESIZE_DEBOUNCE_MS = 150
+_column_widths = weakref.WeakKeyDictionary()   # tree -> {column: width}
+_resize_jobs = {}                              # root -> pending after() id
+
+
+def _header_width(col):
+    return max(len(col) * 10, 100)
+
+
+def _cell_width(value):
+    return len(str(value)) * 8
+
+
+def measure_column_widths(tree, max_lengths=None):
+    """
+    Walk the tree's cells once (one ``item()`` call per row), cache the width
+    each column needs and apply it. Call after loading data or changing rows /
+    columns; single-cell edits use :func:`column_width_changed` instead.
+    ``max_lengths`` ({column: longest cell}, e.g. from a
+    :class:`~lib.table_model.TableModel`) skips the walk.
+    """
+    columns = list(tree["columns"])
+    widths = {col: _header_width(col) for col in columns}
+    if max_lengths is not None:
+        for col in columns:
+            widths[col] = max(widths[col], max_lengths.get(col, 0) * 8)
+        _column_widths[tree] = widths
+        apply_column_widths(tree)
+        return widths
+    for item in tree.get_children():
+        for col, value in zip(columns, tree.item(item, "values")):
+            w = _cell_width(value)
+            if w > widths[col]:
+                widths[col] = w
+    _column_widths[tree] = widths
+    apply_column_widths(tree)
+    return widths
+
+
+def apply_column_widths(tree):
+    """Re-apply the cached widths (e.g. after ``tree["columns"]`` was reassigned)."""
+    widths = _column_widths.get(tree)
+    if widths is None:
+        return measure_column_widths(tree)
+    for col in tree["columns"]:
+        tree.column(col, width=widths.setdefault(col, _header_width(col)), minwidth=100, stretch=1)
+    return widths
+
+
+def column_width_changed(tree, col, value):
+    """Grow the cached width of ``col`` to fit an edited cell, without a rescan."""
+    widths = _column_widths.get(tree)
+    if widths is None:
+        measure_column_widths(tree)
+        return
+    w = max(widths.get(col, _header_width(col)), _cell_width(value))
+    if w != widths.get(col):
+        widths[col] = w
+        tree.column(col, width=w, minwidth=100, stretch=1)
+
+
+def _update_horizontal_scrollbar(tree, width):
+    widths = _column_widths.get(tree)
+    if widths is None:
+        widths = measure_column_widths(tree)
+    total_content_width = sum(widths.get(col, 0) for col in tree["columns"])
+    hsb = tree.master.children.get('!scrollbar2')
+    if hsb and total_content_width > width - 50:
+        hsb.grid()
+    elif hsb:
+        hsb.grid_remove()
+
+
+def adjust_column_widths(root, all_listboxes, all_input_trees, notebook, summary_text):
+    """
+    Adjust column widths for Treeview widgets and summary text width based on window size.
+    Column widths come from the per-tree cache (measured on first use), so this
+    only toggles the horizontal scrollbars and resizes the summary text.
+    """
+    width = root.winfo_width()
+    for tree in list(all_listboxes) + list(all_input_trees):
+        if tree.winfo_exists():
+            _update_horizontal_scrollbar(tree, width)
+    notebook.update_idletasks()
+    char_width = max(50, (width - 30) // 10)
+    summary_text.configure(width=char_width)
+
+def on_resize(event, root, all_listboxes, all_input_trees, notebook, summary_text):
+    """
+    Handle window resize event to adjust widget sizes. A burst of <Configure>
+    events is collapsed into one adjustment RESIZE_DEBOUNCE_MS after the last.
+    """
+    if event.widget != root:
+        return
+    job = _resize_jobs.pop(root, None)
+    if job is not None:
+        root.after_cancel(job)
+
+    def run():
+        _resize_jobs.pop(root, None)
+        adjust_column_widths(root, all_listboxes, all_input_trees, notebook, summary_text)
+
+    _resize_jobs[root] = root.after(RESIZE_DEBOUNCE_MS, run)
+
+def on_mousewheel(event, canvas):
+    """
+    Handle mouse wheel scrolling for the canvas.
+    """
+    canvas.yview_scroll(-1 * (event.delta // 120), "units")
@@ -0,0 +1,160 @@
+# horizon.py
+import datetime as dt
+
+import numpy as np
+
+DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+MUST_OFF_FORMAT = "%m/%d/%Y"
+
+
+class HorizonCalendar:
+    """
+    Date index for one scheduling run, built once and shared by the solver,
+    the schedule renderer and the reports.
+
+    Every day of the horizon has a *day index* ``d = week * 7 + offset``
+    (``offset`` 0 is the start date's weekday, not necessarily Monday).
+
+    Attributes
+    ----------
+    start_date : datetime.date
+    num_weeks, num_days : int
+    week, offset : np.ndarray
+        Week number and day offset per day index.
+    dates : list of datetime.date
+    date_strs : list of str
+        ``YYYY-MM-DD`` per day index (the format used in schedule rows).
+    actual_days : list of str
+        Weekday names for offsets 0..6, e.g. ``["Sun", "Mon", ...]``.
+    day_names : list of str
+        Weekday name per day index.
+    """
+
+    def __init__(self, start_date, num_weeks):
+        if isinstance(start_date, dt.datetime):
+            start_date = start_date.date()
+        self.start_date = start_date
+        self.num_weeks = int(num_weeks)
+        self.num_days = 7 * self.num_weeks
+
+        days = np.arange(self.num_days)
+        self.week = days // 7
+        self.offset = days % 7
+
+        self.dates = [start_date + dt.timedelta(days=int(d)) for d in days]
+        self.date_strs = [d.strftime("%Y-%m-%d") for d in self.dates]
+        self.end_date = self.dates[-1] if self.dates else start_date
+
+        start_weekday = start_date.weekday()
+        self.actual_days = [DAY_NAMES[(start_weekday + k) % 7] for k in range(7)]
+        self.day_names = [self.actual_days[k] for k in self.offset]
+
+        self._index_by_str = {s: i for i, s in enumerate(self.date_strs)}
+        self._index_by_date = {d: i for i, d in enumerate(self.dates)}
+        self._must_off_cache = {}
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def index(self, value):
+        """
+        Day index of a ``date`` or ``YYYY-MM-DD`` string, or ``None`` when it is
+        outside the horizon.
+        """
+        if isinstance(value, str):
+            return self._index_by_str.get(value)
+        if isinstance(value, dt.datetime):
+            value = value.date()
+        return self._index_by_date.get(value)
+
+    def week_offset(self, value):
+        """``(week, offset)`` tuple for a date / date string, or ``None``."""
+        d = self.index(value)
+        return None if d is None else divmod(d, 7)
+
+    def aligned_days(self, other):
+        """
+        For each day index of this horizon, the day index of ``other`` with the
+        same weekday in week ``week % other.num_weeks``: how a previous
+        schedule is laid onto this one (the identity for the same horizon).
+        """
+        pos = {name: k for k, name in enumerate(other.actual_days)}
+        offsets = np.array([pos[name] for name in self.actual_days], dtype=np.int64)
+        return (self.week % other.num_weeks) * 7 + offsets[self.offset]
+
+    def week_start(self, week):
+        """First date of 0-based ``week``."""
+        return self.start_date + dt.timedelta(days=week * 7)
+
+    def week_end(self, week):
+        return self.start_date + dt.timedelta(days=week * 7 + 6)
+
+    def week_range_label(self, week):
+        """``Nov 09, 2025 - Nov 15, 2025`` for 0-based ``week``."""
+        return f"{self.week_start(week):%b %d, %Y} - {self.week_end(week):%b %d, %Y}"
+
+    def day_headings(self, week):
+        """Column headings ``Sun, Nov 09, 25`` for the seven days of ``week``."""
+        return [f"{self.actual_days[k]}, {self.dates[week * 7 + k]:%b %d, %y}" for k in range(7)]
+
+    # ------------------------------------------------------------------
+    # Weekends
+    # ------------------------------------------------------------------
+    def weekends(self, complete_only=False):
+        """
+        Fri-Sat-Sun triplets touching the horizon, each a list of ``(week, offset)``.
+
+        With ``complete_only`` only weekends lying entirely inside the horizon are
+        returned (used for violation reporting); otherwise partial weekends at the
+        edges are included with the days that fall inside (used by the solver).
+        """
+        first_friday = self.start_date - dt.timedelta(days=(self.start_date.weekday() - 4) % 7)
+        result = []
+        friday = first_friday
+        while friday <= self.end_date:
+            triplet = []
+            for n in range(3):
+                d = self.index(friday + dt.timedelta(days=n))
+                if d is not None:
+                    triplet.append(divmod(d, 7))
+            if triplet and (not complete_only or len(triplet) == 3):
+                result.append(triplet)
+            friday += dt.timedelta(days=7)
+        return result
+
+    # ------------------------------------------------------------------
+    # Must-off
+    # ------------------------------------------------------------------
+    def must_off_days(self, must_off):
+        """
+        Parse the loader's ``must_off`` dict (``{emp: [(emp, "mm/dd/yyyy"), ...]}``)
+        once into ``{emp: set(day_index)}``. Dates outside the horizon or not
+        parseable are dropped (the loader already reports the latter).
+        """
+        key = id(must_off)
+        cached = self._must_off_cache.get(key)
+        if cached is not None and cached[0] is must_off:
+            return cached[1]
+        days = {}
+        for emp, entries in must_off.items():
+            idx = set()
+            for _, off in entries:
+                try:
+                    d = self.index(dt.datetime.strptime(off, MUST_OFF_FORMAT).date())
+                except ValueError:
+                    continue
+                if d is not None:
+                    idx.add(d)
+            if idx:
+                days[emp] = idx
+        self._must_off_cache[key] = (must_off, days)
+        return days
+
+    def must_off_mask(self, must_off, employees):
+        """Boolean ``(len(employees), num_days)`` array, True where the employee must be off."""
+        mask = np.zeros((len(employees), self.num_days), dtype=bool)
+        days = self.must_off_days(must_off)
+        for i, emp in enumerate(employees):
+            if emp in days:
+                mask[i, list(days[emp])] = True
+        return mask
@@ -0,0 +1,92 @@
+# log_utils.py
+import hashlib
+import logging
+
+import numpy as np
+
+# Custom level below DEBUG: full DataFrame dumps and per-employee dictionaries
+# are only formatted when the root logger is explicitly set to TRACE.
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+
+
+def trace_enabled() -> bool:
+    return logging.getLogger().isEnabledFor(TRACE)
+
+
+def parse_log_level(name, default=logging.DEBUG) -> int:
+    """
+    Map a level name from settings ("TRACE", "DEBUG", "INFO", ...) to its number.
+    Unknown values fall back to ``default``.
+    """
+    if isinstance(name, int):
+        return name
+    if not name:
+        return default
+    name = str(name).strip().upper()
+    if name == "TRACE":
+        return TRACE
+    level = logging.getLevelName(name)
+    return level if isinstance(level, int) else default
+
+
+class FrameSummary:
+    """
+    Lazy ``%s`` argument describing a DataFrame by shape, non-null count and a
+    content hash. Nothing is computed unless the record is actually emitted.
+    """
+    __slots__ = ("df",)
+
+    def __init__(self, df):
+        self.df = df
+
+    def __str__(self):
+        import pandas as pd  # only when a record is emitted; keeps the solver import light
+
+        df = self.df
+        rows, cols = df.shape
+        non_null = int(df.notna().to_numpy().sum())
+        try:
+            # Hash the cells as one flat array; hashing column by column is as
+            # slow as to_string() on wide Employee_Data sheets.
+            cells = df.to_numpy().ravel().astype(str).astype(object)
+            labels = np.array([str(v) for v in (*df.index, *df.columns)], dtype=object)
+            h = hashlib.sha1(pd.util.hash_array(cells, categorize=False).tobytes())
+            h.update(pd.util.hash_array(labels, categorize=False).tobytes())
+            digest = h.hexdigest()[:12]
+        except Exception:
+            digest = "n/a"
+        return f"shape={rows}x{cols}, non-null={non_null}, hash={digest}"
+
+
+class CountSummary:
+    """Lazy ``%s`` argument for large lists / dicts: item count plus the first few keys."""
+    __slots__ = ("items", "preview")
+
+    def __init__(self, items, preview=3):
+        self.items = items
+        self.preview = preview
+
+    def __str__(self):
+        keys = list(self.items)[:self.preview]
+        more = ", ..." if len(self.items) > self.preview else ""
+        return f"{len(self.items)} items [{', '.join(map(str, keys))}{more}]"
+
+
+def log_frame(label, df):
+    """
+    Log a loaded DataFrame: a one-line summary at DEBUG, the full ``to_string()``
+    dump only at TRACE.
+    """
+    if trace_enabled():
+        logging.log(TRACE, "%s:\n%s", label, df.to_string())
+    else:
+        logging.debug("%s: %s", label, FrameSummary(df))
+
+
+def log_mapping(label, mapping):
+    """Same as :func:`log_frame` for per-employee dicts and lists."""
+    if trace_enabled():
+        logging.log(TRACE, "%s: %s", label, mapping)
+    else:
+        logging.debug("%s: %s", label, CountSummary(mapping))
@@ -0,0 +1,166 @@
+# pipeline.py
+import dataclasses
+import time
+
+from .data_loader import load_inputs, InputError
+from .horizon import HorizonCalendar
+from .exporter import write_schedule_files, write_text
+from .reports import summarize, summary_report
+from .schedule_diff import compare_schedules
+from .schedule_import import load_schedule, ScheduleFormatError
+from .schedule_result import to_schedule_result
+from .solve_events import RESULT
+from .solver import solve_schedule
+from .utils import min_employees_to_avoid_weekend_violations
+
+SUCCESS_STATUSES = ("optimal", "feasible")
+
+
+def schedule_counts(result):
+    """Counts reported for a schedule: assignments, employees scheduled, per area and per shift."""
+    summary = summarize(result)
+    return {
+        "assignments": summary.total,
+        "employees_scheduled": int(summary.active.sum()),
+        "per_area": dict(zip(summary.areas, summary.per_area.tolist())),
+        "per_shift": dict(zip(summary.shifts, summary.per_shift.tolist())),
+    }
+
+
+def summarize_files(paths):
+    """
+    Read saved schedule files back (see lib/schedule_import.py) and report
+    the same counts as a solve, without solving.
+    """
+    started = time.perf_counter()
+    try:
+        result = load_schedule(paths)
+    except (OSError, ScheduleFormatError) as e:
+        return {"status": "error", "error": f"Failed to read schedule: {e}", "inputs": [str(p) for p in paths]}
+    return {"status": "loaded", "inputs": [str(p) for p in paths],
+            "start": result.calendar.start_date.isoformat(), "weeks": result.num_weeks,
+            "employees": len(result.employees), "shifts": result.shifts, "areas": result.areas,
+            **schedule_counts(result), "timings": {"load": round(time.perf_counter() - started, 3)}}
+
+
+def compare_files(before_paths, after_paths, alignment=None, changes_file=None):
+    """
+    Read two saved schedules and report what changed from ``before`` to
+    ``after`` (see lib/schedule_diff.py). ``changes_file`` receives one CSV
+    row per added or removed assignment.
+    """
+    started = time.perf_counter()
+    report = {"status": None, "before": [str(p) for p in before_paths], "after": [str(p) for p in after_paths]}
+    try:
+        before = load_schedule(before_paths)
+        after = load_schedule(after_paths, before.employees, before.shifts, before.areas)
+    except (OSError, ScheduleFormatError) as e:
+        report.update(status="error", error=f"Failed to read schedule: {e}")
+        return report
+    diff = compare_schedules(before, after, alignment)
+    report.update(status="compared", **diff.to_dict())
+    if changes_file:
+        try:
+            write_text(changes_file, diff.changes_frame().to_csv(index=False))
+            report["files"] = [str(changes_file)]
+        except OSError as e:
+            report["write_errors"] = [f"changes: {e}"]
+    report["timings"] = {"total": round(time.perf_counter() - started, 3)}
+    return report
+
+
+def solve_files(emp_file, req_file, limits_file, start_date, num_weeks, out_dir=None, write=True,
+                formats=("csv",), progress=None, cancel_event=None, stop_event=None, warm_start=None):
+    """
+    Load the three input CSVs, solve and write the area schedule CSVs and
+    the Summary Report (the same text as the app's Summary tab) to
+    ``out_dir`` (default: the output folder from Settings), in each of
+    ``formats`` (see ``lib.exporter.FORMATS``).
+
+    Returns a JSON-ready report: ``status`` (a ``RESULT`` status, or
+    ``"error"`` when the inputs are unusable), the relaxation ``attempt``,
+    ``objective``, counts per area / shift, ``warnings`` / ``issues`` as
+    ValidationIssue dicts, the ``files`` written and ``timings`` in seconds.
+    ``progress`` receives every :class:`~lib.solve_events.SolveEvent`;
+    ``cancel_event`` / ``stop_event`` are passed on to the solver.
+    ``warm_start`` is a ScheduleResult or saved schedule file(s) used as the
+    solver's MIP start.
+    """
+    started = time.perf_counter()
+    timings = {}
+    report = {"status": None, "start": start_date.isoformat(), "weeks": num_weeks,
+              "inputs": {"emp": str(emp_file), "req": str(req_file), "limits": str(limits_file)}}
+
+    def finish():
+        timings["total"] = time.perf_counter() - started
+        report["timings"] = {k: round(v, 3) for k, v in timings.items()}
+        return report
+
+    t = time.perf_counter()
+    warnings = []
+    try:
+        inputs = load_inputs(emp_file, req_file, limits_file, start_date, num_weeks, warnings=warnings)
+    except InputError as e:
+        timings["load"] = time.perf_counter() - t
+        report.update(status="error", error=f"Failed to load CSV files: {e}",
+                      issues=[dataclasses.asdict(i) for i in e.issues])
+        return finish()
+    timings["load"] = time.perf_counter() - t
+    report["warnings"] = [dataclasses.asdict(w) for w in warnings]
+    employees, _, shifts, areas, shift_prefs, day_prefs, must_off, required, work_areas, constraints, \
+        min_shifts, max_shifts, max_weekend_days = inputs
+    report.update(employees=len(employees), shifts=list(shifts), areas=list(areas))
+    if warm_start is not None and not hasattr(warm_start, "emp_id"):
+        t = time.perf_counter()
+        try:
+            warm_start = load_schedule(warm_start, employees, shifts, areas)
+        except (OSError, ScheduleFormatError) as e:
+            timings["warm_start"] = time.perf_counter() - t
+            report.update(status="error", error=f"Failed to read the warm start schedule: {e}")
+            return finish()
+        timings["warm_start"] = time.perf_counter() - t
+    if warm_start is not None:
+        report["warm_start"] = len(warm_start)
+
+    final = {}
+
+    def on_event(event):
+        if event.kind == RESULT:
+            final.update(event.to_dict())
+        if progress is not None:
+            return progress(event)
+
+    t = time.perf_counter()
+    calendar = HorizonCalendar(start_date, num_weeks)
+    prob, _, result_dict = solve_schedule(
+        employees, range(7), shifts, areas, shift_prefs, day_prefs, must_off, required, work_areas,
+        constraints, min_shifts, max_shifts, max_weekend_days, start_date,
+        num_weeks=num_weeks, calendar=calendar, progress=on_event,
+        cancel_event=cancel_event, stop_event=stop_event, warm_start=warm_start)
+    timings["solve"] = time.perf_counter() - t
+    report.update(status=final.get("status"), attempt=final.get("attempt"),
+                  objective=final.get("objective"))
+    if prob is None:
+        report["error"] = result_dict.get("error", "Unknown solver error.")
+        report["capacity_report"] = result_dict.get("capacity_report", "")
+        return finish()
+
+    assignments = to_schedule_result(result_dict, employees, shifts, areas, calendar)
+    _, staffing, violations = min_employees_to_avoid_weekend_violations(
+        max_weekend_days, areas, list(result_dict.get("violations", [])), work_areas, employees,
+        start_date=start_date, num_weeks=num_weeks, result_dict=result_dict, calendar=calendar)
+    report.update(schedule_counts(assignments), violations=violations)
+
+    files = []
+    if write:
+        t = time.perf_counter()
+        summary = summary_report(summarize(assignments), employees, result_dict.get("capacity_report", ""),
+                                 violations, staffing)
+        written = write_schedule_files(assignments, areas, out_dir, summary=summary, formats=formats,
+                                       violations=violations)
+        files = [path for _, path in written.files]
+        if written.errors:
+            report["write_errors"] = [f"{label}: {e}" for label, e in written.errors]
+        timings["write"] = time.perf_counter() - t
+    report["files"] = files
+    return finish()
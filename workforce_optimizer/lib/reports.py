@@ -0,0 +1,207 @@
+# reports.py
+import weakref
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+_summaries = weakref.WeakKeyDictionary()   # ScheduleResult -> (version, ScheduleSummary)
+
+
+@dataclass(frozen=True)
+class ScheduleSummary:
+    """
+    Shift counts of one :class:`~lib.schedule_result.ScheduleResult`, shared
+    by the Summary Report, the saved report files and the charts.
+
+    Every array comes from one grouping of the assignments (see
+    :func:`summarize`): ``employee_week`` is employees × weeks,
+    ``employee_area`` employees × areas, ``area_shift`` areas × shifts,
+    ``per_weekday`` one count per calendar column (``weekdays`` holds the
+    names, in the calendar's week order).
+    """
+    employees: list
+    areas: list
+    shifts: list
+    weekdays: list
+    employee_week: np.ndarray
+    employee_area: np.ndarray
+    area_shift: np.ndarray
+    per_weekday: np.ndarray
+
+    @property
+    def num_weeks(self):
+        return self.employee_week.shape[1]
+
+    @property
+    def week_labels(self):
+        return [f"Week {i+1}" for i in range(self.num_weeks)]
+
+    @property
+    def per_employee(self):
+        return self.employee_week.sum(axis=1)
+
+    @property
+    def per_week(self):
+        return self.employee_week.sum(axis=0)
+
+    @property
+    def per_area(self):
+        return self.area_shift.sum(axis=1)
+
+    @property
+    def per_shift(self):
+        return self.area_shift.sum(axis=0)
+
+    @property
+    def total(self):
+        return int(self.employee_week.sum())
+
+    @property
+    def active(self):
+        """Boolean mask of employees with at least one shift."""
+        return self.per_employee > 0
+
+    def employee_frame(self):
+        """``Employee``, ``Total Shifts`` and ``Week n`` columns, one row per employee."""
+        df = pd.DataFrame(self.employee_week, index=self.employees, columns=self.week_labels)
+        df.insert(0, "Total Shifts", self.per_employee)
+        df.insert(0, "Employee", self.employees)
+        return df
+
+    def employee_totals_frame(self):
+        """:meth:`employee_frame` followed by one shift-count column per area."""
+        df = self.employee_frame()
+        for a, area in enumerate(self.areas):
+            df[area] = self.employee_area[:, a]
+        return df
+
+    def area_shift_frame(self):
+        """Areas × shifts counts with a ``Total`` column and row."""
+        df = pd.DataFrame(self.area_shift, index=pd.Index(self.areas, name="Area"), columns=self.shifts)
+        df["Total"] = self.per_area
+        df.loc["Total"] = df.sum(axis=0)
+        return df
+
+
+def summarize(result):
+    """
+    :class:`ScheduleSummary` of ``result``, cached until the schedule is edited.
+
+    The assignments are grouped once on a combined (employee, week, area,
+    shift, weekday) key; each table above is a weighted ``bincount`` over the
+    groups rather than another scan of the assignments.
+    """
+    cached = _summaries.get(result)
+    if cached is not None and cached[0] == result.version:
+        return cached[1]
+    E, W = len(result.employees), result.num_weeks
+    A, S = len(result.areas), len(result.shifts)
+    key = result.emp_id.astype(np.int64)
+    for part, size in ((result.week, W), (result.area_id, A), (result.shift_id, S), (result.offset, 7)):
+        key = key * size + part
+    groups, counts = np.unique(key, return_counts=True)
+    groups, offset = np.divmod(groups, 7)
+    groups, shift = np.divmod(groups, S)
+    groups, area = np.divmod(groups, A)
+    emp, week = np.divmod(groups, W)
+
+    def table(index, size):
+        return np.bincount(index, weights=counts, minlength=size).astype(np.int64)
+
+    summary = ScheduleSummary(
+        employees=list(result.employees),
+        areas=list(result.areas),
+        shifts=list(result.shifts),
+        weekdays=list(result.calendar.actual_days),
+        employee_week=table(emp * W + week, E * W).reshape(E, W),
+        employee_area=table(emp * A + area, E * A).reshape(E, A),
+        area_shift=table(area * S + shift, A * S).reshape(A, S),
+        per_weekday=table(offset, 7),
+    )
+    _summaries[result] = (result.version, summary)
+    return summary
+
+
+def employee_summary_text(summary, employees=None):
+    """
+    The "Employee Shift Summary" block of the Summary Report: a row per
+    employee of ``employees`` (default: all of ``summary``) with the total
+    and the per-week counts. The rows are formatted a column at a time with
+    pandas string ops, not a lookup per employee.
+    """
+    df = summary.employee_frame()
+    if employees is not None:
+        df = df.reindex(list(employees)).fillna(0)
+    weeks = df[summary.week_labels].astype(np.int64).astype(str)
+    week_text = weeks.iloc[:, 0]
+    for label in summary.week_labels[1:]:
+        week_text = week_text + ", " + weeks[label]
+    rows = (df.index.to_series().astype(str).str.ljust(20) + " "
+            + df["Total Shifts"].astype(np.int64).astype(str).str.ljust(8) + " " + week_text)
+    head = f"Employee Shift Summary:\n{'Employee':<20} {'Total':<8} {'Weeks':<20}\n{'-' * 48}\n"
+    return head + "".join(row + "\n" for row in rows) + f"\n{'Overall Total Shifts':<20} {summary.total}"
+
+
+def summary_report(summary, employees=None, capacity_report="", violations=None, staffing=""):
+    """
+    Summary Report text, built once for the Summary tab, the saved
+    ``Summary_report`` file and the command line: the capacity report, the
+    weekend violations (when ``violations`` is a list), the ``staffing``
+    text from ``min_employees_to_avoid_weekend_violations`` and
+    :func:`employee_summary_text`, separated by blank lines.
+    """
+    sections = [capacity_report] if capacity_report else []
+    if violations is not None:
+        sections.append("Weekend constraint violations:\n" + ("\n".join(violations) if violations else "None"))
+    if staffing:
+        sections.append(staffing.strip())
+    sections.append(employee_summary_text(summary, employees))
+    return "\n\n".join(sections) + "\n"
+
+
+def assignment_frame(result):
+    """
+    One row per assignment (``Date``, ``Week``, ``Day``, ``Area``, ``Shift``,
+    ``Employee``), sorted by date, area and shift. Area, shift and employee
+    are categoricals built from the id arrays.
+    """
+    order = np.lexsort((result.shift_id, result.area_id, result.day_index))
+    day = result.day_index[order]
+    calendar = result.calendar
+    return pd.DataFrame({
+        "Date": pd.to_datetime(np.asarray(calendar.date_strs, dtype=object)[day]),
+        "Week": calendar.week[day] + 1,
+        "Day": pd.Categorical.from_codes(calendar.offset[day], calendar.actual_days),
+        "Area": pd.Categorical.from_codes(result.area_id[order], result.areas),
+        "Shift": pd.Categorical.from_codes(result.shift_id[order], result.shifts),
+        "Employee": pd.Categorical.from_codes(result.emp_id[order], result.employees),
+    })
+
+
+def area_frame(result, area):
+    """
+    One area's schedule with a row per day (``Week``, ``Date``, ``Day``) and
+    a column per shift holding the names, taken from ``cell_table``.
+    """
+    calendar = result.calendar
+    a = result.area_index(area)
+    df = pd.DataFrame({"Week": calendar.week + 1,
+                       "Date": pd.to_datetime(calendar.date_strs),
+                       "Day": calendar.day_names})
+    for s, shift in enumerate(result.shifts):
+        df[shift] = result.cell_table()[a, :, s] if a is not None else ""
+    return df
+
+
+def area_schedule_csv(result, area):
+    """One area's schedule (all weeks) from a ScheduleResult, as CSV text."""
+    calendar = result.calendar
+    lines = []
+    for week in range(calendar.num_weeks):
+        lines.append(f'"{area} Schedule ({calendar.week_range_label(week)})"')
+        lines.append("Day/Shift," + ",".join(f'"{h}"' for h in calendar.day_headings(week)))
+        lines.extend(",".join(f'"{v}"' for v in values) for values in result.week_table(area, week))
+        lines.append("")
+    return "\n".join(lines) + "\n" if lines else ""
+
@@ -0,0 +1,139 @@
+# rosters.py
+"""
+Per-employee rosters (iCalendar and CSV) for staff notifications, bundled
+into one zip.
+
+Built from the ScheduleResult arrays in one pass: the assignments are sorted
+by (employee, day, shift, area) once, and since a roster line depends only on
+its (day, shift, area) cell, every cell's ICS event and CSV row are rendered
+once and each employee's file is a join of those pieces. ICS content lines
+are folded at 75 octets (RFC 5545 3.1).
+"""
+import datetime as dt
+import hashlib
+import re
+import zipfile
+
+import numpy as np
+
+PRODID = "-//Workforce Optimizer//Roster//EN"
+
+
+def _ics_text(value):
+    """Escape a TEXT value (RFC 5545 3.3.11)."""
+    return (str(value).replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\n", "\\n"))
+
+
+def _slug(value):
+    return re.sub(r"[^\w-]+", "-", str(value)).strip("-")
+
+
+def _line(text):
+    """One ICS content line with its CRLF, folded into 75-octet pieces (continuations start with a space)."""
+    data = text.encode("utf-8")
+    if len(data) <= 75:
+        return text + "\r\n"
+    pieces, start, limit = [], 0, 75
+    while start < len(data):
+        end = min(start + limit, len(data))
+        while end < len(data) and (data[end] & 0xC0) == 0x80:   # don't split a UTF-8 sequence
+            end -= 1
+        pieces.append(data[start:end].decode("utf-8"))
+        start, limit = end, 74
+    return "\r\n ".join(pieces) + "\r\n"
+
+
+def _employee_uid(employee):
+    """
+    UID suffix for one employee: readable slug plus a hash of the exact name,
+    so names with the same slug ("Mary Ann", "Mary-Ann") stay distinct and
+    the UID does not change when other employees are added or removed.
+    """
+    digest = hashlib.sha1(str(employee).encode("utf-8")).hexdigest()[:10]
+    return f"{_slug(employee)}-{digest}@workforce-optimizer"
+
+
+def _file_names(employees):
+    """Filesystem-safe, unique base names, one per employee."""
+    used, names = set(), []
+    for e in employees:
+        base = re.sub(r"[^\w\- ]+", "_", str(e)).strip() or "employee"
+        name, n = base, 1
+        while name.lower() in used:
+            n += 1
+            name = f"{base}_{n}"
+        used.add(name.lower())
+        names.append(name)
+    return names
+
+
+def employee_rosters(result, stamp=None):
+    """
+    ``(employee, file name, ics text, csv text)`` for every employee of
+    ``result`` (an empty roster for employees without shifts). Events are
+    all-day (the inputs have shift names, not times) and their UIDs are
+    built from the date, shift, area and employee names (see
+    :func:`_employee_uid`), so a re-sent roster updates the events already
+    in a calendar. ``stamp`` is the DTSTAMP
+    (default: now, UTC).
+    """
+    calendar = result.calendar
+    stamp = (stamp or dt.datetime.now(dt.timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+    S, A = len(result.shifts), len(result.areas)
+
+    # One grouping pass: sort by employee, then day / shift / area within each roster
+    cell = (result.day_index.astype(np.int64) * S + result.shift_id) * A + result.area_id
+    order = np.lexsort((cell, result.emp_id))
+    cell = cell[order]
+    bounds = np.searchsorted(result.emp_id[order], np.arange(len(result.employees) + 1))
+
+    # Render each (day, shift, area) cell that occurs once
+    used = np.unique(cell)
+    d, rest = np.divmod(used, S * A)
+    s, a = np.divmod(rest, A)
+    ics_head, uid_head, csv_rows = {}, {}, {}
+    for key, di, si, ai in zip(used.tolist(), d.tolist(), s.tolist(), a.tolist()):
+        day = calendar.dates[di]
+        shift, area = result.shifts[si], result.areas[ai]
+        ics_head[key] = (
+            "BEGIN:VEVENT\r\n"
+            f"DTSTAMP:{stamp}\r\n"
+            f"DTSTART;VALUE=DATE:{day:%Y%m%d}\r\n"
+            f"DTEND;VALUE=DATE:{day + dt.timedelta(days=1):%Y%m%d}\r\n"
+            + _line(f"SUMMARY:{_ics_text(f'{shift} shift - {area}')}")
+            + _line(f"CATEGORIES:{_ics_text(area)}")
+        )
+        uid_head[key] = f"UID:{day:%Y%m%d}-{_slug(shift)}-{_slug(area)}-"
+        csv_rows[key] = f'"{day:%Y-%m-%d}","{calendar.day_names[di]}","{shift}","{area}"\n'
+
+    names = _file_names(result.employees)
+    cells = cell.tolist()
+    rosters = []
+    for i, employee in enumerate(result.employees):
+        keys = cells[bounds[i]:bounds[i + 1]]
+        uid = _employee_uid(employee)
+        ics = "".join([
+            "BEGIN:VCALENDAR\r\nVERSION:2.0\r\n",
+            f"PRODID:{PRODID}\r\nCALSCALE:GREGORIAN\r\n",
+            _line(f"X-WR-CALNAME:{_ics_text(f'{employee} schedule')}"),
+            *(ics_head[k] + _line(uid_head[k] + uid) + "END:VEVENT\r\n" for k in keys),
+            "END:VCALENDAR\r\n",
+        ])
+        csv_text = '"Date","Day","Shift","Area"\n' + "".join(csv_rows[k] for k in keys)
+        rosters.append((employee, names[i], ics, csv_text))
+    return rosters
+
+
+def write_rosters_zip(result, filename):
+    """
+    Zip of ``ics/<employee>.ics`` and ``csv/<employee>.csv`` for every
+    employee; returns the number of rosters. Meant for the export thread
+    (lib/exporter.py), which keeps it off the Tk thread.
+    """
+    rosters = employee_rosters(result)
+    with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as zf:
+        for _, name, ics, csv_text in rosters:
+            zf.writestr(f"ics/{name}.ics", ics)
+            zf.writestr(f"csv/{name}.csv", csv_text)
+    return len(rosters)
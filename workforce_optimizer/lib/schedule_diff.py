@@ -0,0 +1,209 @@
+# schedule_diff.py
+"""
+Assignment-level comparison of two schedules, e.g. the solver's output and
+the edited version, or this period's plan and the previous one.
+
+Both ScheduleResults are put on one id space: the ``after`` names come first,
+and names only found in ``before`` are appended. ``before`` is then laid onto
+the ``after`` calendar (see :func:`compare_schedules`). Each assignment becomes
+one int64 ``(employee, day, shift, area)`` key, so the diff is two set
+differences of sorted key arrays. The counts per employee, area and day are
+``bincount``s of the decoded keys.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+ALIGNMENTS = ("date", "weekday")
+
+
+@dataclass(frozen=True)
+class ScheduleDiff:
+    """
+    Changes from ``before`` to ``after``, on the ``after`` calendar.
+
+    ``added`` and ``removed`` are int64 ``(n, 4)`` arrays of ``(employee,
+    day index, shift, area)`` ids into ``employees`` / ``calendar`` /
+    ``shifts`` / ``areas``. ``days`` marks the day indexes that were
+    compared. ``before_count`` and ``after_count`` are the assignments on
+    those days.
+    """
+    employees: list
+    shifts: list
+    areas: list
+    calendar: object
+    alignment: str
+    days: np.ndarray
+    before_count: int
+    after_count: int
+    added: np.ndarray
+    removed: np.ndarray
+
+    @property
+    def unchanged(self):
+        return self.after_count - len(self.added)
+
+    @property
+    def churn(self):
+        """
+        Share of the two schedules' assignments that are not in both:
+        ``(added + removed) / (before + after)``. This is 0 for identical
+        schedules and 1 when no assignment was kept.
+        """
+        total = self.before_count + self.after_count
+        return (len(self.added) + len(self.removed)) / total if total else 0.0
+
+    @property
+    def reassigned(self):
+        """Employee-days that lost an assignment and gained a different one (a shift or area move)."""
+        D = self.calendar.num_days
+        lost = np.unique(self.removed[:, 0] * D + self.removed[:, 1])
+        gained = np.unique(self.added[:, 0] * D + self.added[:, 1])
+        return len(np.intersect1d(lost, gained, assume_unique=True))
+
+    def _counts(self, column, size):
+        """``(size, 2)`` added / removed counts by one id column."""
+        return np.column_stack([np.bincount(self.added[:, column], minlength=size),
+                                np.bincount(self.removed[:, column], minlength=size)])
+
+    @staticmethod
+    def _frame(counts, index):
+        df = pd.DataFrame(counts, index=index, columns=["Added", "Removed"])
+        df["Changed"] = df["Added"] + df["Removed"]
+        return df
+
+    def employee_frame(self, changed_only=True):
+        """Added / Removed / Changed per employee (by default only employees with changes)."""
+        df = self._frame(self._counts(0, len(self.employees)), pd.Index(self.employees, name="Employee"))
+        return df[df["Changed"] > 0] if changed_only else df
+
+    def area_frame(self):
+        return self._frame(self._counts(3, len(self.areas)), pd.Index(self.areas, name="Area"))
+
+    def day_frame(self):
+        """One row per compared day (``Date`` index, ``Day`` name column)."""
+        calendar = self.calendar
+        df = self._frame(self._counts(1, calendar.num_days),
+                         pd.Index(pd.to_datetime(calendar.date_strs), name="Date"))
+        df.insert(0, "Day", calendar.day_names)
+        return df[self.days]
+
+    def changes_frame(self):
+        """One row per added or removed assignment, sorted by date, area, shift and employee."""
+        rows = np.concatenate([self.added, self.removed])
+        change = np.repeat(["Added", "Removed"], [len(self.added), len(self.removed)])
+        order = np.lexsort((rows[:, 0], rows[:, 2], rows[:, 3], rows[:, 1]))
+        rows, change = rows[order], change[order]
+        calendar = self.calendar
+        return pd.DataFrame({
+            "Change": change,
+            "Date": np.asarray(calendar.date_strs, dtype=object)[rows[:, 1]],
+            "Day": np.asarray(calendar.day_names, dtype=object)[rows[:, 1]],
+            "Area": pd.Categorical.from_codes(rows[:, 3], self.areas),
+            "Shift": pd.Categorical.from_codes(rows[:, 2], self.shifts),
+            "Employee": pd.Categorical.from_codes(rows[:, 0], self.employees),
+        })
+
+    def to_dict(self):
+        """JSON-ready totals, churn and the non-zero per employee / area / day counts."""
+        def changed(df):
+            df = df[df["Changed"] > 0]
+            return {str(k): {c: int(v) for c, v in row.items()}
+                    for k, row in df[["Added", "Removed"]].to_dict("index").items()}
+
+        days = self.day_frame()
+        days.index = days.index.strftime("%Y-%m-%d")
+        return {
+            "alignment": self.alignment,
+            "start": self.calendar.start_date.isoformat(),
+            "days_compared": int(self.days.sum()),
+            "before_assignments": self.before_count, "after_assignments": self.after_count,
+            "added": len(self.added), "removed": len(self.removed),
+            "unchanged": self.unchanged, "reassigned": self.reassigned,
+            "churn": round(self.churn, 4),
+            "per_employee": changed(self.employee_frame()),
+            "per_area": changed(self.area_frame()),
+            "per_day": changed(days),
+        }
+
+
+def _merged_ids(names, other):
+    """``names`` followed by the names of ``other`` not in it, and ``other``'s ids in that list."""
+    merged = list(names)
+    pos = {n: i for i, n in enumerate(merged)}
+    for n in other:
+        if n not in pos:
+            pos[n] = len(merged)
+            merged.append(n)
+    return merged, np.asarray([pos[n] for n in other], dtype=np.int64)
+
+
+def _overlaps(a, b):
+    return (a.start_date.toordinal() < b.start_date.toordinal() + b.num_days
+            and b.start_date.toordinal() < a.start_date.toordinal() + a.num_days)
+
+
+def compare_schedules(before, after, alignment=None):
+    """
+    :class:`ScheduleDiff` of two ScheduleResults.
+
+    With ``alignment="date"``, only the dates that both horizons cover are
+    compared. With ``"weekday"``, ``before`` is laid onto every week of
+    ``after`` by weekday, as for a warm start (``HorizonCalendar.aligned_days``).
+    That is the mode for comparing against the previous period. By default
+    it is ``"date"`` when the horizons overlap and ``"weekday"`` otherwise.
+    """
+    calendar = after.calendar
+    if alignment is None:
+        alignment = "date" if _overlaps(before.calendar, calendar) else "weekday"
+    if alignment not in ALIGNMENTS:
+        raise ValueError(f"Unknown alignment {alignment!r} (use {' or '.join(ALIGNMENTS)})")
+    employees, emp_of = _merged_ids(after.employees, before.employees)
+    shifts, shift_of = _merged_ids(after.shifts, before.shifts)
+    areas, area_of = _merged_ids(after.areas, before.areas)
+    D, S, A = calendar.num_days, len(shifts), len(areas)
+
+    b_emp, b_shift, b_area = emp_of[before.emp_id], shift_of[before.shift_id], area_of[before.area_id]
+    b_day = before.day_index.astype(np.int64)
+    a_day = after.day_index.astype(np.int64)
+    if alignment == "date":
+        lag = before.calendar.start_date.toordinal() - calendar.start_date.toordinal()
+        days = np.zeros(D, dtype=bool)
+        days[max(lag, 0):max(min(D, lag + before.calendar.num_days), 0)] = True
+        b_day = b_day + lag
+        keep = (b_day >= 0) & (b_day < D)
+        b_emp, b_day, b_shift, b_area = (c[keep] for c in (b_emp, b_day, b_shift, b_area))
+    else:
+        # every after day d takes the before assignments of day aligned[d]
+        aligned = calendar.aligned_days(before.calendar)
+        order = np.argsort(b_day, kind="stable")
+        per_day = np.bincount(b_day, minlength=before.calendar.num_days)
+        first = np.cumsum(per_day) - per_day
+        lengths = per_day[aligned]
+        runs = np.cumsum(lengths) - lengths
+        pick = order[np.repeat(first[aligned] - runs, lengths) + np.arange(lengths.sum())]
+        b_emp, b_shift, b_area = b_emp[pick], b_shift[pick], b_area[pick]
+        b_day = np.repeat(np.arange(D), lengths)
+        days = np.ones(D, dtype=bool)
+
+    def keys(emp, day, shift_id, area_id):
+        return np.unique(((emp * D + day) * S + shift_id) * A + area_id)
+
+    before_keys = keys(b_emp, b_day, b_shift, b_area)
+    on = days[a_day]
+    after_keys = keys(after.emp_id[on].astype(np.int64), a_day[on],
+                      after.shift_id[on].astype(np.int64), after.area_id[on].astype(np.int64))
+
+    def decoded(k):
+        rest, area_id = np.divmod(k, A)
+        rest, shift_id = np.divmod(rest, S)
+        emp, day = np.divmod(rest, D)
+        return np.column_stack([emp, day, shift_id, area_id]).astype(np.int64)
+
+    return ScheduleDiff(
+        employees=employees, shifts=shifts, areas=areas, calendar=calendar, alignment=alignment,
+        days=days, before_count=len(before_keys), after_count=len(after_keys),
+        added=decoded(np.setdiff1d(after_keys, before_keys, assume_unique=True)),
+        removed=decoded(np.setdiff1d(before_keys, after_keys, assume_unique=True)),
+    )
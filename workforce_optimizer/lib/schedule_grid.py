@@ -0,0 +1,303 @@
+# schedule_grid.py
+import bisect
+import tkinter as tk
+from tkinter import ttk
+import tkinter.font as tkfont
+
+ALL_AREAS = "All areas"
+ALL_WEEKS = "All weeks"
+
+
+class ScheduleGrid(tk.Frame):
+    """
+    One canvas showing every area × week schedule table of a
+    :class:`~lib.schedule_result.ScheduleResult`.
+
+    The grid is virtualised: the layout is a flat list of rows (a title and a
+    heading row per table, then one row per shift) with their y offsets, and
+    only the rows inside the visible part of the canvas are drawn, so the
+    widget count stays constant however many areas and weeks are scheduled.
+    Area / week comboboxes filter which tables are laid out.
+
+    Double-clicking a day cell calls
+    ``on_edit(grid, area, day_index, shift, names, x_root, y_root)``; the
+    callback changes the schedule through :meth:`set_cell`. With ``area`` the
+    grid shows only that area and has no area filter.
+    """
+
+    TITLE_HEIGHT = 34
+    ROW_HEIGHT = 24
+    FIRST_COL_WIDTH = 110
+    DAY_COL_WIDTH = 150
+    HEADER_BG = "#e9ecef"
+    GRID_LINE = "#c8c8c8"
+    SELECTED_BG = "#fff3cd"
+
+    def __init__(self, parent, result, on_edit=None, height=600, area=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.result = result
+        self.fixed_area = area
+        self.on_edit = on_edit
+        self._font = tkfont.nametofont("TkDefaultFont")
+        self._bold = tkfont.Font(font=self._font, weight="bold")
+        self._title_font = tkfont.Font(family="Arial", size=11, weight="bold")
+        self._char_width = max(1, self._font.measure("0"))
+        self._rows = []       # ("title", area, week) | ("header", area, week) | ("shift", area, week, s)
+        self._row_y = []      # top y of each row
+        self._total_height = 0
+        self._tables = {}     # (area, week) -> week_table rows, dropped on edit
+        self._selected = None  # (area, day_index, shift)
+        self._redraw_pending = False
+
+        # Filters
+        bar = tk.Frame(self)
+        bar.pack(fill="x", pady=(0, 5))
+        self.area_var = tk.StringVar(value=ALL_AREAS if area is None else area)
+        self.area_combo = ttk.Combobox(bar, textvariable=self.area_var, state="readonly", width=20)
+        if area is None:
+            tk.Label(bar, text="Area:").pack(side="left")
+            self.area_combo.pack(side="left", padx=(2, 15))
+        tk.Label(bar, text="Week:").pack(side="left")
+        self.week_var = tk.StringVar(value=ALL_WEEKS)
+        self.week_combo = ttk.Combobox(bar, textvariable=self.week_var, state="readonly", width=36)
+        self.week_combo.pack(side="left", padx=2)
+        self.area_combo.bind("<<ComboboxSelected>>", lambda e: self.relayout())
+        self.week_combo.bind("<<ComboboxSelected>>", lambda e: self.relayout())
+
+        # Canvas + scrollbars
+        body = tk.Frame(self)
+        body.pack(fill="both", expand=True)
+        self.canvas = tk.Canvas(body, height=height, background="white", highlightthickness=0,
+                                yscrollincrement=self.ROW_HEIGHT)
+        vsb = ttk.Scrollbar(body, orient="vertical", command=self._yview)
+        hsb = ttk.Scrollbar(body, orient="horizontal", command=self.canvas.xview)
+        self.canvas.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        hsb.grid(row=1, column=0, sticky="ew")
+        body.rowconfigure(0, weight=1)
+        body.columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Configure>", lambda e: self.redraw())
+        self.canvas.bind("<Double-1>", self._on_double_click)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda e: self._scroll_units(-3))
+        self.canvas.bind("<Button-5>", lambda e: self._scroll_units(3))
+
+        self.set_result(result)
+
+    # ------------------------------------------------------------------
+    # Data
+    # ------------------------------------------------------------------
+    def set_result(self, result):
+        """Show another :class:`ScheduleResult`, keeping the filters where possible."""
+        self.result = result
+        self._tables.clear()
+        self._selected = None
+        areas = [ALL_AREAS] + list(result.areas) if self.fixed_area is None else [self.fixed_area]
+        cal = result.calendar
+        weeks = [ALL_WEEKS] + [f"Week {w + 1} ({cal.week_range_label(w)})" for w in range(cal.num_weeks)]
+        self.area_combo["values"] = areas
+        self.week_combo["values"] = weeks
+        if self.area_var.get() not in areas:
+            self.area_var.set(areas[0])
+        if self.week_var.get() not in weeks:
+            self.week_var.set(ALL_WEEKS)
+        self.relayout()
+
+    def set_filters(self, area=None, week=None):
+        """Show only ``area`` and/or 0-based ``week`` (``None`` for all)."""
+        if self.fixed_area is None:
+            self.area_var.set(ALL_AREAS if area is None else area)
+        self.week_var.set(ALL_WEEKS if week is None else self.week_combo["values"][week + 1])
+        self.relayout()
+
+    def table(self, area, week):
+        """Cached ``ScheduleResult.week_table`` for one area and 0-based week."""
+        key = (area, week)
+        rows = self._tables.get(key)
+        if rows is None:
+            rows = self._tables[key] = self.result.week_table(area, week)
+        return rows
+
+    def set_cell(self, area, day_index, shift, names):
+        """Change one cell in the result, redraw and fire ``<<ScheduleEdited>>``."""
+        self.result.set_cell(area, day_index, shift, names)
+        self._tables.pop((area, day_index // 7), None)
+        self.redraw()
+        self.event_generate("<<ScheduleEdited>>")
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+    def _visible_tables(self):
+        area = self.area_var.get()
+        areas = self.result.areas if area == ALL_AREAS else [area]
+        week = self.week_var.get()
+        weeks = range(self.result.num_weeks)
+        if week != ALL_WEEKS:
+            weeks = [list(self.week_combo["values"]).index(week) - 1]
+        return [(a, w) for a in areas for w in weeks]
+
+    def relayout(self):
+        rows, row_y, y = [], [], 0
+        for area, week in self._visible_tables():
+            rows.append(("title", area, week))
+            row_y.append(y)
+            y += self.TITLE_HEIGHT
+            rows.append(("header", area, week))
+            row_y.append(y)
+            y += self.ROW_HEIGHT
+            for s in range(len(self.result.shifts)):
+                rows.append(("shift", area, week, s))
+                row_y.append(y)
+                y += self.ROW_HEIGHT
+        self._rows, self._row_y, self._total_height = rows, row_y, y
+        width = self.FIRST_COL_WIDTH + 7 * self.DAY_COL_WIDTH
+        self.canvas.configure(scrollregion=(0, 0, width, max(y, 1)))
+        self.canvas.yview_moveto(0)
+        self.redraw()
+
+    # ------------------------------------------------------------------
+    # Drawing
+    # ------------------------------------------------------------------
+    def redraw(self):
+        """Schedule a repaint of the visible rows (coalesced to one per idle)."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._draw_visible)
+
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self.redraw()
+
+    def _scroll_units(self, units):
+        self.canvas.yview_scroll(units, "units")
+        self.redraw()
+        return "break"
+
+    def _on_mousewheel(self, event):
+        return self._scroll_units(-1 * (event.delta // 120))
+
+    def _clip(self, text, width):
+        max_chars = max(1, (width - 8) // self._char_width)
+        return text if len(text) <= max_chars else text[:max_chars - 1] + "…"
+
+    def _draw_visible(self):
+        self._redraw_pending = False
+        c = self.canvas
+        c.delete("all")
+        if not self._rows:
+            return
+        top = c.canvasy(0)
+        bottom = top + c.winfo_height()
+        first = max(0, bisect.bisect_right(self._row_y, top) - 1)
+        last = bisect.bisect_right(self._row_y, bottom)
+        cal = self.result.calendar
+        fw, dw, rh = self.FIRST_COL_WIDTH, self.DAY_COL_WIDTH, self.ROW_HEIGHT
+        for i in range(first, min(last, len(self._rows))):
+            row, y = self._rows[i], self._row_y[i]
+            kind, area, week = row[:3]
+            if kind == "title":
+                c.create_text(4, y + self.TITLE_HEIGHT - 6, anchor="sw", font=self._title_font,
+                              text=f"{area} Schedule – Week {week + 1} ({cal.week_range_label(week)})")
+                continue
+            if kind == "header":
+                cells = ["Day/Shift"] + cal.day_headings(week)
+                font, fill = self._bold, self.HEADER_BG
+            else:
+                cells = self.table(area, week)[row[3]]
+                font, fill = self._font, "white"
+            x = 0
+            for j, text in enumerate(cells):
+                w = fw if j == 0 else dw
+                bg = fill
+                if kind == "shift" and j > 0 and self._selected == (area, week * 7 + j - 1, cells[0]):
+                    bg = self.SELECTED_BG
+                c.create_rectangle(x, y, x + w, y + rh, fill=bg, outline=self.GRID_LINE)
+                c.create_text(x + 4 if j == 0 else x + w // 2, y + rh // 2,
+                              anchor="w" if j == 0 else "center", font=font, text=self._clip(text, w))
+                x += w
+
+    # ------------------------------------------------------------------
+    # Editing
+    # ------------------------------------------------------------------
+    def cell_at(self, x, y):
+        """``(area, day_index, shift)`` of the day cell at widget coordinates, or ``None``."""
+        cx, cy = self.canvas.canvasx(x), self.canvas.canvasy(y)
+        i = bisect.bisect_right(self._row_y, cy) - 1
+        if i < 0 or i >= len(self._rows) or self._rows[i][0] != "shift":
+            return None
+        if cy >= self._row_y[i] + self.ROW_HEIGHT:
+            return None
+        col = int((cx - self.FIRST_COL_WIDTH) // self.DAY_COL_WIDTH)
+        if cx < self.FIRST_COL_WIDTH or not 0 <= col < 7:
+            return None
+        _, area, week, s = self._rows[i]
+        return area, week * 7 + col, self.result.shifts[s]
+
+    def _on_double_click(self, event):
+        cell = self.cell_at(event.x, event.y)
+        if cell is None or self.on_edit is None:
+            return
+        self._selected = cell
+        self.redraw()
+        area, day_index, shift = cell
+        names = self.result.cell_names(area, day_index, shift)
+        self.on_edit(self, area, day_index, shift, names, event.x_root, event.y_root)
+
+    def clear_selection(self):
+        self._selected = None
+        self.redraw()
+
+
+class ScheduleTabs(ttk.Notebook):
+    """
+    One notebook tab per area of a :class:`~lib.schedule_result.ScheduleResult`.
+    A tab's :class:`ScheduleGrid` is only built the first time the tab is
+    opened, so showing a result costs one grid however many areas it has.
+    ``on_edit`` and ``height`` are passed on to each grid. Areas with unsaved
+    edits (``result.edits``) get a ``*`` on their tab.
+    """
+
+    def __init__(self, parent, result, on_edit=None, height=600, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.result = result
+        self.on_edit = on_edit
+        self.grid_height = height
+        self.grids = {}   # area -> ScheduleGrid, for the tabs opened so far
+        self._tabs = []
+        for area in result.areas:
+            frame = tk.Frame(self)
+            self.add(frame, text=area)
+            self._tabs.append((area, frame))
+        self.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
+
+    def _on_tab_changed(self, event=None):
+        if self._tabs:
+            self.grid_for(self._tabs[self.index(self.select())][0])
+
+    def grid_for(self, area):
+        """The grid of ``area``'s tab, built on first use."""
+        grid = self.grids.get(area)
+        if grid is None:
+            frame = dict(self._tabs)[area]
+            grid = self.grids[area] = ScheduleGrid(frame, self.result, on_edit=self.on_edit,
+                                                   height=self.grid_height, area=area)
+            grid.pack(fill="both", expand=True)
+            grid.bind("<<ScheduleEdited>>", lambda e: self.refresh_labels())
+        return grid
+
+    def refresh_labels(self):
+        """Mark the tabs of areas with unsaved edits."""
+        unsaved = set(self.result.unsaved_areas())
+        for i, (area, _) in enumerate(self._tabs):
+            self.tab(i, text=f"{area} *" if area in unsaved else area)
+
+    def show_area(self, area):
+        """Switch to ``area``'s tab (building its grid)."""
+        for i, (a, _) in enumerate(self._tabs):
+            if a == area:
+                self.select(i)
+        return self.grid_for(area)
@@ -0,0 +1,211 @@
+# schedule_import.py
+"""
+Read saved schedules back into a :class:`~lib.schedule_result.ScheduleResult`
+so they can be shown, summarised or used as a MIP start without solving.
+
+Two layouts are understood:
+
+* the per-area CSVs written by ``lib.exporter`` (``area_schedule_csv``: blocks of
+  ``"<area> Schedule (Nov 09, 2025 - Nov 15, 2025)"``, a ``Day/Shift`` heading
+  row and one row per shift with ``", "``-joined names);
+* the long format written by lib/exporter.py (``Date``, ``Week``, ``Day``,
+  ``Area``, ``Shift``, ``Employee`` columns) as CSV, Parquet or the
+  ``Assignments`` sheet of the workbook.
+
+CSVs are read as UTF-8; files that are not valid UTF-8 (saved in the
+platform's encoding by older versions) are read in that encoding.
+"""
+import csv
+import datetime as dt
+import io
+import locale
+import os
+import re
+
+import numpy as np
+
+from .horizon import HorizonCalendar, DAY_NAMES
+from .schedule_result import ScheduleResult
+
+_TITLE = re.compile(r"^(?P<area>.+) Schedule \((?P<start>[A-Z][a-z]{2} \d{2}, \d{4}) - "
+                    r"(?P<end>[A-Z][a-z]{2} \d{2}, \d{4})\)$")
+LONG_COLUMNS = ["Date", "Week", "Day", "Area", "Shift", "Employee"]
+_EPOCH_ORDINAL = dt.date(1970, 1, 1).toordinal()
+
+
+class ScheduleFormatError(ValueError):
+    """A file is not a saved schedule in one of the layouts above."""
+
+
+class _Ids:
+    """Name -> id lookup that appends unseen names, keeping first-seen order."""
+
+    def __init__(self, names=()):
+        self.names = list(names)
+        self.pos = {n: i for i, n in enumerate(self.names)}
+
+    def __call__(self, name):
+        i = self.pos.get(name)
+        if i is None:
+            i = self.pos[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+
+def _read_text(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return data.decode(locale.getpreferredencoding(False), errors="replace")
+
+
+def _split_names(cell, joined):
+    """
+    The names of a ``", "``-joined cell. Known names that contain ``", "``
+    themselves (``joined``) are kept whole, longest match first.
+    """
+    parts = cell.split(", ")
+    if not joined or len(parts) == 1:
+        return parts
+    names, i = [], 0
+    while i < len(parts):
+        j = next((j for j in range(len(parts), i + 1, -1) if ", ".join(parts[i:j]) in joined), i + 1)
+        names.append(", ".join(parts[i:j]))
+        i = j
+    return names
+
+
+def _read_area_csv(path, ids, dates, week_starts):
+    """(employee, date ordinal, shift, area) id columns of one per-area CSV; dates seen go to the two sets."""
+    emp_ids, shift_ids, area_ids = ids
+    joined = {n for n in emp_ids.names if ", " in str(n)}
+    cols = ([], [], [], [])
+    week_start = area = None
+    with io.StringIO(_read_text(path), newline="") as f:
+        for lineno, row in enumerate(csv.reader(f), 1):
+            if not row or not any(row):
+                continue
+            if len(row) == 1:
+                m = _TITLE.match(row[0])
+                if m is None:
+                    raise ScheduleFormatError(f"{os.path.basename(path)}, line {lineno}: "
+                                              f"expected an area schedule title, got {row[0]!r}")
+                area = area_ids(m["area"])
+                week_start = dt.datetime.strptime(m["start"], "%b %d, %Y").date().toordinal()
+                week_starts.add(week_start)
+                dates.add(dt.datetime.strptime(m["end"], "%b %d, %Y").date().toordinal())
+            elif row[0] == "Day/Shift":
+                if week_start is None:
+                    raise ScheduleFormatError(f"{os.path.basename(path)}, line {lineno}: heading before title")
+            else:
+                if week_start is None:
+                    raise ScheduleFormatError(f"{os.path.basename(path)}, line {lineno}: shift row before title")
+                s = shift_ids(row[0])
+                for k, cell in enumerate(row[1:8]):
+                    if not cell:
+                        continue
+                    for name in _split_names(cell, joined):
+                        cols[0].append(emp_ids(name))
+                        cols[1].append(week_start + k)
+                        cols[2].append(s)
+                        cols[3].append(area)
+    if area is None:
+        raise ScheduleFormatError(f"{os.path.basename(path)}: no schedule blocks found")
+    return cols
+
+
+def _read_long(path):
+    """
+    The long-format frame of ``path`` and the first day of its horizon when
+    the file records it (``None`` otherwise): the workbook's first sheet is
+    an area sheet with a row per day, and Parquet keeps the ``Day``
+    categories in calendar order.
+    """
+    import pandas as pd
+    ext = os.path.splitext(path)[1].lower()
+    first_day = None
+    if ext == ".parquet":
+        df = pd.read_parquet(path)
+        if isinstance(df["Day"].dtype, pd.CategoricalDtype) and len(df["Day"].cat.categories) == 7:
+            first_day = df["Day"].cat.categories[0]
+    elif ext in (".xlsx", ".xlsm"):
+        sheets = pd.read_excel(path, sheet_name=[0, "Assignments"])
+        df, first = sheets["Assignments"], sheets[0]
+        if "Date" in first.columns and len(first):
+            first_day = pd.Timestamp(first["Date"].iloc[0]).date()
+    else:
+        df = pd.read_csv(path)
+    missing = set(LONG_COLUMNS) - set(df.columns)
+    if missing:
+        raise ScheduleFormatError(f"{os.path.basename(path)}: missing column(s) {', '.join(sorted(missing))}")
+    return df, first_day
+
+
+def _long_columns(df, first_day, ids, dates, week_starts):
+    """Id columns of a long-format frame; each distinct name is looked up once."""
+    import pandas as pd
+    ordinals = (pd.to_datetime(df["Date"]).to_numpy("datetime64[D]").astype(np.int64)
+                + _EPOCH_ORDINAL)
+    if isinstance(first_day, dt.date):
+        week_starts.add(first_day.toordinal())
+    elif len(ordinals):
+        # earliest date moved back to week 1, then back to the first day's weekday if known
+        start = int((ordinals - 7 * (df["Week"].to_numpy(dtype=np.int64) - 1)).min())
+        if first_day in DAY_NAMES:
+            start -= (dt.date.fromordinal(start).weekday() - DAY_NAMES.index(first_day)) % 7
+        week_starts.add(start)
+    if len(ordinals):
+        dates.add(int(ordinals.max()))
+
+    def coded(column, lookup):
+        codes, uniques = pd.factorize(df[column].astype(str))
+        return np.asarray([lookup(u) for u in uniques], dtype=np.int32)[codes]
+
+    emp_ids, shift_ids, area_ids = ids
+    return coded("Employee", emp_ids), ordinals, coded("Shift", shift_ids), coded("Area", area_ids)
+
+
+def _is_long_csv(path):
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+        header = next(csv.reader(f), [])
+    return set(LONG_COLUMNS) <= set(header)
+
+
+def load_schedule(paths, employees=(), shifts=(), areas=(), start_date=None):
+    """
+    Build one ScheduleResult from saved schedule files (any mix of the
+    layouts above, e.g. every area CSV of one run).
+
+    ``employees`` / ``shifts`` / ``areas`` fix the id order (pass the input
+    file's lists so the result lines up with them); names only found in the
+    files are appended in the order they are met. In the area CSVs, only
+    names in ``employees`` can contain ``", "``. The calendar starts at
+    ``start_date`` or, by default, the first week in the files.
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    ids = (_Ids(employees), _Ids(shifts), _Ids(areas))
+    parts = []
+    dates, week_starts = set(), set()
+    for path in paths:
+        path = os.fspath(path)
+        if path.lower().endswith(".csv") and not _is_long_csv(path):
+            parts.append(_read_area_csv(path, ids, dates, week_starts))
+        else:
+            parts.append(_long_columns(*_read_long(path), ids, dates, week_starts))
+    if not week_starts:
+        raise ScheduleFormatError("no assignments found")
+    # block titles give each week's first day; a long-format CSV only gives
+    # its earliest date moved back to week 1 (exact unless day 1 had no shifts)
+    start = start_date.toordinal() if start_date is not None else min(week_starts)
+    calendar = HorizonCalendar(dt.date.fromordinal(start), max(1, -(-(max(dates) - start + 1) // 7)))
+    emp_id, ordinal, shift_id, area_id = (np.concatenate([np.asarray(p[i], dtype=np.int64) for p in parts])
+                                          for i in range(4))
+    day_index = ordinal - start
+    keep = (day_index >= 0) & (day_index < calendar.num_days)
+    emp_id, day_index, shift_id, area_id = (c[keep] for c in (emp_id, day_index, shift_id, area_id))
+    order = np.lexsort((area_id, shift_id, emp_id, day_index))
+    return ScheduleResult(ids[0].names, ids[1].names, ids[2].names, calendar,
+                          emp_id[order], day_index[order], shift_id[order], area_id[order])
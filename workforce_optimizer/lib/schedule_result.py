@@ -0,0 +1,269 @@
+# schedule_result.py
+from collections.abc import Sequence
+
+import numpy as np
+
+from .horizon import HorizonCalendar
+
+
+class ScheduleResult:
+    """
+    Compact solved schedule: one entry per assignment, stored as parallel int32
+    arrays indexing into ``employees``, the calendar's day index, ``shifts`` and
+    ``areas``.
+
+    The legacy ``[name, "YYYY-MM-DD", day, shift, area]`` rows are produced lazily
+    by :meth:`rows` / :meth:`legacy_rows`; aggregates use ``np.bincount``.
+    """
+
+    def __init__(self, employees, shifts, areas, calendar,
+                 emp_id=(), day_index=(), shift_id=(), area_id=()):
+        self.employees = list(employees)
+        self.shifts = list(shifts)
+        self.areas = list(areas)
+        self.calendar = calendar
+        self.emp_id = np.asarray(emp_id, dtype=np.int32)
+        self.day_index = np.asarray(day_index, dtype=np.int32)
+        self.shift_id = np.asarray(shift_id, dtype=np.int32)
+        self.area_id = np.asarray(area_id, dtype=np.int32)
+        self._emp_pos = {e: i for i, e in enumerate(self.employees)}
+        self._shift_pos = {s: i for i, s in enumerate(self.shifts)}
+        self._area_pos = {a: i for i, a in enumerate(self.areas)}
+        self.version = 0  # bumped on every edit; views use it to drop cached rows
+        self.edits = {}   # area -> {week: version of its last edit}, until saved
+        self._cells = None
+        self._cells_version = None
+
+    @classmethod
+    def from_rows(cls, rows, employees, shifts, areas, calendar):
+        """
+        Build from legacy rows. Rows naming an unknown employee / shift / area or a
+        date outside the calendar are dropped.
+        """
+        emp_pos = {e: i for i, e in enumerate(employees)}
+        shift_pos = {s: i for i, s in enumerate(shifts)}
+        area_pos = {a: i for i, a in enumerate(areas)}
+        cols = ([], [], [], [])
+        for e, date_str, _, s, a in rows:
+            d = calendar.index(date_str)
+            if d is None or e not in emp_pos or s not in shift_pos or a not in area_pos:
+                continue
+            cols[0].append(emp_pos[e])
+            cols[1].append(d)
+            cols[2].append(shift_pos[s])
+            cols[3].append(area_pos[a])
+        return cls(employees, shifts, areas, calendar, *cols)
+
+    def __len__(self):
+        return len(self.emp_id)
+
+    def copy(self):
+        """
+        Snapshot for another thread. Edits replace the id arrays rather than
+        writing into them, so the copy can share them.
+        """
+        return ScheduleResult(self.employees, self.shifts, self.areas, self.calendar,
+                              self.emp_id, self.day_index, self.shift_id, self.area_id)
+
+    @property
+    def num_weeks(self):
+        return self.calendar.num_weeks
+
+    @property
+    def week(self):
+        return self.day_index // 7
+
+    @property
+    def offset(self):
+        return self.day_index % 7
+
+    def employee_index(self, name):
+        return self._emp_pos.get(name)
+
+    def shift_index(self, name):
+        return self._shift_pos.get(name)
+
+    def area_index(self, name):
+        return self._area_pos.get(name)
+
+    # ------------------------------------------------------------------
+    # Legacy row format
+    # ------------------------------------------------------------------
+    def rows(self, area=None, idx=None):
+        """``[name, "YYYY-MM-DD", day, shift, area]`` rows, optionally for one area."""
+        if idx is None:
+            idx = self.indices(area)
+        cal = self.calendar
+        emps, shifts, areas = self.employees, self.shifts, self.areas
+        return [
+            [emps[e], cal.date_strs[d], cal.day_names[d], shifts[s], areas[a]]
+            for e, d, s, a in zip(self.emp_id[idx].tolist(), self.day_index[idx].tolist(),
+                                  self.shift_id[idx].tolist(), self.area_id[idx].tolist())
+        ]
+
+    def legacy_rows(self, area):
+        """Lazy sequence of one area's rows, materialised on first access."""
+        return LegacyRows(self, area)
+
+    def indices(self, area=None):
+        """Positions of the assignments of ``area`` (all when ``None``), in stored order."""
+        if area is None:
+            return np.arange(len(self))
+        a = self._area_pos.get(area)
+        if a is None:
+            return np.arange(0)
+        return np.flatnonzero(self.area_id == a)
+
+    # ------------------------------------------------------------------
+    # Cells (area, day, shift) as shown in the schedule grid
+    # ------------------------------------------------------------------
+    def _cell_mask(self, area, day_index, shift):
+        return ((self.area_id == self._area_pos.get(area, -1))
+                & (self.day_index == day_index)
+                & (self.shift_id == self._shift_pos.get(shift, -1)))
+
+    def cell_names(self, area, day_index, shift):
+        """Employees assigned to one area / day / shift, in stored order."""
+        emps = self.employees
+        return [emps[e] for e in self.emp_id[self._cell_mask(area, day_index, shift)].tolist()]
+
+    def cell_table(self):
+        """
+        Names joined with ``", "`` per (area, day index, shift): an object array
+        of shape ``(len(areas), num_days, len(shifts))``. Built in one grouped
+        pass over the assignments (sorted by cell key, names in stored order
+        within a cell) and cached until the next edit.
+        """
+        if self._cells is not None and self._cells_version == self.version:
+            return self._cells
+        A, D, S = len(self.areas), self.calendar.num_days, len(self.shifts)
+        key = (self.area_id.astype(np.int64) * D + self.day_index) * S + self.shift_id
+        order = np.argsort(key, kind="stable")
+        sorted_keys = key[order]
+        cells = np.full(A * D * S, "", dtype=object)
+        if len(order):
+            starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+            ends = np.r_[starts[1:], len(order)]
+            names = np.asarray(self.employees, dtype=object)[self.emp_id[order]].tolist()
+            for k, a, b in zip(sorted_keys[starts].tolist(), starts.tolist(), ends.tolist()):
+                cells[k] = ", ".join(names[a:b])
+        self._cells = cells.reshape(A, D, S)
+        self._cells_version = self.version
+        return self._cells
+
+    def week_table(self, area, week):
+        """
+        ``[shift, names_day0, ..., names_day6]`` rows for one area and 0-based
+        week (the layout of the schedule CSVs), sliced from :meth:`cell_table`.
+        """
+        a = self._area_pos.get(area)
+        if a is None:
+            return [[s] + [""] * 7 for s in self.shifts]
+        block = self.cell_table()[a, week * 7:(week + 1) * 7, :].T.tolist()
+        return [[s] + row for s, row in zip(self.shifts, block)]
+
+    def set_cell(self, area, day_index, shift, names):
+        """
+        Replace the employees on one area / day / shift. Names not in
+        ``employees`` (e.g. added to the employee file after solving) are appended.
+        """
+        a, s = self._area_pos[area], self._shift_pos[shift]
+        keep = ~self._cell_mask(area, day_index, shift)
+        new_emps = []
+        for name in names:
+            if name not in self._emp_pos:
+                self._emp_pos[name] = len(self.employees)
+                self.employees.append(name)
+            new_emps.append(self._emp_pos[name])
+        n = len(new_emps)
+        self.emp_id = np.concatenate([self.emp_id[keep], np.asarray(new_emps, dtype=np.int32)])
+        self.day_index = np.concatenate([self.day_index[keep], np.full(n, day_index, dtype=np.int32)])
+        self.shift_id = np.concatenate([self.shift_id[keep], np.full(n, s, dtype=np.int32)])
+        self.area_id = np.concatenate([self.area_id[keep], np.full(n, a, dtype=np.int32)])
+        self.version += 1
+        self.edits.setdefault(area, {})[day_index // 7] = self.version
+
+    def unsaved_areas(self):
+        """Areas with edits not yet saved, in area order."""
+        return [a for a in self.areas if self.edits.get(a)]
+
+    def mark_saved(self, area, version):
+        """Forget ``area``'s edits up to ``version`` (the version that was written)."""
+        weeks = self.edits.get(area, {})
+        for week in [w for w, v in weeks.items() if v <= version]:
+            del weeks[week]
+
+    # ------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------
+    def counts_by_employee_week(self):
+        """``(len(employees), num_weeks)`` shift counts."""
+        E, W = len(self.employees), self.num_weeks
+        flat = np.bincount(self.emp_id * W + self.week, minlength=E * W)
+        return flat.reshape(E, W)
+
+    def counts_by_employee_area(self):
+        """``(len(employees), len(areas))`` shift counts."""
+        E, A = len(self.employees), len(self.areas)
+        flat = np.bincount(self.emp_id * A + self.area_id, minlength=E * A)
+        return flat.reshape(E, A)
+
+    def counts_by_area(self):
+        return np.bincount(self.area_id, minlength=len(self.areas))
+
+    def worked_days(self):
+        """Boolean ``(len(employees), num_days)``: employee has any shift that day."""
+        worked = np.zeros((len(self.employees), self.calendar.num_days), dtype=bool)
+        worked[self.emp_id, self.day_index] = True
+        return worked
+
+
+class LegacyRows(Sequence):
+    """
+    Read-only list-like view of one area's legacy rows, so existing
+    ``result_dict["<area>_schedule"]`` consumers keep working.
+    """
+
+    def __init__(self, result, area):
+        self._result = result
+        self._area = area
+        self._rows = None
+        self._version = None
+
+    def _materialise(self):
+        if self._rows is None or self._version != self._result.version:
+            self._rows = self._result.rows(self._area)
+            self._version = self._result.version
+        return self._rows
+
+    def __getitem__(self, i):
+        return self._materialise()[i]
+
+    def __len__(self):
+        if self._rows is None or self._version != self._result.version:
+            return len(self._result.indices(self._area))
+        return len(self._rows)
+
+    def __iter__(self):
+        return iter(self._materialise())
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f"LegacyRows({self._area!r}, {len(self)} rows)"
+
+
+def to_schedule_result(result_dict, employees, shifts, areas, calendar=None,
+                       start_date=None, num_weeks=None):
+    """
+    Return ``result_dict["assignments"]`` or, for a dict that only has the legacy
+    ``<area>_schedule`` rows, build an equivalent :class:`ScheduleResult`.
+    """
+    result = result_dict.get("assignments")
+    if result is not None:
+        return result
+    if calendar is None:
+        calendar = result_dict.get("calendar") or HorizonCalendar(start_date, num_weeks)
+    rows = [row for a in areas for row in result_dict.get(f"{a.lower()}_schedule", [])]
+    return ScheduleResult.from_rows(rows, employees, shifts, areas, calendar)
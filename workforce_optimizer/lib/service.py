@@ -0,0 +1,453 @@
+# service.py
+"""
+Local HTTP/JSON scheduling service (``python -m workforce_optimizer serve``).
+
+    POST   /jobs                    submit {"emp", "req", "limits": CSV text,
+                                    "start": "YYYY-MM-DD", "weeks": n,
+                                    optional "formats": ["csv", "xlsx", "parquet", "rosters"]}
+    GET    /jobs                    all jobs, newest first
+    GET    /jobs/<id>               state and, once finished, the solve report
+    GET    /jobs/<id>/events        progress events; ``?since=n`` skips the first
+                                    n, ``?follow=1`` streams JSON lines until the
+                                    job finishes
+    GET    /jobs/<id>/files/<name>  one of the output files (see "downloads")
+    DELETE /jobs/<id>               cancel a queued or running job
+    GET    /health
+
+Each job is a folder in the store (inputs, ``job.json``, ``events.jsonl``,
+``output/``), so jobs and results survive a restart; unfinished ones are run
+again. Submitting the same three files with the same start, weeks and formats as a
+finished job reuses its result instead of solving again.
+"""
+import datetime
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, quote, unquote
+
+from .exporter import FORMATS
+from .pipeline import solve_files, SUCCESS_STATUSES
+from .utils import user_output_dir
+
+INPUT_FILES = {"emp": "Employee_Data.csv", "req": "Personnel_Required.csv", "limits": "Hard_Limits.csv"}
+CONTENT_TYPES = {
+    ".csv": "text/csv; charset=utf-8",
+    ".txt": "text/plain; charset=utf-8",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".parquet": "application/vnd.apache.parquet",
+    ".zip": "application/zip",
+}
+MAX_BODY_BYTES = 20 * 1024 * 1024
+FOLLOW_TIMEOUT = 15  # seconds between keep-alive checks while streaming events
+
+QUEUED = "queued"
+RUNNING = "running"
+FINISHED = "finished"
+
+
+class QueueFull(Exception):
+    """Raised by :meth:`JobService.submit` when ``max_queue`` jobs are already waiting."""
+
+
+def _count(text, name):
+    """A query or header value that must be a whole number >= 0; raises ValueError otherwise."""
+    try:
+        value = int(text)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{name}' must be a whole number, got {text!r}") from None
+    if value < 0:
+        raise ValueError(f"'{name}' must not be negative, got {value}")
+    return value
+
+
+class Job:
+    """One submitted solve: its folder, ``meta`` (saved as job.json) and progress events."""
+
+    def __init__(self, directory, meta):
+        self.dir = directory
+        self.meta = meta
+        self.events = []
+        self.cancel_event = threading.Event()
+        self.changed = threading.Condition()
+
+    @property
+    def id(self):
+        return self.meta["id"]
+
+    @property
+    def state(self):
+        return self.meta["state"]
+
+    def path(self, *parts):
+        return os.path.join(self.dir, *parts)
+
+    def save(self):
+        tmp = self.path("job.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, indent=2, default=str)
+        os.replace(tmp, self.path("job.json"))
+
+    def add_event(self, event):
+        """Progress callback for the solver: keep, persist and wake streaming readers."""
+        data = event.to_dict()
+        with self.changed:
+            self.events.append(data)
+            with open(self.path("events.jsonl"), "a", encoding="utf-8") as f:
+                f.write(json.dumps(data, default=str) + "\n")
+            self.changed.notify_all()
+
+    def update(self, **fields):
+        with self.changed:
+            self.meta.update(fields)
+            self.save()
+            self.changed.notify_all()
+
+    def wait_events(self, since, timeout):
+        """Events after the first ``since`` (waiting up to ``timeout``) and whether the job is finished."""
+        with self.changed:
+            if len(self.events) <= since and self.state != FINISHED:
+                self.changed.wait(timeout)
+            return self.events[since:], self.state == FINISHED
+
+    def view(self):
+        """The job as returned by the API."""
+        view = dict(self.meta)
+        output = self.path("output")
+        if os.path.isdir(output):
+            view["downloads"] = [f"/jobs/{self.id}/files/{quote(name)}" for name in sorted(os.listdir(output))]
+        return view
+
+
+class JobService:
+    """
+    Job store, bounded solver pool and result cache behind the HTTP handler.
+    ``workers`` solves run at once; ``submit`` raises :class:`QueueFull` once
+    ``max_queue`` jobs are waiting for a worker. Unfinished jobs found in the
+    store at startup are run again, up to the same limit; the rest are
+    finished as cancelled. ``submit`` and ``cancel`` let an ``OSError`` from
+    the job store through.
+    """
+
+    def __init__(self, store=None, workers=2, max_queue=32):
+        self.store = store or os.path.join(user_output_dir(), "jobs")
+        os.makedirs(self.store, exist_ok=True)
+        self.max_queue = max_queue
+        self.jobs = {}
+        self._cache = {}   # input key -> id of a successful finished job
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="solve-job")
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Store
+    # ------------------------------------------------------------------
+    def _load(self):
+        for name in sorted(os.listdir(self.store)):
+            directory = os.path.join(self.store, name)
+            try:
+                with open(os.path.join(directory, "job.json"), encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            job = Job(directory, meta)
+            try:
+                with open(job.path("events.jsonl"), encoding="utf-8") as f:
+                    job.events = [json.loads(line) for line in f if line.strip()]
+            except (OSError, ValueError):
+                pass
+            self.jobs[job.id] = job
+            if job.state == FINISHED:
+                if (meta.get("report") or {}).get("status") in SUCCESS_STATUSES:
+                    self._cache.setdefault(meta["key"], job.id)
+            elif sum(1 for j in self.jobs.values() if j.state == QUEUED) >= self.max_queue:
+                logging.warning("Not re-queueing job %s: %d jobs are already waiting", job.id, self.max_queue)
+                self._finish_cancelled(job, "not run again after a restart: the queue was full")
+            else:
+                logging.info("Re-queueing unfinished job %s", job.id)
+                job.events.clear()
+                open(job.path("events.jsonl"), "w").close()
+                job.update(state=QUEUED)
+                self._pool.submit(self._run, job)
+        logging.info("Job store %s: %d job(s)", self.store, len(self.jobs))
+
+    @staticmethod
+    def _parse(payload):
+        if not isinstance(payload, dict):
+            raise ValueError("expected a JSON object")
+        for field in INPUT_FILES:
+            if not isinstance(payload.get(field), str) or not payload[field].strip():
+                raise ValueError(f"'{field}' must be the CSV file content as a string")
+        try:
+            start = datetime.date.fromisoformat(str(payload.get("start")))
+        except ValueError:
+            raise ValueError("'start' must be a YYYY-MM-DD date")
+        try:
+            weeks = int(payload.get("weeks", 2))
+        except (TypeError, ValueError):
+            raise ValueError("'weeks' must be a whole number")
+        if weeks < 1:
+            raise ValueError("'weeks' must be at least 1")
+        formats = payload.get("formats", ["csv"])
+        if not isinstance(formats, list) or not formats or not set(formats) <= set(FORMATS):
+            raise ValueError(f"'formats' must be a list of {', '.join(FORMATS)}")
+        return {"start": start.isoformat(), "weeks": weeks, "formats": sorted(set(formats))}
+
+    @staticmethod
+    def _key(payload, spec):
+        h = hashlib.sha256()
+        for field in INPUT_FILES:
+            h.update(payload[field].encode("utf-8"))
+            h.update(b"\0")
+        h.update(json.dumps(spec, sort_keys=True).encode())
+        return h.hexdigest()
+
+    def _create(self, payload, spec, key, **meta):
+        job_id = f"{datetime.datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+        directory = os.path.join(self.store, job_id)
+        os.makedirs(directory)
+        for field, filename in INPUT_FILES.items():
+            with open(os.path.join(directory, filename), "w", encoding="utf-8", newline="") as f:
+                f.write(payload[field])
+        job = Job(directory, {"id": job_id, "state": QUEUED, "created": datetime.datetime.now().isoformat(),
+                              **spec, "key": key, **meta})
+        open(job.path("events.jsonl"), "w").close()
+        job.save()
+        return job
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+    def submit(self, payload):
+        """Create a job from an API payload; returns ``(job, cached)``. Raises ValueError / QueueFull."""
+        spec = self._parse(payload)
+        key = self._key(payload, spec)
+        with self._lock:
+            cached = self.jobs.get(self._cache.get(key))
+            if cached is not None:
+                job = self._create(payload, spec, key, cached_from=cached.id)
+                shutil.copytree(cached.path("output"), job.path("output"), dirs_exist_ok=True)
+                job.events = list(cached.events)
+                report = dict(cached.meta["report"])
+                report["files"] = [job.path("output", os.path.basename(f)) for f in report.get("files", [])]
+                job.update(state=FINISHED, finished=datetime.datetime.now().isoformat(), report=report)
+                self.jobs[job.id] = job
+                return job, True
+            waiting = sum(1 for j in self.jobs.values() if j.state == QUEUED)
+            if waiting >= self.max_queue:
+                raise QueueFull(f"{waiting} jobs are already waiting")
+            job = self._create(payload, spec, key)
+            self.jobs[job.id] = job
+        self._pool.submit(self._run, job)
+        return job, False
+
+    @staticmethod
+    def _finish_cancelled(job, reason=None):
+        report = {"status": "cancelled"}
+        if reason:
+            report["error"] = reason
+        job.update(state=FINISHED, finished=datetime.datetime.now().isoformat(), report=report)
+
+    def _run(self, job):
+        with self._lock:
+            if job.state == FINISHED:   # cancelled while queued
+                return
+            job.update(state=RUNNING, started=datetime.datetime.now().isoformat())
+        try:
+            report = solve_files(job.path(INPUT_FILES["emp"]), job.path(INPUT_FILES["req"]),
+                                 job.path(INPUT_FILES["limits"]), datetime.date.fromisoformat(job.meta["start"]),
+                                 job.meta["weeks"], out_dir=job.path("output"),
+                                 formats=tuple(job.meta.get("formats", ("csv",))),
+                                 progress=job.add_event, cancel_event=job.cancel_event)
+        except Exception as e:
+            logging.error("Job %s failed: %s", job.id, e, exc_info=True)
+            report = {"status": "error", "error": str(e)}
+        job.update(state=FINISHED, finished=datetime.datetime.now().isoformat(), report=report)
+        if report.get("status") in SUCCESS_STATUSES:
+            with self._lock:
+                self._cache.setdefault(job.meta["key"], job.id)
+        logging.info("Job %s finished: %s", job.id, report.get("status"))
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def list(self):
+        with self._lock:
+            return sorted(self.jobs.values(), key=lambda j: j.meta.get("created", ""), reverse=True)
+
+    def counts(self):
+        """Number of jobs per state, counted under the lock (``submit`` may be adding one)."""
+        with self._lock:
+            states = [j.state for j in self.jobs.values()]
+        return {state: states.count(state) for state in (QUEUED, RUNNING, FINISHED)}
+
+    def cancel(self, job_id):
+        """
+        Cancel a job: a queued one is finished at once (so it no longer
+        counts toward ``max_queue``), a running one stops at the solver's
+        next check.
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        with self._lock:
+            if job.state != FINISHED:
+                job.cancel_event.set()
+            if job.state == QUEUED:
+                self._finish_cancelled(job)
+        return job
+
+    def shutdown(self):
+        with self._lock:
+            for job in self.jobs.values():
+                if job.state == RUNNING:
+                    job.cancel_event.set()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    """Routes the API above to ``self.server.service``."""
+
+    server_version = "WorkforceOptimizer/1"
+
+    def log_message(self, fmt, *args):
+        logging.debug("%s %s", self.address_string(), fmt % args)
+
+    def _json(self, status, body):
+        data = json.dumps(body, indent=2, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, status, message):
+        self._json(status, {"error": message})
+
+    def _job(self, job_id):
+        job = self.server.service.get(job_id)
+        if job is None:
+            self._error(404, f"no job '{job_id}'")
+        return job
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        parts = [unquote(p) for p in url.path.split("/") if p]
+        service = self.server.service
+        if parts == ["health"]:
+            counts = service.counts()
+            return self._json(200, {"ok": True, "running": counts[RUNNING], "queued": counts[QUEUED]})
+        if parts == ["jobs"]:
+            return self._json(200, [job.view() for job in service.list()])
+        if len(parts) < 2 or parts[0] != "jobs":
+            return self._error(404, "not found")
+        job = self._job(parts[1])
+        if job is None:
+            return
+        if len(parts) == 2:
+            return self._json(200, job.view())
+        if parts[2:] == ["events"]:
+            try:
+                since = _count(query.get("since", ["0"])[0] or 0, "since")
+            except ValueError as e:
+                return self._error(400, str(e))
+            if query.get("follow", ["0"])[0] in ("1", "true", "yes"):
+                return self._follow(job, since)
+            events, finished = job.wait_events(since, 0)
+            return self._json(200, {"events": events, "next": since + len(events), "finished": finished})
+        if len(parts) == 4 and parts[2] == "files" and re.fullmatch(r"[\w.\- ]+", parts[3]):
+            path = job.path("output", parts[3])
+            content_type = CONTENT_TYPES.get(os.path.splitext(path)[1])
+            if content_type is None or not os.path.isfile(path):
+                return self._error(404, f"no file '{parts[3]}'")
+            with open(path, "rb") as f:
+                data = f.read()
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        self._error(404, "not found")
+
+    def _follow(self, job, since):
+        """Stream events as JSON lines until the job finishes (connection closes at the end)."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            while True:
+                events, finished = job.wait_events(since, FOLLOW_TIMEOUT)
+                for event in events:
+                    self.wfile.write((json.dumps(event, default=str) + "\n").encode("utf-8"))
+                since += len(events)
+                self.wfile.flush()
+                if finished and not events:
+                    break
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.close_connection = True
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip("/") != "/jobs":
+            return self._error(404, "not found")
+        try:
+            length = _count(self.headers.get("Content-Length") or 0, "Content-Length")
+        except ValueError as e:
+            return self._error(400, str(e))
+        if length > MAX_BODY_BYTES:
+            return self._error(413, f"request body over {MAX_BODY_BYTES} bytes")
+        try:
+            payload = json.loads(self.rfile.read(length) or b"null")
+            job, cached = self.server.service.submit(payload)
+        except ValueError as e:
+            return self._error(400, str(e))
+        except QueueFull as e:
+            return self._error(503, f"queue is full: {e}")
+        except OSError as e:
+            logging.error("Could not store job: %s", e)
+            return self._error(500, f"could not store the job: {e}")
+        self._json(200 if cached else 202, job.view())
+
+    def do_DELETE(self):
+        parts = [unquote(p) for p in urlparse(self.path).path.split("/") if p]
+        if len(parts) != 2 or parts[0] != "jobs":
+            return self._error(404, "not found")
+        try:
+            job = self.server.service.cancel(parts[1])
+        except OSError as e:
+            logging.error("Could not update job %s: %s", parts[1], e)
+            return self._error(500, f"could not update the job: {e}")
+        if job is None:
+            return self._error(404, f"no job '{parts[1]}'")
+        self._json(202 if job.state != FINISHED else 200, job.view())
+
+
+def make_server(service, host="127.0.0.1", port=8765):
+    """A ``ThreadingHTTPServer`` for ``service`` (port 0 picks a free port)."""
+    server = ThreadingHTTPServer((host, port), ServiceHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def serve(service, host="127.0.0.1", port=8765):
+    """Run the service until interrupted."""
+    server = make_server(service, host, port)
+    logging.warning("Workforce Optimizer service on http://%s:%d (store %s)",
+                    *server.server_address[:2], service.store)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
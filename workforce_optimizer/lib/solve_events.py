@@ -0,0 +1,50 @@
+# solve_events.py
+from dataclasses import dataclass, field
+
+# Event kinds, in the order a front end sees them for each relaxation rung
+RUNG_STARTED = "rung_started"    # attempt, total, relaxed (list of rule names)
+MODEL_BUILT = "model_built"      # attempt, variables, constraints, warm_start (assignments in the MIP start, or None), seconds
+INCUMBENT = "incumbent"          # objective, bound, gap (new integer solution)
+BOUND = "bound"                  # objective, bound, gap (bound / node log update)
+RUNG_FINISHED = "rung_finished"  # attempt, status, solution, objective, seconds
+RESULT = "result"                # status, attempt, objective, result (prob, x, result_dict)
+ERROR = "error"                  # error (exception); posted by SolveWorker only
+
+# Final ``RESULT`` statuses
+OPTIMAL = "optimal"        # proven optimal in some rung
+FEASIBLE = "feasible"      # stopped early on an incumbent (still a valid schedule)
+INFEASIBLE = "infeasible"  # every rung failed; result_dict has "error"
+CANCELLED = "cancelled"    # cancelled, or stopped early before any incumbent
+
+
+@dataclass(frozen=True)
+class SolveEvent:
+    """
+    One progress event from :func:`lib.solver.solve_schedule`.
+
+    ``attempt`` is the 1-based relaxation rung (0 before the first one),
+    ``elapsed`` the seconds since the solve started and ``data`` the
+    kind-specific fields listed next to the kind constants above.
+    """
+    kind: str
+    attempt: int = 0
+    elapsed: float = 0.0
+    data: dict = field(default_factory=dict)
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def to_dict(self):
+        """JSON-friendly form; the solved model / exception objects are left out."""
+        data = {k: v for k, v in self.data.items() if k not in ("result", "error")}
+        if "error" in self.data:
+            data["error"] = str(self.data["error"])
+        return {"kind": self.kind, "attempt": self.attempt,
+                "elapsed": round(self.elapsed, 3), **data}
+
+    def __str__(self):
+        fields = ", ".join(f"{k}={v}" for k, v in self.to_dict().items() if k != "kind")
+        return f"{self.kind}({fields})"
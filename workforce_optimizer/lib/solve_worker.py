@@ -0,0 +1,97 @@
+# solve_worker.py
+import asyncio
+import logging
+import queue
+import threading
+import time
+
+from .solver import solve_schedule
+from .solve_events import SolveEvent, RESULT, ERROR
+
+
+class SolveWorker:
+    """
+    Runs :func:`solve_schedule` on a daemon thread so the caller stays
+    responsive. Every :class:`~lib.solve_events.SolveEvent` the solver emits is
+    put on ``events``; the last one is always ``result`` (its ``data["result"]``
+    is the ``(prob, x, result_dict)`` tuple) or ``error`` (``data["error"]`` is
+    the exception).
+
+    Front ends either drain ``events`` themselves (Tk polls it with
+    ``root.after``), iterate the worker (``for event in worker``) or use
+    ``async for event in worker``. ``progress``, if given, is also called with
+    each event on the worker thread; a truthy return stops at the current
+    incumbent, as does ``stop()``. ``cancel()`` kills CBC.
+    """
+
+    def __init__(self, args, kwargs=None, progress=None):
+        self.events = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.started_at = None
+        self._args = args
+        self._kwargs = dict(kwargs or {})
+        self._progress = progress
+        self._thread = threading.Thread(target=self._run, name="solve-worker", daemon=True)
+
+    def start(self):
+        self.started_at = time.monotonic()
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Ask the solver to stop; the running CBC process is killed."""
+        self.cancel_event.set()
+
+    def stop(self):
+        """Stop at the current incumbent and return that schedule."""
+        self.stop_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    @property
+    def stopping(self):
+        return self.stop_event.is_set()
+
+    def is_alive(self):
+        return self._thread.is_alive()
+
+    def elapsed(self):
+        return 0.0 if self.started_at is None else time.monotonic() - self.started_at
+
+    def _post(self, event):
+        self.events.put(event)
+        if self._progress is not None:
+            return self._progress(event)
+
+    def _run(self):
+        try:
+            solve_schedule(*self._args, progress=self._post, cancel_event=self.cancel_event,
+                           stop_event=self.stop_event, **self._kwargs)
+        except Exception as e:
+            logging.error(f"Background solve failed: {e}", exc_info=True)
+            self.events.put(SolveEvent(ERROR, elapsed=self.elapsed(), data={"error": e}))
+
+    # ------------------------------------------------------------------
+    # Iteration
+    # ------------------------------------------------------------------
+    def __iter__(self):
+        """Yield events as they arrive, up to and including the final one."""
+        if self.started_at is None:
+            self.start()
+        while True:
+            event = self.events.get()
+            yield event
+            if event.kind in (RESULT, ERROR):
+                return
+
+    async def __aiter__(self):
+        if self.started_at is None:
+            self.start()
+        while True:
+            event = await asyncio.to_thread(self.events.get)
+            yield event
+            if event.kind in (RESULT, ERROR):
+                return
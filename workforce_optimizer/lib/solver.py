@@ -1,9 +1,15 @@
 # solver.py
 import pulp
-from pulp import PULP_CBC_CMD
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+import numpy as np
 from collections import defaultdict
+from .horizon import HorizonCalendar
+from .schedule_result import ScheduleResult
+from .cbc_monitor import MonitoredCBC, SolveCancelled
+from .solve_events import (SolveEvent, RUNG_STARTED, MODEL_BUILT, RUNG_FINISHED, RESULT,
+                           OPTIMAL, FEASIBLE, INFEASIBLE, CANCELLED)
 
 
 def get_capacity_report(employees, work_areas, required, actual_days, shifts, areas, max_shifts):
@@ -50,12 +56,90 @@ def get_capacity_report(employees, work_areas, required, actual_days, shifts, ar
     return "\n".join(lines)
 
 
+class AssignmentIndex:
+    """
+    Flat list of the ``x[e][w][k][s][a]`` binaries with their (employee, day,
+    shift, area) ids, recorded as the variables are created so the solution can
+    be read back in one pass instead of walking the nested dicts.
+    """
+
+    def __init__(self, employees, shifts, areas):
+        self.variables = []
+        self._emp_pos = {e: i for i, e in enumerate(employees)}
+        self._shift_pos = {s: i for i, s in enumerate(shifts)}
+        self._area_pos = {a: i for i, a in enumerate(areas)}
+        self._cols = ([], [], [], [])
+
+    def add(self, var, e, day_index, s, a):
+        self.variables.append(var)
+        self._cols[0].append(self._emp_pos[e])
+        self._cols[1].append(day_index)
+        self._cols[2].append(self._shift_pos[s])
+        self._cols[3].append(self._area_pos[a])
+
+    def primal_values(self):
+        """Solution values of all assignment variables as one float array."""
+        return np.fromiter(
+            (0.0 if v.varValue is None else v.varValue for v in self.variables),
+            dtype=float, count=len(self.variables)
+        )
+
+    def set_initial_values(self, start, calendar, y=None):
+        """
+        MIP start from the ScheduleResult ``start`` (e.g. a reopened schedule):
+        each assignment variable is 1 where ``start`` has the same employee,
+        shift and area on the aligned day (:meth:`HorizonCalendar.aligned_days`)
+        and 0 otherwise; the ``y`` worked-day binaries follow. Names unknown to
+        this model are ignored. Returns the number of assignments carried over.
+        """
+        def remap(names, pos):
+            return np.asarray([pos.get(n, -1) for n in names] + [-1], dtype=np.int64)
+
+        prev_emp = remap(start.employees, self._emp_pos)[start.emp_id]
+        prev_shift = remap(start.shifts, self._shift_pos)[start.shift_id]
+        prev_area = remap(start.areas, self._area_pos)[start.area_id]
+        known = (prev_emp >= 0) & (prev_shift >= 0) & (prev_area >= 0)
+        D, S, A = start.calendar.num_days, len(self._shift_pos), len(self._area_pos)
+
+        def keys(e, d, s, a):
+            return ((e * D + d) * S + s) * A + a
+
+        prev_keys = keys(prev_emp[known], start.day_index[known].astype(np.int64),
+                         prev_shift[known], prev_area[known])
+        e, d, s, a = (np.asarray(c, dtype=np.int64) for c in self._cols)
+        on = np.isin(keys(e, calendar.aligned_days(start.calendar)[d], s, a), prev_keys)
+        for var, value in zip(self.variables, on.tolist()):
+            var.setInitialValue(1 if value else 0)
+        if y is not None:
+            worked = set(zip(e[on].tolist(), d[on].tolist()))
+            for name, weeks in y.items():
+                i = self._emp_pos[name]
+                for w, days in weeks.items():
+                    for k, var in days.items():
+                        var.setInitialValue(1 if (i, w * 7 + k) in worked else 0)
+        return int(on.sum())
+
+    def extract(self, employees, shifts, areas, calendar, threshold=0.5):
+        """
+        Threshold the primal vector and return the chosen assignments as a
+        :class:`ScheduleResult`, ordered by day, employee, shift, area.
+        """
+        chosen = self.primal_values() >= threshold
+        emp_id, day_index, shift_id, area_id = (
+            np.asarray(c, dtype=np.int32)[chosen] for c in self._cols
+        )
+        order = np.lexsort((area_id, shift_id, emp_id, day_index))
+        return ScheduleResult(employees, shifts, areas, calendar,
+                              emp_id[order], day_index[order], shift_id[order], area_id[order])
+
+
 def setup_problem(employees, day_offsets, shifts, areas, shift_prefs, day_prefs, work_areas,
                   min_shifts, max_shifts, max_weekend_days, num_weeks, relax_day, relax_shift, required, actual_days):
     prob = pulp.LpProblem("Restaurant_Schedule", pulp.LpMaximize)
 
     x = {}
     y = {}
+    index = AssignmentIndex(employees, shifts, areas)
     for e in employees:
         valid_areas = work_areas.get(e, [])
         if not valid_areas:
@@ -78,6 +162,7 @@ def setup_problem(employees, day_offsets, shifts, areas, shift_prefs, day_prefs,
                     for a in valid_areas:
                         if required[day_name][a][s] > 0:
                             x[e][w][k][s][a] = pulp.LpVariable(f"assign_{e}_w{w}_{k}_{s}_{a}", cat="Binary")
+                            index.add(x[e][w][k][s][a], e, w*7 + k, s, a)
                         else:
                             x[e][w][k][s][a] = 0  
 
@@ -109,17 +194,19 @@ def setup_problem(employees, day_offsets, shifts, areas, shift_prefs, day_prefs,
         for a in work_areas[e]
     )
     prob += objective
-    return prob, x, y
+    return prob, x, y, index
 
 
 def add_constraints(
     prob, x, y, employees, day_offsets, shifts, areas, required, work_areas, constraints,
     must_off, min_shifts, max_shifts, max_weekend_days, start_date, num_weeks,
     relax_min_shifts=False, relax_max_shifts=False, relax_weekend=False,
-    relax_shift=False, actual_days=None
+    relax_shift=False, actual_days=None, calendar=None
 ):
+    if calendar is None:
+        calendar = HorizonCalendar(start_date, num_weeks)
     if actual_days is None:
-        raise ValueError("actual_days must be provided")
+        actual_days = calendar.actual_days
     # Staffing
     for w in range(num_weeks):
         for k in day_offsets:
@@ -137,17 +224,15 @@ def add_constraints(
                     prob += lhs == req, f"Staff_{w}_{day_name}_{s}_{a}"
 
     # Must-off
+    off_days = calendar.must_off_days(must_off)
     for e in x:
-        for w in range(num_weeks):
-            for k in day_offsets:
-                date = start_date + timedelta(days=w*7 + k)
-                date_str = date.strftime("%Y-%m-%d")
-                off_dates = [datetime.strptime(off, "%m/%d/%Y").strftime("%Y-%m-%d") for _, off in must_off.get(e, [])]
-                if date_str in off_dates:
-                    for s in shifts:
-                        for a in work_areas[e]:
-                            if isinstance(x[e][w][k][s][a], pulp.LpVariable):
-                                prob += x[e][w][k][s][a] == 0
+        for d in sorted(off_days.get(e, ())):
+            w, k = divmod(d, 7)
+            if k in day_offsets:
+                for s in shifts:
+                    for a in work_areas[e]:
+                        if isinstance(x[e][w][k][s][a], pulp.LpVariable):
+                            prob += x[e][w][k][s][a] == 0
 
     # Max shifts per day
     for e in x:
@@ -182,21 +267,7 @@ def add_constraints(
 
     # Weekend constraint
     if not relax_weekend:
-        end_date = start_date + timedelta(days=7*num_weeks - 1)
-        current = start_date - timedelta(days=6)
-        weekends = []
-        while current <= end_date + timedelta(days=2):
-            if current.weekday() == 4:               
-                days = []
-                for d in [current, current + timedelta(days=1), current + timedelta(days=2)]:
-                    if start_date <= d <= end_date:
-                        days_since = (d - start_date).days
-                        w_idx = days_since // 7
-                        k_idx = days_since % 7
-                        days.append((w_idx, k_idx))
-                if days:
-                    weekends.append(days)
-            current += timedelta(days=1)
+        weekends = calendar.weekends()
         for e in x:
             for weekend in weekends:
                 prob += pulp.lpSum(y[e][w][k] for w, k in weekend) <= max_weekend_days[e]
@@ -216,13 +287,41 @@ def add_constraints(
 
 
 def solve_schedule(employees, days, shifts, areas, shift_prefs, day_prefs, must_off, required, work_areas,
-                   constraints, min_shifts, max_shifts, max_weekend_days, start_date, num_weeks=2):
+                   constraints, min_shifts, max_shifts, max_weekend_days, start_date, num_weeks=2,
+                   calendar=None, progress=None, cancel_event=None, stop_event=None, warm_start=None):
+    """
+    Solve with the relaxation ladder from ``constraints["violate_order"]``.
+
+    ``progress(event)``, when given, is called from this thread with a
+    :class:`~lib.solve_events.SolveEvent` for every step: rung started, model
+    built, incumbent, bound, rung finished and, last, the result. Returning a
+    truthy value from it (or setting ``stop_event``) stops at the current
+    incumbent: that schedule is returned and no further rungs are tried.
+    Setting ``cancel_event`` kills CBC; the result dict then has
+    ``"cancelled": True``. ``warm_start`` (a ScheduleResult, e.g. the last
+    period's schedule read back with lib/schedule_import.py) is given to CBC
+    as a MIP start on every rung.
+    """
     logging.debug("solve_schedule start")
+    started = time.perf_counter()
+    if stop_event is None:
+        stop_event = threading.Event()
+    attempt = 0
+
+    def emit(kind, **data):
+        if progress is None:
+            return
+        try:
+            if progress(SolveEvent(kind, attempt, time.perf_counter() - started, data)):
+                stop_event.set()
+        except Exception as e:
+            logging.error(f"Progress callback failed on {kind}: {e}", exc_info=True)
+
     violation_order = constraints["violate_order"]
 
-    day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    start_weekday = start_date.weekday()
-    actual_days = [day_names[(start_weekday + k) % 7] for k in range(7)]
+    if calendar is None:
+        calendar = HorizonCalendar(start_date, num_weeks)
+    actual_days = calendar.actual_days
 
     capacity_report = get_capacity_report(
         employees, work_areas, required, actual_days, shifts, areas, max_shifts
@@ -245,12 +344,19 @@ def solve_schedule(employees, days, shifts, areas, shift_prefs, day_prefs, must_
     configs = list(dict.fromkeys(configs))
 
     day_offsets = range(7)
+    flag_to_rule = {f: r for r, f in rule_to_flag.items()}
 
     for i, config in enumerate(configs):
+        if (cancel_event is not None and cancel_event.is_set()) or stop_event.is_set():
+            break
+        attempt = i + 1
         relax_flags = dict(zip(rule_to_flag.values(), config))
         logging.info("Attempt %d: %s", i + 1, ", ".join(f"{k}={v}" for k, v in relax_flags.items()))
+        emit(RUNG_STARTED, total=len(configs),
+             relaxed=[flag_to_rule[f] for f, on in relax_flags.items() if on])
+        rung_started = time.perf_counter()
 
-        prob, x, y = setup_problem(
+        prob, x, y, index = setup_problem(
             employees, day_offsets, shifts, areas, shift_prefs, day_prefs, work_areas,
             min_shifts, max_shifts, max_weekend_days, num_weeks,
             relax_flags.get('relax_day', False),
@@ -265,30 +371,57 @@ def solve_schedule(employees, days, shifts, areas, shift_prefs, day_prefs, must_
             relax_max_shifts=relax_flags.get('relax_max_shifts', False),
             relax_weekend=relax_flags.get('relax_weekend', False),
             relax_shift=relax_flags.get('relax_shift', False),
-            actual_days=actual_days
+            actual_days=actual_days,
+            calendar=calendar
         )
-        solver = PULP_CBC_CMD(msg=False, timeLimit=300)
-        status = prob.solve(solver)
+        num_vars, num_cons = prob.numVariables(), prob.numConstraints()
+        logging.debug("Attempt %d model: %d variables, %d constraints", i + 1, num_vars, num_cons)
+        carried = None
+        if warm_start is not None:
+            carried = index.set_initial_values(warm_start, calendar, y)
+            logging.debug("Attempt %d MIP start: %d of %d assignments carried over",
+                          i + 1, carried, len(warm_start))
+        emit(MODEL_BUILT, variables=num_vars, constraints=num_cons, warm_start=carried,
+             seconds=time.perf_counter() - rung_started)
+
+        solver = MonitoredCBC(msg=False, timeLimit=300, on_progress=lambda kind, data: emit(kind, **data),
+                              cancel_event=cancel_event, stop_event=stop_event,
+                              warmStart=warm_start is not None)
+        try:
+            status = prob.solve(solver)
+        except SolveCancelled:
+            logging.info("Solve cancelled in attempt %d", i + 1)
+            emit(RUNG_FINISHED, status="Cancelled", solution=None, objective=None,
+                 seconds=time.perf_counter() - rung_started)
+            break
+        objective = pulp.value(prob.objective) if status == 1 else None
+        emit(RUNG_FINISHED, status=pulp.LpStatus[status], solution=pulp.LpSolution[prob.sol_status],
+             objective=objective, seconds=time.perf_counter() - rung_started)
         if status != 1:
             logging.info("No solution in attempt %d", i + 1)
             continue
 
         if prob.status == pulp.LpStatusOptimal:
-            logging.info("Solution found!")
-            result_dict = {f"{a.lower()}_schedule": [] for a in areas}
+            proven = prob.sol_status == pulp.LpSolutionOptimal
+            logging.info("Solution found!" if proven else "Solution found (stopped before proving optimality)")
+            assignments = index.extract(employees, shifts, areas, calendar)
+            result_dict = {f"{a.lower()}_schedule": assignments.legacy_rows(a) for a in areas}
+            result_dict["assignments"] = assignments
             result_dict["violations"] = []
             result_dict["capacity_report"] = capacity_report   
-            for w in range(num_weeks):
-                for k in day_offsets:
-                    for e in x:
-                        for s in shifts:
-                            for a in work_areas[e]:
-                                if pulp.value(x[e][w][k][s][a]) >= 0.5:
-                                    date = start_date + timedelta(days=w*7 + k)
-                                    entry = [e, date.strftime("%Y-%m-%d"), actual_days[k], s, a]
-                                    result_dict[f"{a.lower()}_schedule"].append(entry)
+            result_dict["calendar"] = calendar
+            logging.debug("Assignments: %d total, per area %s", len(assignments),
+                          dict(zip(areas, assignments.counts_by_area().tolist())))
+            emit(RESULT, status=OPTIMAL if proven else FEASIBLE, objective=objective,
+                 result=(prob, x, result_dict))
             return prob, x, result_dict
 
+    if (cancel_event is not None and cancel_event.is_set()) or stop_event.is_set():
+        result_dict = {"error": "Schedule generation was cancelled.", "cancelled": True,
+                       "capacity_report": capacity_report}
+        emit(RESULT, status=CANCELLED, objective=None, result=(None, None, result_dict))
+        return None, None, result_dict
+
     # ----- FAILURE PATH -----
     hints = (
         "\n\nPossible fixes:\n"
@@ -302,4 +435,6 @@ def solve_schedule(employees, days, shifts, areas, shift_prefs, day_prefs, must_
         f"{capacity_report}{hints}"
     )
     logging.error(error_msg)
-    return None, None, {"error": error_msg, "capacity_report": capacity_report}
\ No newline at end of file
+    result_dict = {"error": error_msg, "capacity_report": capacity_report}
+    emit(RESULT, status=INFEASIBLE, objective=None, result=(None, None, result_dict))
+    return None, None, result_dict
\ No newline at end of file
@@ -0,0 +1,164 @@
+# table_model.py
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+class TableModel:
+    """
+    In-memory copy of one input sheet, the source of truth behind its Treeview.
+
+    ``cells`` is a 2-D object array of cell strings (what the Treeview shows,
+    NaN as ""), ``columns`` the column names and ``iids`` the Treeview item id
+    of every row. Column sorts, inserts and deletes reorder or splice the array
+    in one step; the Treeview is refreshed from :meth:`rows` afterwards, and
+    saving / validation read :meth:`to_frame` without touching Tk.
+    """
+
+    def __init__(self, columns, cells, iids):
+        self.columns = [str(c) for c in columns]
+        self.iids = [str(i) for i in iids]
+        self.cells = np.asarray(cells, dtype=object).reshape(len(self.iids), len(self.columns))
+        self._reindex()
+
+    @classmethod
+    def from_frame(cls, df, has_index=False):
+        """
+        Build from a loaded CSV. With ``has_index`` the index becomes the first
+        column (named after the index) and the item ids are the index labels;
+        otherwise rows are ``row_<n>``.
+        """
+        strings = df.astype(object).where(df.notna(), "").astype(str).to_numpy()
+        columns = list(df.columns)
+        if has_index:
+            columns = [df.index.name or "Index"] + columns
+            labels = np.array([str(i) for i in df.index], dtype=object).reshape(-1, 1)
+            strings = np.hstack([labels, strings]) if len(df) else np.empty((0, len(columns)), dtype=object)
+            iids = [str(i) for i in df.index]
+        else:
+            iids = [f"row_{i}" for i in df.index]
+        return cls(columns, strings, iids)
+
+    def _reindex(self):
+        self._row_of = {iid: i for i, iid in enumerate(self.iids)}
+        self._col_of = {col: j for j, col in enumerate(self.columns)}
+
+    def __len__(self):
+        return len(self.iids)
+
+    def rows(self):
+        """Cell strings as one list per row (Treeview ``values``)."""
+        return self.cells.tolist()
+
+    def row(self, iid):
+        return self.cells[self._row_of[iid]].tolist()
+
+    def get(self, iid, column):
+        return self.cells[self._row_of[iid], self._col_of[column]]
+
+    def set(self, iid, column, value):
+        self.cells[self._row_of[iid], self._col_of[column]] = str(value)
+
+    def find_row(self, label):
+        """Item id of the first row whose first cell is ``label`` (stripped), or None."""
+        if not len(self):
+            return None
+        hits = np.flatnonzero(pd.Series(self.cells[:, 0]).str.strip() == label.strip())
+        return self.iids[hits[0]] if len(hits) else None
+
+    def to_frame(self):
+        """All cells as a string DataFrame (first column included, no index)."""
+        return pd.DataFrame(self.cells, columns=self.columns)
+
+    def max_lengths(self):
+        """Longest cell string per column, for sizing the Treeview columns."""
+        if not len(self):
+            return {col: 0 for col in self.columns}
+        lengths = np.vectorize(len, otypes=[np.int64])(self.cells).max(axis=0)
+        return dict(zip(self.columns, lengths.tolist()))
+
+    # ------------------------------------------------------------------
+    # Columns (employees in the Employee Data sheet)
+    # ------------------------------------------------------------------
+    def sort_columns_by_row(self, row_label, ascending=True):
+        """
+        Reorder every column after the first by the cells of the row labelled
+        ``row_label``: numbers, then dates, then text, then blanks ("Must Have
+        Off" sorts by the number of listed days). Returns False if the row is
+        not there.
+        """
+        iid = self.find_row(row_label)
+        if iid is None or len(self.columns) < 2:
+            return False
+        values = self.cells[self._row_of[iid], 1:]
+        keys = [(_sort_key(str(raw).strip(), row_label, ascending), i) for i, raw in enumerate(values)]
+        keys.sort(reverse=not ascending)
+        order = np.array([0] + [i + 1 for _, i in keys])
+        self.cells = self.cells[:, order]
+        self.columns = [self.columns[j] for j in order]
+        self._reindex()
+        return True
+
+    def insert_column(self, name, at, template=None):
+        """Insert column ``name`` at position ``at``, copying ``template``'s cells or blank."""
+        if template is not None and template in self._col_of:
+            new = self.cells[:, self._col_of[template]]
+        else:
+            new = np.full(len(self), "", dtype=object)
+        self.cells = np.insert(self.cells, at, new, axis=1)
+        self.columns.insert(at, str(name))
+        self._reindex()
+
+    def delete_column(self, name):
+        j = self._col_of.get(name)
+        if j is None:
+            return False
+        self.cells = np.delete(self.cells, j, axis=1)
+        del self.columns[j]
+        self._reindex()
+        return True
+
+    # ------------------------------------------------------------------
+    # Rows
+    # ------------------------------------------------------------------
+    def insert_row(self, at, values):
+        """Insert a row (padded / cut to the column count) at ``at``; returns its item id."""
+        n = len(self.iids)
+        while f"row_{n}" in self._row_of:
+            n += 1
+        iid = f"row_{n}"
+        values = (list(values) + [""] * len(self.columns))[:len(self.columns)]
+        self.cells = np.insert(self.cells, at, np.array(values, dtype=object), axis=0)
+        self.iids.insert(at, iid)
+        self._reindex()
+        return iid
+
+    def delete_row(self, iid):
+        i = self._row_of.get(iid)
+        if i is None:
+            return False
+        self.cells = np.delete(self.cells, i, axis=0)
+        del self.iids[i]
+        self._reindex()
+        return True
+
+    def index(self, iid):
+        return self._row_of[iid]
+
+
+def _sort_key(raw_str, row_label, ascending):
+    if not raw_str or raw_str.lower() in {"", "nan", "none"}:
+        return (3, "")
+    if row_label.lower() == "must have off":
+        count = len([d.strip() for d in raw_str.split(",") if d.strip()])
+        return (0, -count if not ascending else count)
+    try:
+        return (0, float(raw_str))
+    except ValueError:
+        pass
+    try:
+        dt = datetime.strptime(raw_str.split(",")[0].strip(), "%m/%d/%Y")
+        return (1, dt if ascending else datetime(9999, 12, 31) - dt)
+    except ValueError:
+        return (2, raw_str.lower())
@@ -0,0 +1,299 @@
+# validation.py
+import logging
+import re
+from dataclasses import dataclass
+
+import pandas as pd
+
+EMPLOYEE_DATA = "Employee Data"
+PERSONNEL_REQUIRED = "Personnel Required"
+HARD_LIMITS = "Hard Limits"
+
+DAYS = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+INT_TEXT = r"[+-]?\d+(?:_\d+)*"   # what int() accepts once stripped, e.g. "3", "+3", "1_000"
+RELAXABLE_RULES = ["Preferred Days", "Preferred Shift", "Max Number of Weekend Days",
+                   "Max Shifts per Week", "Min Shifts per Week"]
+
+# Employee_Data rows (lower-cased label -> required?)
+EMPLOYEE_ROWS = {
+    "work area": True,
+    "preferred shift": True,
+    "preferred days": True,
+    "must have off": False,
+    "min shifts per week": True,
+    "max shifts per week": True,
+    "max number of weekend days": True,
+}
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """
+    One problem found in the input sheets.
+
+    ``row`` / ``column`` are the labels shown in the input tabs (e.g. ``"Work Area"``
+    / an employee name, or an area / a weekday); they are empty for problems that
+    concern a whole sheet. ``rule`` is a stable identifier, ``severity`` is
+    ``"error"`` (load_csv refuses the data) or ``"warning"`` (a default is used).
+    """
+    source: str
+    row: str
+    column: str
+    rule: str
+    value: str
+    message: str
+    severity: str = "error"
+
+    def __str__(self):
+        where = " / ".join(p for p in (self.row, self.column) if p)
+        return f"{self.source}{f' [{where}]' if where else ''}: {self.message}"
+
+
+def _text(value):
+    return "" if pd.isna(value) else str(value)
+
+
+def _as_int(value):
+    """``int(value)`` as data_loader applies it, or ``None`` where that raises."""
+    try:
+        return int(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def _split_list(value, sep):
+    return [] if pd.isna(value) else [p.strip() for p in str(value).split(sep)]
+
+
+def _limits_list(limits_df, column, issues):
+    """Comma-separated Shifts / Work Areas cell from Hard_Limits, or ``None``."""
+    if column not in limits_df.columns:
+        issues.append(ValidationIssue(HARD_LIMITS, "", column, "missing_column", "",
+                                      f"'{column}' column is missing"))
+        return None
+    if limits_df.empty or pd.isna(limits_df[column].iloc[0]) or not str(limits_df[column].iloc[0]).strip():
+        issues.append(ValidationIssue(HARD_LIMITS, "1", column, "empty_value", "",
+                                      f"'{column}' is empty"))
+        return None
+    return [p.strip() for p in str(limits_df[column].iloc[0]).split(",") if p.strip()]
+
+
+def validate_limits(limits_df, issues):
+    """Check Hard_Limits; returns ``(shifts, areas)`` (``None`` where unusable)."""
+    if limits_df.empty:
+        issues.append(ValidationIssue(HARD_LIMITS, "", "", "empty_sheet", "", "Hard_Limits.csv is empty"))
+        return None, None
+    shifts = _limits_list(limits_df, "Shifts", issues)
+    areas = _limits_list(limits_df, "Work Areas", issues)
+
+    # the loader does int() on what read_csv gives: a float is truncated, text int() rejects fails
+    col = "Max Number of Shifts per Day"
+    if col in limits_df.columns and pd.notna(limits_df[col].iloc[0]):
+        raw = limits_df[col].iloc[0]
+        if isinstance(raw, str) and not re.fullmatch(INT_TEXT, raw.strip()):
+            # text from the input tab; the saved file reads back as a number if it is one
+            number = pd.to_numeric(raw.strip(), errors="coerce")
+            raw = raw if pd.isna(number) else number
+        val, value = _text(limits_df[col].iloc[0]).strip(), _as_int(raw)
+        if value is None:
+            issues.append(ValidationIssue(HARD_LIMITS, "1", col, "not_integer", val,
+                                          f"'{col}' must be a whole number, got '{val}'"))
+        elif value != raw:
+            issues.append(ValidationIssue(HARD_LIMITS, "1", col, "truncated", val,
+                                          f"'{col}' {val} is not a whole number, {value} is used",
+                                          "warning"))
+
+    col = "Violate Rules Order"
+    if col in limits_df.columns and pd.notna(limits_df[col].iloc[0]):
+        for rule in _split_list(limits_df[col].iloc[0], ", "):
+            if rule and rule not in RELAXABLE_RULES:
+                issues.append(ValidationIssue(HARD_LIMITS, "1", col, "unknown_rule", rule,
+                                              f"Unknown rule '{rule}' is ignored (valid: {RELAXABLE_RULES})",
+                                              "warning"))
+    return shifts, areas
+
+
+def validate_employees(emp_df, shifts, areas, issues):
+    """Check Employee_Data (read with ``index_col=0``): one vectorised pass per row."""
+    labels = pd.Index(emp_df.index.astype(str).str.strip())
+    lower = labels.str.lower()
+    if lower.isna().any() or (lower == "").any():
+        issues.append(ValidationIssue(EMPLOYEE_DATA, "", "Employee/Input", "missing_row_label", "",
+                                      "Some rows have no label in the first column"))
+
+    employees = [c for c in emp_df.columns if isinstance(c, str) and c.strip()]
+    if not employees:
+        issues.append(ValidationIssue(EMPLOYEE_DATA, "", "", "no_employees", "",
+                                      "No employee columns found"))
+        return
+    for col in employees:
+        if col.startswith("Unnamed:"):
+            issues.append(ValidationIssue(EMPLOYEE_DATA, "Employee/Input", col, "employee_name", "",
+                                          "Employee column has no name", "warning"))
+
+    def row(label):
+        hits = lower == label
+        if not hits.any():
+            if EMPLOYEE_ROWS[label]:
+                issues.append(ValidationIssue(EMPLOYEE_DATA, label.title(), "", "missing_row", "",
+                                              f"Cannot find '{label.title()}' row"))
+            return None, None
+        pos = int(hits.argmax())
+        return labels[pos], emp_df.iloc[pos][employees]
+
+    def add(row_label, values, mask, rule, message, severity="error"):
+        for emp, val in values[mask].items():
+            issues.append(ValidationIssue(EMPLOYEE_DATA, row_label, emp, rule, _text(val),
+                                          message.format(emp=emp, value=_text(val)), severity))
+
+    # Work Area (hard constraint)
+    label, vals = row("work area")
+    if vals is not None and areas is not None:
+        cleaned = vals.astype("string").str.strip()
+        add(label, vals, ~cleaned.isin(areas).fillna(False).astype(bool), "work_area",
+            "Invalid or missing work area for {emp}: '{value}' (valid: %s)" % ", ".join(areas))
+
+    # Preferred Shift (ignored when unknown)
+    label, vals = row("preferred shift")
+    if vals is not None and shifts is not None:
+        cleaned = vals.astype("string").str.strip().str.lower()
+        bad = cleaned.notna() & (cleaned != "") & ~cleaned.isin([s.lower() for s in shifts])
+        add(label, vals, bad.fillna(False).astype(bool), "preferred_shift",
+            "Unknown preferred shift '{value}' for {emp} is ignored", "warning")
+
+    # Preferred Days (unknown tokens ignored)
+    label, vals = row("preferred days")
+    if vals is not None:
+        tokens = vals.astype("string").str.split(", ").explode().str.strip()
+        bad = tokens.notna() & (tokens != "") & ~tokens.isin(DAYS)
+        bad = bad.fillna(False).astype(bool).groupby(level=0, sort=False).any()
+        add(label, vals, bad.reindex(vals.index, fill_value=False), "preferred_days",
+            "Unknown day in '{value}' for {emp} is ignored (use Sun, Mon, ..., Sat)", "warning")
+
+    # Must have off (unparseable dates are skipped)
+    label, vals = row("must have off")
+    if vals is not None:
+        tokens = vals.astype("string").str.split(", ").explode().str.strip()
+        tokens = tokens[tokens.notna() & (tokens != "")]
+        parsed = pd.to_datetime(tokens, format="%m/%d/%Y", errors="coerce")
+        for emp, tok in tokens[parsed.isna()].items():
+            issues.append(ValidationIssue(EMPLOYEE_DATA, label, emp, "must_off_date", tok,
+                                          f"Invalid must-off date '{tok}' for {emp} (use MM/DD/YYYY)",
+                                          "warning"))
+
+    # Integer rows (values int() cannot read, e.g. "3.0", fall back to a default)
+    numeric = {}
+    for key, default in (("min shifts per week", 0), ("max shifts per week", 7),
+                         ("max number of weekend days", 2)):
+        label, vals = row(key)
+        if vals is None:
+            continue
+        nums = pd.to_numeric(vals.map(_as_int), errors="coerce")
+        add(label, vals, nums.isna(), "not_integer",
+            "'{value}' is not a whole number for {emp}, using %d" % default, "warning")
+        add(label, vals, nums < 0, "negative_value", "Negative value '{value}' for {emp} is used as is",
+            "warning")
+        numeric[key] = nums.fillna(default)
+    if "min shifts per week" in numeric and "max shifts per week" in numeric:
+        mn, mx = numeric["min shifts per week"], numeric["max shifts per week"]
+        bad = (mn > mx).fillna(False)
+        for emp in mn.index[bad.to_numpy()]:
+            issues.append(ValidationIssue(EMPLOYEE_DATA, "Min Shifts per Week", emp, "min_gt_max",
+                                          _text(mn[emp]),
+                                          f"Min shifts ({mn[emp]:g}) exceed max shifts ({mx[emp]:g}) for {emp}",
+                                          "warning"))
+
+
+def validate_required(req_df, shifts, areas, issues):
+    """Check Personnel_Required (read with ``index_col=0``)."""
+    index = pd.Index(req_df.index.astype(str).str.strip())
+    if req_df.index.isna().any() or (index == "").any():
+        issues.append(ValidationIssue(PERSONNEL_REQUIRED, "", "Day/Area", "missing_row_label", "",
+                                      "Some rows have no work area in the first column"))
+    missing_days = [d for d in DAYS if d not in req_df.columns]
+    for d in missing_days:
+        issues.append(ValidationIssue(PERSONNEL_REQUIRED, "", d, "missing_column", "",
+                                      f"Missing '{d}' column"))
+    if areas is None:
+        return
+    present = [a for a in areas if a in index]
+    for a in areas:
+        if a not in index:
+            issues.append(ValidationIssue(PERSONNEL_REQUIRED, a, "", "missing_area_row", "",
+                                          f"Missing row for work area '{a}'"))
+    days = [d for d in DAYS if d in req_df.columns]
+    if not present or not days:
+        return
+
+    block = req_df.set_axis(index)
+    block = block.loc[~block.index.duplicated(), days].loc[present]
+    cells = pd.Series(block.to_numpy().ravel(),
+                      index=pd.MultiIndex.from_product([present, days]), dtype="object")
+    cells = cells[cells.notna()].astype(str)
+    if cells.empty:
+        return
+    parts = cells.str.split("/")
+    if shifts is not None:
+        wrong = parts.str.len() != len(shifts)
+        for (area, day), val in cells[wrong].items():
+            issues.append(ValidationIssue(PERSONNEL_REQUIRED, area, day, "shift_count_mismatch", val,
+                                          f"Expected {len(shifts)} shift counts for {area} on {day}, "
+                                          f"got {len(val.split('/'))}"))
+    tokens = parts.explode().str.strip()
+    valid = tokens.str.fullmatch(INT_TEXT).fillna(False).astype(bool)
+    bad = (~valid).groupby(level=[0, 1], sort=False).any()
+    for (area, day), val in cells[bad.reindex(cells.index, fill_value=False)].items():
+        issues.append(ValidationIssue(PERSONNEL_REQUIRED, area, day, "not_integer", val,
+                                      f"'{val}' for {area} on {day} must be whole numbers separated by '/'"))
+    negative = (pd.to_numeric(tokens.where(valid).str.replace("_", ""), errors="coerce") < 0)
+    negative = negative.groupby(level=[0, 1], sort=False).any()
+    for (area, day), val in cells[negative.reindex(cells.index, fill_value=False)].items():
+        issues.append(ValidationIssue(PERSONNEL_REQUIRED, area, day, "negative_value", val,
+                                      f"Negative count in '{val}' for {area} on {day} requires no staff",
+                                      "warning"))
+
+
+def validate_frames(emp_df, req_df, limits_df):
+    """
+    Validate all three input tables in one pass and return every problem found
+    as a list of :class:`ValidationIssue` (empty when the data is loadable).
+
+    ``emp_df`` and ``req_df`` are read with ``index_col=0``, ``limits_df`` without.
+    """
+    issues = []
+    shifts, areas = validate_limits(limits_df, issues)
+    validate_employees(emp_df, shifts, areas, issues)
+    validate_required(req_df, shifts, areas, issues)
+    logging.debug("Input validation: %d errors, %d warnings",
+                  sum(i.severity == "error" for i in issues),
+                  sum(i.severity == "warning" for i in issues))
+    return issues
+
+
+def validate_files(emp_file, req_file, limits_file):
+    """Read the three CSV files and validate them; unreadable files are reported as issues."""
+    frames = {}
+    issues = []
+    for source, path, index_col in ((EMPLOYEE_DATA, emp_file, 0), (PERSONNEL_REQUIRED, req_file, 0),
+                                    (HARD_LIMITS, limits_file, None)):
+        try:
+            frames[source] = pd.read_csv(path, index_col=index_col)
+        except Exception as e:
+            issues.append(ValidationIssue(source, "", "", "unreadable", str(path), f"Cannot read file: {e}"))
+    if issues:
+        return issues
+    return validate_frames(frames[EMPLOYEE_DATA], frames[PERSONNEL_REQUIRED], frames[HARD_LIMITS])
+
+
+def errors_only(issues):
+    return [i for i in issues if i.severity == "error"]
+
+
+def format_issues(issues, limit=None):
+    """Multi-line report, errors first; ``limit`` truncates with a '... and N more' line."""
+    ordered = sorted(issues, key=lambda i: i.severity != "error")
+    shown = ordered if limit is None else ordered[:limit]
+    lines = [f"{'ERROR' if i.severity == 'error' else 'Warning'}: {i}" for i in shown]
+    if len(ordered) > len(shown):
+        lines.append(f"... and {len(ordered) - len(shown)} more")
+    return "\n".join(lines)
@@ -7,7 +7,7 @@ import tkinter as tk
 import webbrowser
 from pathlib import Path
 from tkinter import ttk, messagebox, filedialog
-from lib.utils import show_settings_dialog
+from lib.gui_utils import show_settings_dialog
 
 TRIAL_PASSED = False
 
@@ -143,7 +143,7 @@ if __name__ == "__main__":
     menubar.add_cascade(label="Settings", menu=settings_menu)
     settings_menu.add_command(
         label="Folder Locations…",
-        command=lambda: show_settings_dialog(root)   # from lib.utils
+        command=lambda: show_settings_dialog(root)   # from lib.gui_utils
     )
 
     # ---- Help menu ----------------------------------------------------
@@ -182,7 +182,8 @@ if __name__ == "__main__":
     #  DEFERRED heavy work (logging, sample data, UI build)
     # ------------------------------------------------------------------
     # ---- logging ----------------------------------------------------
-    from lib.utils import user_log_dir
+    from lib.utils import user_log_dir, _load_settings
+    from lib.log_utils import parse_log_level
     from datetime import datetime
     import logging
     from logging.handlers import RotatingFileHandler
@@ -193,7 +194,8 @@ if __name__ == "__main__":
                             f"workforce_optimizer_{datetime.now():%Y-%m-%d_%H-%M-%S}.log")
 
     logger = logging.getLogger()
-    logger.setLevel(logging.DEBUG)
+    # "log_level": "TRACE" in settings.json enables full input-table dumps
+    logger.setLevel(parse_log_level(_load_settings().get("log_level"), logging.DEBUG))
     for h in logger.handlers[:]:
         logger.removeHandler(h)
 
@@ -239,14 +241,15 @@ if __name__ == "__main__":
     def setup_gui():
         global start_date_entry, emp_frame, req_frame, limits_frame, notebook, summary_text, viz_frame
 
-        def generate_and_store_areas():
+        def store_areas(areas):
             global current_areas
+            current_areas = areas
+
+        def generate_and_store_areas():
             try:
                 emp_path = emp_file_var.get()
                 req_path = req_file_var.get()
                 limits_path = limits_file_var.get()
-                start_date = start_date_entry.get_date()
-                num_weeks = num_weeks_var.get()
                 if not all([emp_path, req_path, limits_path]):
                     messagebox.showerror("Error", "Please select all input files.")
                     return
@@ -255,13 +258,9 @@ if __name__ == "__main__":
                     emp_file_var, req_file_var, limits_file_var,
                     start_date_entry, num_weeks_var,
                     summary_text, viz_frame, root, notebook, schedule_container,
-                    emp_frame, req_frame, limits_frame
+                    emp_frame, req_frame, limits_frame,
+                    on_complete=store_areas
                 )
-                from lib.data_loader import load_csv
-                result = load_csv(emp_path, req_path, limits_path, start_date, num_weeks)
-                if result:
-                    _, _, _, areas, *_ = result
-                    current_areas = areas
             except Exception as e:
                 messagebox.showerror("Error", f"Generation failed: {e}")
                 logging.error(f"generate_and_store_areas error: {e}")
@@ -325,6 +324,15 @@ if __name__ == "__main__":
             justify="left"
         )
         hint_label.pack(fill="x", padx=20, pady=(8, 2))
+        validation_label = tk.Label(
+            scrollable_frame,
+            text="",
+            fg="gray",
+            font=("Arial", 9),
+            anchor="w",
+            justify="left"
+        )
+        validation_label.pack(fill="x", padx=20, pady=(0, 2))
         notebook.add(emp_frame, text="Employee Data")
         globals()['emp_frame'] = emp_frame
 
@@ -362,18 +370,31 @@ if __name__ == "__main__":
         sframe.columnconfigure(0, weight=1)
 
         # === BUTTONS ===
-        from lib.gui_handlers import display_input_data, save_input_data, save_schedule_changes
+        from lib.gui_handlers import (display_input_data, save_input_data, save_schedule_changes,
+                                      update_validation_status, show_validation_report)
+
+        def refresh_validation(event=None):
+            update_validation_status(validation_label, emp_frame, req_frame, limits_frame)
+
+        def view_input_data():
+            display_input_data(
+                emp_file_var.get(), req_file_var.get(), limits_file_var.get(),
+                emp_frame, req_frame, limits_frame, root, notebook, summary_text
+            )
+            refresh_validation()
+
+        root.bind_all("<<InputCellEdited>>", refresh_validation)
 
         btn_row1 = tk.Frame(scrollable_frame)
         btn_row1.pack(pady=5)
-        tk.Button(btn_row1, text="View Input Data", command=lambda: display_input_data(
-            emp_file_var.get(), req_file_var.get(), limits_file_var.get(),
-            emp_frame, req_frame, limits_frame, root, notebook, summary_text
-        )).pack(side="left", padx=5)
+        tk.Button(btn_row1, text="View Input Data", command=view_input_data).pack(side="left", padx=5)
         tk.Button(btn_row1, text="Save Input Data", command=lambda: save_input_data(
             emp_file_var, req_file_var, limits_file_var,
             emp_frame, req_frame, limits_frame, root
         )).pack(side="left", padx=5)
+        tk.Button(btn_row1, text="Validate Input Data", command=lambda: show_validation_report(
+            root, emp_frame, req_frame, limits_frame
+        )).pack(side="left", padx=5)
         
         btn_row2 = tk.Frame(scrollable_frame)
         btn_row2.pack(pady=5)
@@ -392,6 +413,15 @@ if __name__ == "__main__":
         viz_frame = tk.Frame(scrollable_frame)
         viz_frame.pack(pady=5, fill="both", expand=True)
 
+        # File > Open Schedule… (needs the schedule and summary widgets above)
+        def open_schedule():
+            from lib.gui_handlers import open_saved_schedule
+            open_saved_schedule(emp_file_var, summary_text, viz_frame, root, notebook, schedule_container,
+                                on_complete=store_areas)
+
+        file_menu.insert_command(0, label="Open Schedule…", command=open_schedule)
+        file_menu.insert_separator(1)
+
     # ------------------------------------------------------------------
     # FINAL SETUP
     # ------------------------------------------------------------------
@@ -524,11 +554,14 @@ if __name__ == "__main__":
     # ------------------------------------------------------------------
     # Final UI wiring (bindings, column widths, etc.)
     # ------------------------------------------------------------------
-    from lib.utils import adjust_column_widths, on_resize, on_mousewheel, user_data_dir
+    from lib.utils import user_data_dir
+    from lib.gui_utils import adjust_column_widths, on_resize, on_mousewheel
     from lib.config import on_closing
 
-    root.bind("<Configure>", lambda e: on_resize(e, root, all_listboxes,
-                                               all_input_trees, notebook, summary_text))
+    import lib.gui_handlers as gui_handlers
+    # gui_handlers rebinds its tree lists on every load / generate, so look them up per event
+    root.bind("<Configure>", lambda e: on_resize(e, root, gui_handlers.all_listboxes,
+                                               gui_handlers.all_input_trees, notebook, summary_text))
     root.bind("<MouseWheel>", lambda e: on_mousewheel(e, canvas))
     root.protocol("WM_DELETE_WINDOW",
                   lambda: on_closing(emp_file_var, req_file_var, limits_file_var, root))
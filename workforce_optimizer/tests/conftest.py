@@ -0,0 +1,31 @@
+# conftest.py
+import datetime as dt
+import os
+import sys
+
+import pytest
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(APP_DIR, "data")
+
+# lib/ is imported as a top-level package, the same as when main.py is run
+sys.path.insert(0, APP_DIR)
+
+
+def data_file(name):
+    return os.path.join(DATA_DIR, name)
+
+
+@pytest.fixture
+def small_result():
+    """Two weeks, three employees, two shifts, two areas, starting on a Sunday."""
+    from lib.horizon import HorizonCalendar
+    from lib.schedule_result import ScheduleResult
+    calendar = HorizonCalendar(dt.date(2025, 11, 9), 2)
+    rows = [  # employee, day index, shift, area
+        (0, 0, 0, 0), (1, 0, 1, 0), (2, 0, 0, 1),
+        (0, 1, 0, 0), (1, 3, 1, 1), (2, 6, 0, 1),
+        (0, 7, 1, 0), (1, 8, 0, 0), (2, 13, 1, 1),
+    ]
+    return ScheduleResult(["Ann Lee", "Bo", "Cy, Jr"], ["Morning", "Evening"], ["Front Kitchen", "Bar"],
+                          calendar, *zip(*rows))
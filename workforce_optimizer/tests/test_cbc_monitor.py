@@ -0,0 +1,58 @@
+# test_cbc_monitor.py
+import pulp
+import pytest
+
+from lib import cbc_monitor
+from lib.cbc_monitor import MonitoredCBC, SolveCancelled
+
+
+def _knapsack():
+    prob = pulp.LpProblem("knapsack", pulp.LpMaximize)
+    x = [pulp.LpVariable(f"x{i}", cat="Binary") for i in range(4)]
+    prob += pulp.lpSum((i + 2) * v for i, v in enumerate(x))
+    prob += pulp.lpSum((i + 1) * v for i, v in enumerate(x)) <= 6
+    return prob
+
+
+@pytest.fixture
+def pulp_version(monkeypatch):
+    def use(version):
+        monkeypatch.setattr(cbc_monitor.pulp, "__version__", version)
+        cbc_monitor._pulp_supported.cache_clear()
+    yield use
+    cbc_monitor._pulp_supported.cache_clear()
+
+
+def test_monitored_solve_reports_progress(pulp_version):
+    pulp_version(cbc_monitor.PULP_VERSION)
+    events = []
+    prob = _knapsack()
+    assert prob.solve(MonitoredCBC(msg=False, on_progress=lambda kind, data: events.append(data))) == 1
+    assert pulp.value(prob.objective) == 9
+    assert events and events[-1]["bound"] is not None
+
+
+def test_other_pulp_version_solves_without_the_monitor(pulp_version, caplog):
+    pulp_version("0.0.0")
+    events = []
+    prob = _knapsack()
+    assert prob.solve(MonitoredCBC(msg=False, on_progress=lambda kind, data: events.append(data))) == 1
+    assert pulp.value(prob.objective) == 9
+    assert events == []
+    assert "follows PuLP " + cbc_monitor.PULP_VERSION in caplog.text
+
+
+def test_cancelled_solver_does_not_start_cbc(pulp_version):
+    pulp_version("0.0.0")
+    solver = MonitoredCBC(msg=False)
+    solver.cancel()
+    with pytest.raises(SolveCancelled):
+        _knapsack().solve(solver)
+
+
+def test_maximisation_log_is_reported_in_the_problems_sense():
+    solver = MonitoredCBC(on_progress=lambda kind, data: None)
+    solver._sense = -1
+    solver._parse_line("Cbc0012I Integer solution of -10 found by heuristic after 0 iterations")
+    solver._parse_line("Cbc0010I After 100 nodes, 3 on tree, -10 best solution, best possible -12")
+    assert (solver.objective, solver.bound) == (10, 12)
@@ -0,0 +1,66 @@
+# test_exporter.py
+import os
+
+import pytest
+
+from lib.exporter import (write_schedule_files, write_area_schedules, schedule_filename, summary_filename,
+                          workbook_filename, rosters_filename, _sheet_names)
+from lib.reports import area_schedule_csv
+
+
+def test_csv_files_are_utf8_and_complete(tmp_path, small_result):
+    report = write_schedule_files(small_result, small_result.areas, str(tmp_path), summary="Ünïcode report\n")
+    assert report.errors == []
+    start = small_result.calendar.start_date
+    expected = {schedule_filename(str(tmp_path), a, start) for a in small_result.areas}
+    expected.add(summary_filename(str(tmp_path), start))
+    assert {path for _, path in report.files} == expected
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(p) for p in expected)   # no temp files left
+    with open(summary_filename(str(tmp_path), start), encoding="utf-8") as f:
+        assert f.read() == "Ünïcode report\n"
+    area = "Front Kitchen"
+    with open(schedule_filename(str(tmp_path), area, start), "rb") as f:
+        assert f.read().decode("utf-8") == area_schedule_csv(small_result, area)
+
+
+def test_area_schedule_csv_layout(small_result):
+    lines = area_schedule_csv(small_result, "Front Kitchen").splitlines()
+    assert lines[0] == '"Front Kitchen Schedule (Nov 09, 2025 - Nov 15, 2025)"'
+    assert lines[1].startswith('Day/Shift,"Sun, Nov 09, 25"')
+    assert lines[2] == '"Morning","Ann Lee","Ann Lee","","","","",""'
+    assert lines[3] == '"Evening","Bo","","","","","",""'
+    assert lines[5] == '"Front Kitchen Schedule (Nov 16, 2025 - Nov 22, 2025)"'
+
+
+def test_failed_file_is_reported_and_others_written(tmp_path, small_result):
+    blocker = tmp_path / "blocked"
+    blocker.mkdir()
+    (blocker / os.path.basename(schedule_filename("", "Bar", small_result.calendar.start_date))).mkdir()
+    report = write_area_schedules(small_result, [
+        ("Bar", schedule_filename(str(blocker), "Bar", small_result.calendar.start_date)),
+        ("Front Kitchen", str(tmp_path / "fk.csv")),
+    ])
+    assert [label for label, _ in report.errors] == ["Bar schedule"]
+    assert report.files == [("Front Kitchen schedule", str(tmp_path / "fk.csv"))]
+
+
+def test_unknown_format_is_rejected(tmp_path, small_result):
+    with pytest.raises(ValueError):
+        write_schedule_files(small_result, small_result.areas, str(tmp_path), formats=("pdf",))
+
+
+def test_workbook_and_rosters(tmp_path, small_result):
+    pytest.importorskip("openpyxl")
+    report = write_schedule_files(small_result, small_result.areas, str(tmp_path), formats=("xlsx", "rosters"))
+    assert report.errors == []
+    start = small_result.calendar.start_date
+    assert os.path.isfile(workbook_filename(str(tmp_path), start))
+    assert os.path.isfile(rosters_filename(str(tmp_path), start))
+
+
+def test_sheet_names_are_excel_safe_and_unique():
+    names = _sheet_names(["Summary", "summary", "A/B", "x" * 40])
+    assert names[0] == "Summary" and names[1] != names[0]
+    assert names[2] == "A_B"
+    assert all(len(n) <= 31 for n in names)
+    assert len({n.lower() for n in names}) == 4
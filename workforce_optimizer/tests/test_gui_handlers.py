@@ -0,0 +1,94 @@
+# test_gui_handlers.py
+import pandas as pd
+import pytest
+
+from lib import gui_handlers
+from lib.gui_handlers import populate_tree, is_populating, sort_employee_columns_by_row, on_tree_double_click
+from lib.table_model import TableModel
+
+
+class FakeTree:
+    """The Treeview calls populate_tree and refresh_tree make, with Tk's error for unknown items."""
+
+    def __init__(self):
+        self.items = {}
+        self.idle = []
+        self.config = {}
+        self.exists = True
+
+    def __getitem__(self, key):
+        return self.config[key]
+
+    def __setitem__(self, key, value):
+        self.config[key] = value
+
+    def insert(self, parent, index, iid, values):
+        assert iid not in self.items
+        self.items[iid] = list(values)
+
+    def item(self, iid, values=None):
+        if iid not in self.items:
+            raise KeyError(f'Item {iid} not found')   # TclError in Tk
+        self.items[iid] = list(values)
+
+    def heading(self, *args, **kwargs):
+        pass
+
+    def column(self, *args, **kwargs):
+        pass
+
+    def after_idle(self, func, *args):
+        self.idle.append((func, args))
+
+    def winfo_exists(self):
+        return self.exists
+
+    def run_idle(self):
+        while self.idle:
+            func, args = self.idle.pop(0)
+            func(*args)
+
+
+@pytest.fixture
+def sheet(monkeypatch):
+    monkeypatch.setattr(gui_handlers.messagebox, "showinfo", lambda *args, **kwargs: None)
+    monkeypatch.setattr(gui_handlers, "apply_column_widths", lambda tree: None)
+    df = pd.DataFrame({"Employee/Input": ["Work Area", "Min Shifts per Week", "Max Shifts per Week"],
+                       "Cy": ["Bar", "3", "4"], "Ann": ["Bar", "1", "2"], "Bo": ["Dish", "2", "3"]})
+    model = TableModel.from_frame(df)
+    tree = FakeTree()
+    tree["columns"] = model.columns
+    gui_handlers._table_models[tree] = model
+    return tree, model
+
+
+def test_sort_during_populate_waits_for_the_last_row(sheet):
+    tree, model = sheet
+    done = []
+    populate_tree(tree, model.iids, model.rows(), chunk_cells=4, on_done=lambda: done.append(len(tree.items)))
+    assert len(tree.items) == 1 and is_populating(tree)
+
+    sort_employee_columns_by_row(tree, "Min Shifts per Week")
+    assert model.columns == ["Employee/Input", "Cy", "Ann", "Bo"]   # not sorted yet
+
+    tree.run_idle()
+    assert done == [3] and not is_populating(tree)
+    assert model.columns == ["Employee/Input", "Ann", "Bo", "Cy"]
+    assert tree.items[model.find_row("Min Shifts per Week")] == ["Min Shifts per Week", "1", "2", "3"]
+
+
+def test_edits_are_ignored_while_populating(sheet):
+    tree, model = sheet
+    populate_tree(tree, model.iids, model.rows(), chunk_cells=4)
+    # returns before looking at the event or the tree
+    assert on_tree_double_click(tree, None, has_index=False) is None
+    tree.run_idle()
+    assert not is_populating(tree)
+
+
+def test_destroyed_tree_stops_populating(sheet):
+    tree, model = sheet
+    populate_tree(tree, model.iids, model.rows(), chunk_cells=4)
+    tree.exists = False
+    tree.run_idle()
+    assert len(tree.items) == 1 and not is_populating(tree)
@@ -0,0 +1,50 @@
+# test_horizon.py
+import datetime as dt
+
+import numpy as np
+
+from lib.horizon import HorizonCalendar
+
+
+def test_day_index_and_names():
+    calendar = HorizonCalendar(dt.date(2025, 11, 9), 2)   # a Sunday
+    assert calendar.num_days == 14
+    assert calendar.actual_days == ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+    assert calendar.index("2025-11-16") == 7
+    assert calendar.index(dt.date(2025, 11, 22)) == 13
+    assert calendar.index(dt.datetime(2025, 11, 10, 8, 30)) == 1
+    assert calendar.index("2025-11-23") is None
+    assert calendar.week_offset("2025-11-18") == (1, 2)
+    assert calendar.week_range_label(1) == "Nov 16, 2025 - Nov 22, 2025"
+    assert calendar.day_headings(0)[0] == "Sun, Nov 09, 25"
+
+
+def test_offsets_start_on_the_start_weekday():
+    calendar = HorizonCalendar(dt.date(2025, 11, 12), 1)   # a Wednesday
+    assert calendar.actual_days[0] == "Wed"
+    assert calendar.day_names == ["Wed", "Thu", "Fri", "Sat", "Sun", "Mon", "Tue"]
+
+
+def test_weekends_partial_and_complete():
+    calendar = HorizonCalendar(dt.date(2025, 11, 9), 1)   # Sun..Sat
+    # the Sunday of the weekend before, and the Friday-Saturday at the end
+    assert calendar.weekends() == [[(0, 0)], [(0, 5), (0, 6)]]
+    assert calendar.weekends(complete_only=True) == []
+    assert HorizonCalendar(dt.date(2025, 11, 9), 2).weekends(complete_only=True) == [[(0, 5), (0, 6), (1, 0)]]
+
+
+def test_must_off():
+    calendar = HorizonCalendar(dt.date(2025, 11, 9), 1)
+    must_off = {"Ann": [("Ann", "11/10/2025"), ("Ann", "12/25/2025"), ("Ann", "bad")], "Bo": []}
+    assert calendar.must_off_days(must_off) == {"Ann": {1}}
+    mask = calendar.must_off_mask(must_off, ["Bo", "Ann"])
+    assert mask.shape == (2, 7) and mask.sum() == 1 and mask[1, 1]
+
+
+def test_aligned_days_lays_a_shorter_horizon_on_by_weekday():
+    previous = HorizonCalendar(dt.date(2025, 11, 2), 1)   # Sunday start
+    current = HorizonCalendar(dt.date(2025, 11, 12), 2)   # Wednesday start
+    aligned = current.aligned_days(previous)
+    assert previous.day_names[aligned[0]] == "Wed"
+    assert [previous.day_names[d] for d in aligned] == current.day_names
+    assert np.array_equal(current.aligned_days(current), np.arange(current.num_days))
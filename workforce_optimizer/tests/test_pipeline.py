@@ -0,0 +1,83 @@
+# test_pipeline.py
+import json
+import os
+
+import pytest
+
+from conftest import data_file
+from lib.cli import main
+from lib.pipeline import solve_files, summarize_files, compare_files
+
+START = "2025-11-09"
+INPUTS = ["--emp", data_file("Employee_Data.csv"), "--req", data_file("Personnel_Required.csv"),
+          "--limits", data_file("Hard_Limits.csv")]
+
+
+def _run(capsys, *argv):
+    code = main(list(argv))
+    return code, json.loads(capsys.readouterr().out)
+
+
+@pytest.fixture(scope="module")
+def solved(tmp_path_factory):
+    import datetime as dt
+    out = tmp_path_factory.mktemp("solve")
+    report = solve_files(data_file("Employee_Data.csv"), data_file("Personnel_Required.csv"),
+                         data_file("Hard_Limits.csv"), dt.date(2025, 11, 9), 2, out_dir=str(out))
+    return out, report
+
+
+def test_solve_writes_schedules_and_summary(solved):
+    out, report = solved
+    assert report["status"] == "optimal"
+    assert report["areas"] == ["Kitchen", "Bar", "Dish"]
+    assert sorted(os.path.basename(f) for f in report["files"]) == sorted(
+        [f"{a}_schedule_{START}.csv" for a in report["areas"]] + [f"Summary_report_{START}.txt"])
+    assert report["assignments"] == sum(report["per_area"].values())
+    with open(os.path.join(out, f"Summary_report_{START}.txt"), encoding="utf-8") as f:
+        text = f.read()
+    assert "Weekend constraint violations:" in text
+    assert text.rstrip().endswith(f"{'Overall Total Shifts':<20} {report['assignments']}")
+
+
+def test_summarize_reads_back_the_same_counts(solved):
+    out, report = solved
+    schedules = [f for f in report["files"] if f.endswith(".csv")]
+    summary = summarize_files(schedules)
+    assert summary["status"] == "loaded" and summary["start"] == START and summary["weeks"] == 2
+    for key in ("assignments", "per_area", "per_shift", "employees_scheduled"):
+        assert summary[key] == report[key]
+
+
+def test_compare_with_itself_has_no_churn(solved, tmp_path):
+    out, report = solved
+    schedules = [f for f in report["files"] if f.endswith(".csv")]
+    changes = tmp_path / "changes.csv"
+    result = compare_files(schedules, schedules, changes_file=str(changes))
+    assert result["status"] == "compared"
+    assert (result["added"], result["removed"], result["churn"]) == (0, 0, 0.0)
+    assert result["unchanged"] == report["assignments"]
+    assert changes.read_text(encoding="utf-8").strip() == "Change,Date,Day,Area,Shift,Employee"
+
+
+def test_cli_solve_summarize_compare(tmp_path, capsys):
+    code, report = _run(capsys, "solve", *INPUTS, "--start", START, "--weeks", "1", "--out", str(tmp_path))
+    assert code == 0 and report["command"] == "solve" and report["status"] == "optimal"
+    schedules = sorted(f for f in report["files"] if f.endswith(".csv"))
+
+    code, summary = _run(capsys, "summarize", *schedules)
+    assert code == 0 and summary["assignments"] == report["assignments"]
+
+    code, diff = _run(capsys, "compare", "--before", *schedules, "--after", *schedules, "--align", "weekday")
+    assert code == 0 and diff["churn"] == 0.0 and diff["alignment"] == "weekday"
+
+
+def test_cli_errors(tmp_path, capsys):
+    code, report = _run(capsys, "summarize", str(tmp_path / "missing.csv"))
+    assert code == 1 and report["status"] == "error"
+    bad = tmp_path / "Employee_Data.csv"
+    bad.write_text("nothing useful\n", encoding="utf-8")
+    code, report = _run(capsys, "solve", "--emp", str(bad), *INPUTS[2:], "--start", START, "--no-write")
+    assert code == 1 and report["status"] == "error" and report["issues"]
+    with pytest.raises(SystemExit):
+        main(["solve", *INPUTS, "--start", "someday"])
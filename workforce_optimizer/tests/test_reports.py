@@ -0,0 +1,50 @@
+# test_reports.py
+from lib.reports import summarize, employee_summary_text, summary_report, assignment_frame, area_frame
+
+
+def test_summarize_counts(small_result):
+    summary = summarize(small_result)
+    assert summary.total == 9
+    assert summary.employee_week.tolist() == [[2, 1], [2, 1], [2, 1]]
+    assert summary.area_shift.tolist() == [[3, 2], [2, 2]]
+    assert summary.per_weekday.tolist() == [4, 2, 0, 1, 0, 0, 2]
+    assert summary.weekdays[0] == "Sun"
+    assert summarize(small_result) is summary   # cached until the next edit
+    small_result.set_cell("Bar", 0, "Morning", [])
+    assert summarize(small_result).total == 8
+
+
+def test_frames(small_result):
+    totals = summarize(small_result).employee_totals_frame()
+    assert list(totals.columns) == ["Employee", "Total Shifts", "Week 1", "Week 2", "Front Kitchen", "Bar"]
+    table = summarize(small_result).area_shift_frame()
+    assert table.loc["Total", "Total"] == 9
+    frame = assignment_frame(small_result)
+    assert len(frame) == 9 and frame["Date"].is_monotonic_increasing
+    assert area_frame(small_result, "Bar").loc[6, "Morning"] == "Cy, Jr"
+
+
+def test_employee_summary_text(small_result):
+    text = employee_summary_text(summarize(small_result), ["Bo", "Nobody"])
+    assert text.splitlines() == [
+        "Employee Shift Summary:",
+        f"{'Employee':<20} {'Total':<8} {'Weeks':<20}",
+        "-" * 48,
+        f"{'Bo':<20} {'3':<8} 2, 1",
+        f"{'Nobody':<20} {'0':<8} 0, 0",
+        "",
+        f"{'Overall Total Shifts':<20} 9",
+    ]
+
+
+def test_summary_report_sections(small_result):
+    summary = summarize(small_result)
+    report = summary_report(summary, None, "Capacity Report:\n- ok", ["Bo violated ..."], "Staffing\n\n")
+    sections = report.split("\n\n")
+    assert sections[0] == "Capacity Report:\n- ok"
+    assert sections[1] == "Weekend constraint violations:\nBo violated ..."
+    assert sections[2] == "Staffing"
+    assert sections[3].startswith("Employee Shift Summary:")
+    assert report.endswith("\n")
+    assert "Weekend constraint violations:\nNone" in summary_report(summary, violations=[])
+    assert summary_report(summary).startswith("Employee Shift Summary:")
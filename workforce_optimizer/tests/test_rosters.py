@@ -0,0 +1,77 @@
+# test_rosters.py
+import datetime as dt
+import re
+import zipfile
+
+from lib.horizon import HorizonCalendar
+from lib.rosters import employee_rosters, write_rosters_zip, _line
+from lib.schedule_result import ScheduleResult
+
+STAMP = dt.datetime(2025, 11, 1, 12, 0, tzinfo=dt.timezone.utc)
+
+
+def _unfold(ics):
+    return ics.replace("\r\n ", "").split("\r\n")
+
+
+def _uids(ics):
+    return [line[4:] for line in _unfold(ics) if line.startswith("UID:")]
+
+
+def test_rosters_per_employee(small_result):
+    rosters = employee_rosters(small_result, STAMP)
+    assert [r[0] for r in rosters] == small_result.employees
+    employee, name, ics, csv_text = rosters[0]
+    assert (employee, name) == ("Ann Lee", "Ann Lee")
+    assert csv_text.splitlines() == [
+        '"Date","Day","Shift","Area"',
+        '"2025-11-09","Sun","Morning","Front Kitchen"',
+        '"2025-11-10","Mon","Morning","Front Kitchen"',
+        '"2025-11-16","Sun","Evening","Front Kitchen"',
+    ]
+    lines = _unfold(ics)
+    assert lines[0] == "BEGIN:VCALENDAR" and lines[-2] == "END:VCALENDAR"
+    assert lines.count("BEGIN:VEVENT") == 3
+    assert "SUMMARY:Morning shift - Front Kitchen" in lines
+    assert "DTSTART;VALUE=DATE:20251109" in lines and "DTEND;VALUE=DATE:20251110" in lines
+    assert "X-WR-CALNAME:Cy\\, Jr schedule" in _unfold(rosters[2][2])
+
+
+def test_uids_are_distinct_for_names_with_the_same_slug():
+    calendar = HorizonCalendar(dt.date(2025, 11, 9), 1)
+    result = ScheduleResult(["Mary Ann", "Mary-Ann"], ["Morning"], ["Bar"], calendar, [0, 1], [0, 0], [0, 0], [0, 0])
+    rosters = employee_rosters(result, STAMP)
+    first, second = (_uids(r[2]) for r in rosters)
+    assert first != second
+    assert len({r[1] for r in rosters}) == 2
+    # the UID depends on the employee's own name, not on who else is in the schedule
+    alone = ScheduleResult(["Mary-Ann"], ["Morning"], ["Bar"], calendar, [0], [0], [0], [0])
+    assert _uids(employee_rosters(alone, STAMP)[0][2]) == second
+
+
+def test_long_lines_are_folded_at_75_octets():
+    calendar = HorizonCalendar(dt.date(2025, 11, 9), 1)
+    area = "Main Dining Room and Terrace — Évènements " * 3
+    result = ScheduleResult(["Zoë Ångström-Øre " * 4], ["Late Evening Service"], [area], calendar,
+                            [0], [2], [0], [0])
+    ics = employee_rosters(result, STAMP)[0][2]
+    assert all(len(line.encode("utf-8")) <= 75 for line in ics.split("\r\n"))
+    assert f"CATEGORIES:{area}" in _unfold(ics)
+    assert re.search(r"\r\n [^\r]", ics)
+
+
+def test_line_folding_keeps_utf8_sequences_whole():
+    text = "SUMMARY:" + "é" * 100
+    folded = _line(text)
+    assert folded.endswith("\r\n")
+    assert folded[:-2].replace("\r\n ", "") == text
+    assert all(len(p.encode("utf-8")) <= 75 for p in folded[:-2].split("\r\n"))
+
+
+def test_zip_layout(tmp_path, small_result):
+    path = tmp_path / "rosters.zip"
+    assert write_rosters_zip(small_result, path) == 3
+    with zipfile.ZipFile(path) as zf:
+        assert sorted(zf.namelist()) == sorted(
+            [f"ics/{n}.ics" for n in ("Ann Lee", "Bo", "Cy_ Jr")]
+            + [f"csv/{n}.csv" for n in ("Ann Lee", "Bo", "Cy_ Jr")])
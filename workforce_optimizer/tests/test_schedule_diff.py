@@ -0,0 +1,75 @@
+# test_schedule_diff.py
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from lib.horizon import HorizonCalendar
+from lib.schedule_diff import compare_schedules
+from lib.schedule_result import ScheduleResult
+
+
+def _row_set(result):
+    return {tuple(r) for r in result.rows()}
+
+
+def test_identical_schedules(small_result):
+    diff = compare_schedules(small_result, small_result.copy())
+    assert diff.alignment == "date"
+    assert (len(diff.added), len(diff.removed), diff.unchanged, diff.churn) == (0, 0, 9, 0.0)
+    assert diff.to_dict()["per_employee"] == {}
+
+
+def test_counts_and_churn_match_set_differences(small_result):
+    after = small_result.copy()
+    after.set_cell("Front Kitchen", 0, "Morning", ["New Hire"])    # Ann Lee -> New Hire
+    after.set_cell("Bar", 13, "Evening", [])                       # Cy, Jr removed
+    after.set_cell("Bar", 3, "Evening", [])                        # Bo moves ...
+    after.set_cell("Bar", 3, "Morning", ["Bo"])                    # ... to another shift
+    diff = compare_schedules(small_result, after)
+    before_rows, after_rows = _row_set(small_result), _row_set(after)
+    assert len(diff.added) == len(after_rows - before_rows) == 2
+    assert len(diff.removed) == len(before_rows - after_rows) == 3
+    assert diff.unchanged == len(after_rows & before_rows) == 6
+    assert diff.churn == pytest.approx(5 / 17)
+    assert diff.reassigned == 1
+    report = diff.to_dict()
+    assert report["per_employee"] == {"Ann Lee": {"Added": 0, "Removed": 1}, "Bo": {"Added": 1, "Removed": 1},
+                                      "Cy, Jr": {"Added": 0, "Removed": 1}, "New Hire": {"Added": 1, "Removed": 0}}
+    assert report["per_area"] == {"Front Kitchen": {"Added": 1, "Removed": 1}, "Bar": {"Added": 1, "Removed": 2}}
+    assert report["per_day"] == {"2025-11-09": {"Added": 1, "Removed": 1}, "2025-11-12": {"Added": 1, "Removed": 1},
+                                 "2025-11-22": {"Added": 0, "Removed": 1}}
+    changes = diff.changes_frame()
+    assert list(changes["Change"]) == ["Removed", "Added", "Added", "Removed", "Removed"]
+    assert list(changes["Date"]) == ["2025-11-09", "2025-11-09", "2025-11-12", "2025-11-12", "2025-11-22"]
+
+
+def test_date_alignment_compares_only_the_overlap(small_result):
+    calendar = HorizonCalendar(dt.date(2025, 11, 16), 1)   # the second week only
+    later = ScheduleResult(small_result.employees, small_result.shifts, small_result.areas, calendar,
+                           [0, 1, 2], [0, 1, 6], [1, 0, 1], [0, 0, 1])
+    diff = compare_schedules(small_result, later)
+    assert diff.alignment == "date" and diff.days.sum() == 7
+    assert diff.before_count == 3 and diff.churn == 0.0
+
+
+def test_weekday_alignment_for_the_previous_period(small_result):
+    one_week = small_result.day_index < 7
+    previous = ScheduleResult(small_result.employees, small_result.shifts, small_result.areas,
+                              HorizonCalendar(dt.date(2025, 11, 2), 1),
+                              small_result.emp_id[one_week], small_result.day_index[one_week],
+                              small_result.shift_id[one_week], small_result.area_id[one_week])
+    diff = compare_schedules(previous, small_result)
+    assert diff.alignment == "weekday"
+    # the previous week is laid onto both weeks: week 1 matches, week 2 differs
+    assert diff.before_count == 12 and diff.after_count == 9
+    assert not np.any(diff.added[:, 1] < 7) and not np.any(diff.removed[:, 1] < 7)
+    with pytest.raises(ValueError):
+        compare_schedules(previous, small_result, "month")
+
+
+def test_names_only_in_before_are_kept(small_result):
+    before = ScheduleResult(["Old Timer"], ["Night"], ["Loft"], small_result.calendar, [0], [0], [0], [0])
+    diff = compare_schedules(before, small_result)
+    assert diff.employees[-1] == "Old Timer" and diff.shifts[-1] == "Night" and diff.areas[-1] == "Loft"
+    assert len(diff.removed) == 1 and len(diff.added) == 9 and diff.churn == 1.0
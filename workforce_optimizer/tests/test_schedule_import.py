@@ -0,0 +1,67 @@
+# test_schedule_import.py
+import datetime as dt
+
+import pytest
+
+from lib.exporter import write_schedule_files, schedule_filename, workbook_filename
+from lib.reports import area_schedule_csv, assignment_frame
+from lib.schedule_import import load_schedule, ScheduleFormatError
+
+
+def _rows(result):
+    return sorted(map(tuple, result.rows()))
+
+
+def test_area_csv_round_trip(tmp_path, small_result):
+    report = write_schedule_files(small_result, small_result.areas, str(tmp_path))
+    loaded = load_schedule([path for _, path in report.files], small_result.employees,
+                           small_result.shifts, small_result.areas)
+    assert loaded.calendar.start_date == small_result.calendar.start_date
+    assert loaded.num_weeks == small_result.num_weeks
+    assert _rows(loaded) == _rows(small_result)
+
+
+def test_round_trip_keeps_edits(tmp_path, small_result):
+    small_result.set_cell("Bar", 9, "Evening", ["Zoë New", "Bo"])
+    path = schedule_filename(str(tmp_path), "Bar", small_result.calendar.start_date)
+    write_schedule_files(small_result, ["Bar"], str(tmp_path))
+    loaded = load_schedule(path)
+    assert sorted(loaded.cell_names("Bar", 9, "Evening")) == ["Bo", "Zoë New"]
+
+
+def test_names_with_commas_need_the_employee_list(tmp_path, small_result):
+    report = write_schedule_files(small_result, ["Bar"], str(tmp_path))
+    path = report.files[0][1]
+    assert "Cy, Jr" in load_schedule(path, ["Cy, Jr"]).employees
+    assert "Cy, Jr" not in load_schedule(path).employees
+
+
+def test_workbook_round_trip(tmp_path, small_result):
+    pytest.importorskip("openpyxl")
+    write_schedule_files(small_result, small_result.areas, str(tmp_path), formats=("xlsx",))
+    loaded = load_schedule(workbook_filename(str(tmp_path), small_result.calendar.start_date),
+                           small_result.employees, small_result.shifts, small_result.areas)
+    assert loaded.calendar.start_date == small_result.calendar.start_date
+    assert _rows(loaded) == _rows(small_result)
+
+
+def test_long_csv_with_start_date(tmp_path, small_result):
+    path = tmp_path / "assignments.csv"
+    assignment_frame(small_result).to_csv(path, index=False)
+    loaded = load_schedule(path, start_date=dt.date(2025, 11, 9))
+    assert _rows(loaded) == _rows(small_result)
+
+
+def test_platform_encoded_csv_is_read(tmp_path, small_result):
+    small_result.set_cell("Bar", 0, "Morning", ["Renée"])
+    path = tmp_path / "Bar_schedule.csv"
+    path.write_bytes(area_schedule_csv(small_result, "Bar").encode("cp1252"))
+    loaded = load_schedule(path)
+    assert "Ren" in loaded.cell_names("Bar", 0, "Morning")[0]
+
+
+def test_not_a_schedule(tmp_path):
+    path = tmp_path / "other.csv"
+    path.write_text("a,b\n1,2\n", encoding="utf-8")
+    with pytest.raises(ScheduleFormatError):
+        load_schedule(path)
@@ -0,0 +1,72 @@
+# test_schedule_result.py
+import datetime as dt
+
+import numpy as np
+
+from lib.horizon import HorizonCalendar
+from lib.schedule_result import ScheduleResult, to_schedule_result
+
+
+def test_from_rows_drops_unknown_names_and_dates():
+    calendar = HorizonCalendar(dt.date(2025, 11, 9), 1)
+    rows = [["Ann", "2025-11-09", "Sun", "Morning", "Bar"],
+            ["Ann", "2025-11-30", "Sun", "Morning", "Bar"],
+            ["Zed", "2025-11-10", "Mon", "Morning", "Bar"],
+            ["Bo", "2025-11-10", "Mon", "Night", "Bar"]]
+    result = ScheduleResult.from_rows(rows, ["Ann", "Bo"], ["Morning"], ["Bar"], calendar)
+    assert len(result) == 1
+    assert result.rows() == [["Ann", "2025-11-09", "Sun", "Morning", "Bar"]]
+
+
+def test_legacy_dict_is_converted():
+    calendar = HorizonCalendar(dt.date(2025, 11, 9), 1)
+    rows = [["Ann", "2025-11-09", "Sun", "Morning", "Bar"]]
+    result = to_schedule_result({"bar_schedule": rows}, ["Ann"], ["Morning"], ["Bar"], calendar)
+    assert result.rows("Bar") == rows
+    assert to_schedule_result({"assignments": result}, [], [], []) is result
+
+
+def test_cell_table_and_week_table(small_result):
+    cells = small_result.cell_table()
+    assert cells.shape == (2, 14, 2)
+    assert cells[0, 0, 0] == "Ann Lee" and cells[0, 0, 1] == "Bo"
+    assert small_result.week_table("Bar", 0)[0] == ["Morning", "Cy, Jr", "", "", "", "", "", "Cy, Jr"]
+    assert small_result.week_table("Nowhere", 0)[0] == ["Morning"] + [""] * 7
+
+
+def test_aggregates(small_result):
+    assert small_result.counts_by_employee_week().tolist() == [[2, 1], [2, 1], [2, 1]]
+    assert small_result.counts_by_area().tolist() == [5, 4]
+    assert small_result.counts_by_employee_area().tolist() == [[3, 0], [2, 1], [0, 3]]
+    worked = small_result.worked_days()
+    assert worked.shape == (3, 14) and worked.sum() == 9
+
+
+def test_set_cell_replaces_names_and_appends_new_employees(small_result):
+    cached = small_result.cell_table()
+    snapshot = small_result.copy()
+    small_result.set_cell("Front Kitchen", 0, "Morning", ["Bo", "New Hire"])
+    assert small_result.cell_names("Front Kitchen", 0, "Morning") == ["Bo", "New Hire"]
+    assert small_result.employees[-1] == "New Hire"
+    assert small_result.cell_table() is not cached
+    assert small_result.cell_table()[0, 0, 0] == "Bo, New Hire"
+    # the snapshot taken before the edit is unchanged
+    assert snapshot.cell_names("Front Kitchen", 0, "Morning") == ["Ann Lee"]
+    legacy = small_result.legacy_rows("Front Kitchen")
+    assert len(legacy) == len(small_result.indices("Front Kitchen")) == 6
+    assert np.array_equal(np.sort(small_result.indices()), np.arange(len(small_result)))
+
+
+def test_edits_are_tracked_per_area_until_saved(small_result):
+    assert small_result.unsaved_areas() == []
+    small_result.set_cell("Bar", 8, "Evening", ["Bo"])
+    saved_version = small_result.version
+    small_result.set_cell("Front Kitchen", 1, "Morning", [])
+    assert small_result.unsaved_areas() == ["Front Kitchen", "Bar"]
+    small_result.mark_saved("Bar", saved_version)
+    assert small_result.unsaved_areas() == ["Front Kitchen"]
+    # an edit made while a save was running stays unsaved
+    small_result.set_cell("Bar", 2, "Morning", ["Ann Lee"])
+    small_result.mark_saved("Bar", saved_version)
+    assert small_result.unsaved_areas() == ["Front Kitchen", "Bar"]
+    assert small_result.copy().unsaved_areas() == []
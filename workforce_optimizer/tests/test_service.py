@@ -0,0 +1,161 @@
+# test_service.py
+import http.client
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from conftest import data_file
+from lib.service import JobService, make_server, FINISHED, QUEUED, RUNNING
+
+
+def _payload(rename=("Kitchen", "Front Kitchen"), **extra):
+    payload = {"start": "2025-11-09", "weeks": 1}
+    for field, name in (("emp", "Employee_Data.csv"), ("req", "Personnel_Required.csv"),
+                        ("limits", "Hard_Limits.csv")):
+        with open(data_file(name), encoding="utf-8") as f:
+            payload[field] = f.read().replace(*rename)
+    payload.update(extra)
+    return payload
+
+
+@pytest.fixture
+def server(tmp_path):
+    service = JobService(str(tmp_path / "jobs"), workers=1, max_queue=4)
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    service.shutdown()
+
+
+def _request(server, method, path, body=None):
+    url = "http://%s:%d%s" % (*server.server_address[:2], path)
+    data = None if body is None else json.dumps(body).encode("utf-8")
+    request = urllib.request.Request(url, data=data, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def _wait_finished(server, job_id, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status, body = _request(server, "GET", f"/jobs/{job_id}")
+        view = json.loads(body)
+        if view["state"] == FINISHED:
+            return view
+        time.sleep(0.1)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_health_and_unknown_routes(server):
+    status, body = _request(server, "GET", "/health")
+    assert status == 200 and json.loads(body)["ok"] is True
+    assert _request(server, "GET", "/nope")[0] == 404
+    assert _request(server, "GET", "/jobs/missing")[0] == 404
+    assert _request(server, "POST", "/jobs", {"emp": ""})[0] == 400
+
+
+def _post_with_length(server, length):
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=60)
+    try:
+        connection.putrequest("POST", "/jobs")
+        connection.putheader("Content-Length", length)
+        connection.endheaders()
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("length", ["abc", "-5", "1.5"])
+def test_bad_content_length_is_rejected(server, length):
+    status, body = _post_with_length(server, length)
+    assert status == 400 and "Content-Length" in body["error"]
+
+
+@pytest.mark.parametrize("since", ["abc", "-1", "2.0"])
+def test_bad_since_is_rejected(server, since):
+    status, body = _request(server, "POST", "/jobs", _payload())
+    job_id = json.loads(body)["id"]
+    status, body = _request(server, "GET", f"/jobs/{job_id}/events?since={since}")
+    assert status == 400 and "since" in json.loads(body)["error"]
+    assert _request(server, "GET", f"/jobs/{job_id}/events?since=0")[0] == 200
+
+
+def test_job_downloads_with_encoded_names(server):
+    status, body = _request(server, "POST", "/jobs", _payload())
+    assert status == 202
+    view = _wait_finished(server, json.loads(body)["id"])
+    assert view["report"]["status"] == "optimal"
+    downloads = view["downloads"]
+    assert any("Front%20Kitchen_schedule_2025-11-09.csv" in url for url in downloads)
+    for url in downloads:
+        status, data = _request(server, "GET", url)
+        assert status == 200 and data
+    status, data = _request(server, "GET", f"/jobs/{view['id']}/files/..%2Fjob.json")
+    assert status == 404
+
+    # the same inputs again are answered from the cache
+    status, body = _request(server, "POST", "/jobs", _payload())
+    assert status == 200 and json.loads(body)["cached_from"] == view["id"]
+
+    status, body = _request(server, "GET", f"/jobs/{view['id']}/events")
+    events = json.loads(body)
+    assert events["finished"] and events["next"] == len(events["events"]) > 0
+
+
+def test_cancelled_queued_job_leaves_the_queue(tmp_path):
+    service = JobService(str(tmp_path / "jobs"), workers=1, max_queue=1)
+    block = threading.Event()
+    service._pool.submit(block.wait)   # keep the only worker busy
+    try:
+        job, cached = service.submit(_payload())
+        assert not cached and job.state == QUEUED
+        assert service.counts() == {QUEUED: 1, RUNNING: 0, FINISHED: 0}
+        service.cancel(job.id)
+        assert job.state == FINISHED and job.meta["report"]["status"] == "cancelled"
+        assert service.counts() == {QUEUED: 0, RUNNING: 0, FINISHED: 1}
+        # the cancelled job no longer counts toward max_queue
+        second, _ = service.submit(_payload(weeks=2))
+        assert second.state == QUEUED
+    finally:
+        block.set()
+        service.shutdown()
+
+
+def test_restart_requeues_up_to_max_queue(tmp_path):
+    store = str(tmp_path / "jobs")
+    service = JobService(store, workers=1, max_queue=3)
+    block = threading.Event()
+    service._pool.submit(block.wait)
+    jobs = [service.submit(_payload(weeks=n))[0] for n in (1, 2, 3)]
+    service._pool.shutdown(wait=False, cancel_futures=True)
+    block.set()
+    assert [j.state for j in jobs] == [QUEUED] * 3
+
+    restarted = JobService(store, workers=1, max_queue=2)
+    try:
+        states = [restarted.get(j.id) for j in jobs]
+        not_run = [j for j in states if j.state == FINISHED and j.meta["report"]["status"] == "cancelled"]
+        assert len(not_run) == 1
+    finally:
+        restarted.shutdown()
+
+
+def test_store_errors_are_reported_as_500(server, monkeypatch):
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(server.service, "_create", fail)
+    status, body = _request(server, "POST", "/jobs", _payload(weeks=3))
+    assert status == 500 and "disk full" in json.loads(body)["error"]
+    assert os.listdir(server.service.store) == []
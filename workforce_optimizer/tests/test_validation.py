@@ -0,0 +1,118 @@
+# test_validation.py
+import datetime as dt
+
+import pandas as pd
+import pytest
+
+from conftest import data_file
+from lib.data_loader import load_inputs
+from lib.validation import validate_frames, validate_files, errors_only, format_issues
+
+
+def _frames():
+    return (pd.read_csv(data_file("Employee_Data.csv"), index_col=0),
+            pd.read_csv(data_file("Personnel_Required.csv"), index_col=0),
+            pd.read_csv(data_file("Hard_Limits.csv")))
+
+
+def _rules(issues, severity=None):
+    return {(i.rule, i.row, i.column) for i in issues if severity is None or i.severity == severity}
+
+
+def _saved(tmp_path, emp, req, limits):
+    """Write the frames as the three input CSVs; returns their paths."""
+    paths = [tmp_path / n for n in ("Employee_Data.csv", "Personnel_Required.csv", "Hard_Limits.csv")]
+    emp.to_csv(paths[0])
+    req.to_csv(paths[1])
+    limits.to_csv(paths[2], index=False)
+    return paths
+
+
+def test_sample_inputs_have_no_errors():
+    assert errors_only(validate_frames(*_frames())) == []
+
+
+@pytest.mark.parametrize("count", ["+1", " 1 ", "1_0", "01"])
+def test_required_counts_accept_what_int_accepts(count):
+    emp, req, limits = _frames()
+    req.loc["Bar", "Mon"] = f"{count}/0/1"
+    assert not any(i.rule == "not_integer" for i in validate_frames(emp, req, limits))
+
+
+def test_required_count_errors_and_warnings():
+    emp, req, limits = _frames()
+    req.loc["Bar", "Mon"] = "1/x/1"
+    req.loc["Bar", "Tue"] = "1/1"
+    req.loc["Dish", "Wed"] = "0/-1/1"
+    req.loc["Dish", "Thu"] = "0/-0/1"
+    issues = validate_frames(emp, req, limits)
+    assert _rules(issues, "error") == {("not_integer", "Bar", "Mon"), ("shift_count_mismatch", "Bar", "Tue")}
+    assert _rules(issues, "warning") == {("negative_value", "Dish", "Wed")}
+
+
+def test_employee_rule_codes():
+    emp, req, limits = _frames()
+    first, second = emp.columns[:2]
+    emp.loc["Work Area", first] = "Garden"
+    emp.loc["Preferred Shift", first] = "Night"
+    emp.loc["Preferred Days", first] = "Sun, Funday"
+    emp.loc["Must have off", first] = "13/45/2025"
+    emp.loc["Min Shifts per Week", first] = "lots"
+    emp.loc["Max Shifts per Week", second] = "-1"
+    issues = validate_frames(emp, req, limits)
+    assert _rules(issues, "error") == {("work_area", "Work Area", first)}
+    assert {("preferred_shift", "Preferred Shift", first), ("preferred_days", "Preferred Days", first),
+            ("must_off_date", "Must have off", first), ("not_integer", "Min Shifts per Week", first),
+            ("negative_value", "Max Shifts per Week", second)} <= _rules(issues, "warning")
+
+
+def test_missing_rows_and_columns():
+    emp, req, limits = _frames()
+    issues = validate_frames(emp.drop(index="Preferred Shift"), req.drop(columns="Sat").drop(index="Dish"),
+                             limits.drop(columns="Shifts"))
+    assert {("missing_row", "Preferred Shift", ""), ("missing_column", "", "Sat"),
+            ("missing_area_row", "Dish", ""), ("missing_column", "", "Shifts")} <= _rules(issues, "error")
+
+
+def test_unknown_rule_is_a_warning():
+    emp, req, limits = _frames()
+    limits.loc[0, "Violate Rules Order"] = "Preferred Days, Sleep In"
+    issues = validate_frames(emp, req, limits)
+    assert _rules(issues) == {("unknown_rule", "1", "Violate Rules Order")}
+    assert format_issues(issues).startswith("Warning: Hard Limits [1 / Violate Rules Order]")
+
+
+def test_unreadable_file(tmp_path):
+    issues = validate_files(tmp_path / "missing.csv", data_file("Personnel_Required.csv"),
+                            data_file("Hard_Limits.csv"))
+    assert [i.rule for i in issues] == ["unreadable"]
+
+
+@pytest.mark.parametrize("value", [2.5, "2.5"])
+def test_fractional_max_shifts_per_day_is_truncated_like_the_loader(tmp_path, value):
+    emp, req, limits = _frames()
+    limits["Max Number of Shifts per Day"] = value   # "2.5" as shown in the input tab
+    issues = validate_frames(emp, req, limits)
+    assert _rules(issues) == {("truncated", "1", "Max Number of Shifts per Day")}
+    paths = _saved(tmp_path, emp, req, limits)
+    assert errors_only(validate_files(*paths)) == []
+    constraints = load_inputs(*paths, dt.date(2025, 11, 9), 1)[9]
+    assert constraints["max_shifts_per_day"] == 2
+
+
+def test_max_shifts_per_day_text_is_an_error():
+    emp, req, limits = _frames()
+    limits["Max Number of Shifts per Day"] = "two"
+    assert _rules(validate_frames(emp, req, limits), "error") == {
+        ("not_integer", "1", "Max Number of Shifts per Day")}
+
+
+@pytest.mark.parametrize("value, used", [("3.0", 0), ("2.5", 0), ("three", 0), (" 3 ", 3), ("+3", 3)])
+def test_integer_rows_warn_where_the_loader_uses_the_default(tmp_path, value, used):
+    emp, req, limits = _frames()
+    first = emp.columns[0]
+    emp.loc["Min Shifts per Week", first] = value
+    flagged = ("not_integer", "Min Shifts per Week", first) in _rules(validate_frames(emp, req, limits), "warning")
+    min_shifts = load_inputs(*_saved(tmp_path, emp, req, limits), dt.date(2025, 11, 9), 1)[10]
+    assert min_shifts[first] == used
+    assert flagged == (used == 0)